@@ -0,0 +1,216 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 9:31:48 AM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... cache.py
+Description: ....... Persistent on-disk HTTP response cache used by lib.general.request_get, with per URL class lifetimes, ETag/Last-Modified revalidation and LRU eviction by size.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage
+Examples: .......... _
+ (1) from lib.cache import RESPONSE_CACHE, cache_ttl
+     ttl = cache_ttl('https://rumble.com/browse')
+     entry = RESPONSE_CACHE.lookup('https://rumble.com/browse')
+     if entry and entry.is_fresh(ttl):
+        html = entry.body
+Notes: ............. _
+ (1) Only GET requests are cached; POSTs to service.php and the embedJS video API never are.
+ (2) Entries past their lifetime are kept so they can be revalidated with If-None-Match /
+     If-Modified-Since, or served when the network is down or the server answers with an error.
+ (3) Pages that depend on the logged in account (PRIVATE_PATTERN) are stored per user, see
+     cache_key, so another account or a logged out session never gets them.
+===========================================================================================
+"""
+
+import re
+import time
+
+from typing import NamedTuple, Optional
+
+from lib.storage import Database
+
+# Upper bound for stored response bodies before least recently used entries are dropped
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Lifetimes in seconds by URL class, first match wins. Unmatched URLs are not cached.
+CACHE_RULES = (
+    (re.compile(r'/service\.php|/embedJS/'), 0),
+    (re.compile(r'/subscriptions'), 5 * 60),
+    (re.compile(r'/playlists/'), 2 * 60),
+    (re.compile(r'/followed-channels'), 15 * 60),
+    (re.compile(r'/browse/?(?:\?|$)'), 6 * 60 * 60),
+    (re.compile(r'/browse/live'), 2 * 60),
+    (re.compile(r'/browse/'), 30 * 60),
+    (re.compile(r'/battle-leaderboard'), 60 * 60),
+    (re.compile(r'/search/'), 10 * 60),
+    (re.compile(r'/(?:c|user)/'), 10 * 60),
+    (re.compile(r'/v[0-9a-z]+-[^/?]*\.html'), 24 * 60 * 60),
+)
+
+# Pages whose content depends on the logged in account
+PRIVATE_PATTERN = re.compile(r'/subscriptions|/playlists/|/followed-channels')
+
+
+def cache_ttl(url: str) -> int:
+    """
+    Get the cache lifetime for a URL based on CACHE_RULES.
+
+    Args:
+        url (str): The URL being requested.
+
+    Returns:
+        int: The lifetime in seconds, 0 when the URL should not be cached.
+
+    Examples:
+        >>> cache_ttl('https://rumble.com/browse')
+        21600
+        >>> cache_ttl('https://rumble.com/subscriptions?page=2')
+        300
+    """
+    for pattern, ttl in CACHE_RULES:
+        if pattern.search(url):
+            return ttl
+    return 0
+
+
+def cache_key(url: str, user: str) -> str:
+    """
+    Get the key a response is cached under.
+
+    Args:
+        url (str): The URL being requested.
+        user (str): The logged in user name, '' when logged out.
+
+    Returns:
+        str: The URL itself, with the user appended for pages matching PRIVATE_PATTERN.
+
+    Examples:
+        >>> cache_key('https://rumble.com/browse', 'bob')
+        'https://rumble.com/browse'
+        >>> cache_key('https://rumble.com/subscriptions', 'bob')
+        'https://rumble.com/subscriptions#user=bob'
+    """
+    if PRIVATE_PATTERN.search(url):
+        return url + '#user=' + user
+    return url
+
+
+class CachedResponse(NamedTuple):
+
+    """ a stored response body with its validators """
+
+    url: str
+    body: str
+    etag: str
+    last_modified: str
+    fetched: float
+
+    def is_fresh( self, ttl: int ) -> bool:
+
+        """ if the entry is younger than the given lifetime """
+
+        return ttl > 0 and time.time() - self.fetched < ttl
+
+    def validators( self ) -> dict:
+
+        """ conditional request headers to revalidate the entry """
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(Database):
+
+    """ persistent response cache keyed by URL """
+
+    filename = 'cache.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS responses ('
+        ' url TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, last_modified TEXT,'
+        ' fetched REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)',
+    )
+
+    def __init__( self, path=None, max_bytes=CACHE_MAX_BYTES ):
+
+        """ Construct with an optional path and size budget """
+
+        super().__init__( path )
+        self.max_bytes = max_bytes
+
+    def lookup( self, url: str ) -> Optional[CachedResponse]:
+
+        """ gets the stored entry for a URL and marks it as recently used """
+
+        rows = self.execute(
+            'SELECT url, body, etag, last_modified, fetched FROM responses WHERE url = ?',
+            ( url, )
+        )
+        if not rows:
+            return None
+        self.execute( 'UPDATE responses SET accessed = ? WHERE url = ?', ( time.time(), url ) )
+        row = rows[0]
+        return CachedResponse( row['url'], row['body'], row['etag'] or '', row['last_modified'] or '', row['fetched'] )
+
+    def store( self, url: str, body: str, etag: str = '', last_modified: str = '' ) -> None:
+
+        """ saves a response body and evicts old entries when over budget """
+
+        now = time.time()
+        self.execute(
+            'INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched, accessed, size)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+            ( url, body, etag, last_modified, now, now, len( body.encode( 'utf-8' ) ) )
+        )
+        self.evict()
+
+    def touch( self, url: str ) -> None:
+
+        """ restarts the lifetime of an entry after a 304 Not Modified """
+
+        now = time.time()
+        self.execute( 'UPDATE responses SET fetched = ?, accessed = ? WHERE url = ?', ( now, now, url ) )
+
+    def invalidate( self, url: str ) -> None:
+
+        """ drops the entry for a URL """
+
+        self.execute( 'DELETE FROM responses WHERE url = ?', ( url, ) )
+
+    def evict( self ) -> None:
+
+        """ drops least recently used entries until the cache is back under budget """
+
+        with self.transaction() as conn:
+            total = conn.execute( 'SELECT COALESCE(SUM(size), 0) FROM responses' ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            # free a little headroom so every store does not trigger another eviction
+            target = self.max_bytes * 0.9
+            for row in conn.execute( 'SELECT url, size FROM responses ORDER BY accessed' ).fetchall():
+                if total <= target:
+                    break
+                conn.execute( 'DELETE FROM responses WHERE url = ?', ( row['url'], ) )
+                total -= row['size']
+
+    def clear( self ) -> None:
+
+        """ removes every stored response """
+
+        self.execute( 'DELETE FROM responses' )
+
+
+RESPONSE_CACHE = ResponseCache()
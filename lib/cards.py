@@ -0,0 +1,122 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:02:37 AM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... cards.py
+Description: ....... Compact typed records for the videos, channels and categories parsed from Rumble listing pages.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... none
+Examples: .......... _
+ (1) from lib.parser import parse_cards
+     for card in parse_cards(html_data, 'subscriptions'):
+        if isinstance(card, VideoCard) and card.live:
+            print(card.title, card.channel)
+Notes: ............. _
+ (1) Cards hold parsed data only, no Kodi labels or colour tags. main.py renders them into
+     ListItems, so parsed results can be cached, merged and sorted before rendering.
+ (2) NamedTuples carry no per-instance __dict__, which keeps large listings small.
+ (3) dump_cards / load_cards turn a list of cards into JSON and back, for the listing caches.
+===========================================================================================
+"""
+
+from datetime import datetime
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+
+class VideoCard(NamedTuple):
+
+    """ a video in a listing """
+
+    url: str
+    video_id: int
+    title: str
+    channel: str
+    channel_url: str
+    published: Optional[datetime]
+    duration: int
+    thumb: str
+    live: bool
+    upcoming: bool
+    verified: bool
+
+
+class ChannelCard(NamedTuple):
+
+    """ a channel or user in a listing """
+
+    url: str
+    path: str
+    title: str
+    thumb: str
+    followers: str
+    verified: bool
+    live: bool
+    subscribed: bool
+
+
+class CategoryCard(NamedTuple):
+
+    """ a category in the browse list """
+
+    url: str
+    title: str
+    thumb: str
+
+
+Card = Union[VideoCard, ChannelCard, CategoryCard]
+
+
+# Short type tags used in serialised listings
+CARD_TYPES = {'video': VideoCard, 'channel': ChannelCard, 'category': CategoryCard}
+
+
+def dump_cards(cards: Iterable[Card]) -> str:
+    """
+    Serialise cards to JSON, e.g. to cache a parsed listing.
+
+    Args:
+        cards (Iterable[Card]): The cards to store.
+
+    Returns:
+        str: A JSON list of [type, fields] pairs; datetimes are stored in ISO format.
+    """
+    rows = []
+    for card in cards:
+        kind = next(name for name, card_type in CARD_TYPES.items() if isinstance(card, card_type))
+        fields = [value.isoformat() if isinstance(value, datetime) else value for value in card]
+        rows.append([kind, fields])
+    return json.dumps(rows)
+
+
+def load_cards(text: str) -> List[Card]:
+    """
+    Rebuild cards serialised by dump_cards.
+
+    Args:
+        text (str): The JSON from dump_cards.
+
+    Returns:
+        List[Card]: The cards, in the stored order.
+    """
+    cards = []
+    for kind, fields in json.loads(text):
+        card = CARD_TYPES[kind](*fields)
+        if isinstance(card, VideoCard) and card.published:
+            card = card._replace(published=datetime.fromisoformat(card.published))
+        cards.append(card)
+    return cards
@@ -18,23 +18,51 @@ Contact Author: .... lundeen-bryan
 Copyright:  ........ n/a © 2025. All rights reserved.
 Preconditions: ..... xbmc, xbmcplugin, xbmcgui, xbmcaddon, xbmcvfs; depends on auxiliary modules (lib.general, lib.rumble_user).
 Examples: .......... _
- (1)
+ (1) win = CommentWindow('addon-rumble-comments.xml', ADDON.getAddonInfo('path'), 'default', video_id=video_id)
+     win.doModal()
 Notes: ............. _
- (1)
+ (1) Threads are parsed in one pass by lib.parser.scan_comments, replies follow the comment
+     they answer and are indented by their depth.
+ (2) Parsed threads are kept in COMMENT_CACHE (cache.db) for COMMENTS_TTL, so reopening the
+     comments of a video does not download and parse them again.
+ (3) The list gets COMMENT_PAGE_SIZE comments at a time; the next page is added when the
+     selection comes within COMMENT_PAGE_MARGIN items of the end.
+ (4) Given a lib.livechat.LiveChat, the window shows the live chat instead: a thread appends
+     each new message to the list as it arrives and stops the chat when the window closes.
 ===========================================================================================
 """
 # 📌  comments_todo 📝 🗑️
 
+import threading
+import time
+
 import xbmc
 import xbmcgui
-import requests
 
 from lib.general import *
+from lib.livechat import LiveChat
 from lib.rumble_user import RumbleUser
-from dataclasses import dataclass
+from lib.storage import Database
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
 
 RUMBLE_USER = RumbleUser()
 
+# Seconds a parsed comment thread is shown before it is downloaded again
+COMMENTS_TTL = 2 * 60
+
+# Comments added to the list at a time, and how close to the end the selection gets before the next page
+COMMENT_PAGE_SIZE = 50
+COMMENT_PAGE_MARGIN = 10
+
+# Actions that close the window
+CLOSE_ACTIONS = (xbmcgui.ACTION_PREVIOUS_MENU, xbmcgui.ACTION_NAV_BACK)
+
 @dataclass
 class Comment:
     author_url: str
@@ -49,16 +77,126 @@ class Comment:
     post_meridiem: str
     post_time_ago: str
     comment_text: str
+    depth: int = 0
+    parent_id: str = ''
+
+
+COMMENT_FIELDS = tuple( field.name for field in fields( Comment ) )
+
+
+class CommentCache(Database):
+
+    """ parsed comment threads by video id, kept for COMMENTS_TTL """
+
+    filename = 'cache.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS comment_threads ('
+        ' video_id TEXT PRIMARY KEY, comments TEXT NOT NULL, fetched REAL NOT NULL)',
+    )
+
+    def get( self, video_id: str ) -> Optional[List[Dict]]:
+
+        """ gets the scanned comments of a video if they are younger than COMMENTS_TTL """
+
+        rows = self.execute(
+            'SELECT comments FROM comment_threads WHERE video_id = ? AND fetched > ?',
+            ( video_id, time.time() - COMMENTS_TTL )
+        )
+        return json.loads( rows[0]['comments'] ) if rows else None
+
+    def put( self, video_id: str, comments: List[Dict] ) -> None:
+
+        """ saves the scanned comments of a video and drops expired threads """
+
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO comment_threads (video_id, comments, fetched) VALUES (?, ?, ?)',
+                ( video_id, json.dumps( comments ), now )
+            )
+            conn.execute( 'DELETE FROM comment_threads WHERE fetched < ?', ( now - COMMENTS_TTL, ) )
+
+
+COMMENT_CACHE = CommentCache()
 
 
 class CommentWindow(xbmcgui.WindowXML):
 
     def __init__(self, *args, **kwargs):
         self.video_id = kwargs['video_id']
+        self.live_chat: Optional[LiveChat] = kwargs.get('live_chat')
+        self.comments = []
+        self.shown = 0
+        self.closing = threading.Event()
+        self.chat_thread = None
         xbmcgui.WindowXML.__init__(self, args, kwargs)
 
     def onInit(self):
-        self.refresh()
+        if self.live_chat:
+            self.follow_chat()
+        else:
+            self.refresh()
+
+    def close(self):
+        """
+        Closes the window, stopping the live chat first.
+
+        Returns:
+            None
+        """
+        self.closing.set()
+        if self.live_chat:
+            self.live_chat.stop()
+        if self.chat_thread:
+            self.chat_thread.join(2)
+        xbmcgui.WindowXML.close(self)
+
+    def follow_chat(self):
+        """
+        Starts the live chat and a thread that appends its messages to the comment control
+        list as they arrive, keeping the newest selected while the user is at the end.
+
+        Returns:
+            None
+        """
+        ccl = self.get_comment_control_list()
+        self.live_chat.start()
+
+        def follow():
+            seq = 0
+            while not self.closing.is_set():
+                seq, messages = self.live_chat.wait_since(seq, 1)
+                if not messages or self.closing.is_set():
+                    continue
+                at_end = ccl.getSelectedPosition() >= ccl.size() - 1
+                ccl.addItems([
+                    self.create_list_item(message.id, message.user, message.time[11:16], message.text)
+                    for message in messages
+                ])
+                if at_end:
+                    ccl.selectItem(ccl.size() - 1)
+
+        self.chat_thread = threading.Thread(target=follow, name='chatwindow', daemon=True)
+        self.chat_thread.start()
+
+    def onAction(self, action):
+        """
+        Closes the window on back, and adds the next page of comments when the selection
+        nears the end of the list.
+
+        Args:
+            action (xbmcgui.Action): The action Kodi sent to the window.
+
+        Returns:
+            None
+        """
+        if action.getId() in CLOSE_ACTIONS:
+            self.close()
+            return
+        if not self.live_chat and self.shown < len(self.comments):
+            ccl = self.get_comment_control_list()
+            if ccl.getSelectedPosition() >= ccl.size() - COMMENT_PAGE_MARGIN:
+                self.show_more()
 
     def fetch_comment_list(self):
         """
@@ -81,9 +219,13 @@ class CommentWindow(xbmcgui.WindowXML):
             propagated to the caller.
         """
         try:
-            raw_comments = RUMBLE_USER.get_comments(self.video_id)
-            # Convert the raw comments into Comment objects
-            comments = [Comment(*comment_data) for comment_data in raw_comments]
+            raw_comments = COMMENT_CACHE.get(self.video_id)
+            if raw_comments is None:
+                raw_comments = RUMBLE_USER.get_comments(self.video_id)
+                if raw_comments:
+                    COMMENT_CACHE.put(self.video_id, raw_comments)
+            # Convert the scanned comments into Comment objects
+            comments = [Comment(**{key: data.get(key, '') for key in COMMENT_FIELDS}) for data in raw_comments]
             return comments
         except Exception as e:
             xbmc.log(f"Error fetching comments: {str(e)}", level=xbmc.LOGERROR)
@@ -96,17 +238,16 @@ class CommentWindow(xbmcgui.WindowXML):
         Refreshes the comment list in the CommentWindow.
 
         This method fetches the latest comments for the current video and updates
-        the comment control list in the UI. If comments are found, it populates
-        the list with individual comment items. If no comments are found, it
-        displays a "No Comments Found" message.
+        the comment control list in the UI. If comments are found, it shows the
+        first page of them. If no comments are found, it displays a
+        "No Comments Found" message.
 
         The method performs the following steps:
         1. Retrieves the comment control list.
         2. Fetches the latest comments using fetch_comment_list().
         3. If comments are found:
-        - Iterates through each comment.
-        - Creates a list item for each comment with relevant information.
-        - Adds each list item to the comment control list.
+        - Adds the first COMMENT_PAGE_SIZE of them with show_more(), the rest
+          follow as the list is scrolled (see onAction).
         4. If no comments are found and the list is empty:
         - Adds a single item with the "No Comments Found" message.
 
@@ -122,23 +263,37 @@ class CommentWindow(xbmcgui.WindowXML):
 
         ccl = self.get_comment_control_list()
 
-        results = self.fetch_comment_list()
+        self.comments = self.fetch_comment_list()
+        self.shown = 0
 
-        if results:
-            for comment in results:
-                ccl.addItem(
-                    self.create_list_item(
-                        comment.comment_id,
-                        comment.author_name,
-                        comment.post_time_ago,
-                        comment.comment_text
-                    )
-                )
+        if self.comments:
+            ccl.reset()
+            self.show_more()
 
         else:
             if ccl.size() == 0:
                 ccl.addItem(xbmcgui.ListItem(label="No Comments Found"))
 
+    def show_more(self):
+        """
+        Adds the next COMMENT_PAGE_SIZE comments to the comment control list.
+
+        Returns:
+            None
+        """
+        page = self.comments[self.shown:self.shown + COMMENT_PAGE_SIZE]
+        self.get_comment_control_list().addItems([
+            self.create_list_item(
+                comment.comment_id,
+                comment.author_name,
+                comment.post_time_ago,
+                comment.comment_text,
+                comment.depth
+            )
+            for comment in page
+        ])
+        self.shown += len(page)
+
     def get_comment_control_list(self):
         """
         Retrieves the comment control list from the window.
@@ -157,7 +312,7 @@ class CommentWindow(xbmcgui.WindowXML):
         """
         return self.getControl(1)
 
-    def create_list_item(self, comment_id, comment_author_name, comment_post_time_ago, comment):
+    def create_list_item(self, comment_id, comment_author_name, comment_post_time_ago, comment, depth=0):
         """
         Creates a ListItem object for a single comment to be displayed in the Kodi UI.
 
@@ -171,6 +326,7 @@ class CommentWindow(xbmcgui.WindowXML):
             comment_author_name (str): The name of the comment's author.
             comment_post_time_ago (str): A string representing how long ago the comment was posted.
             comment (str): The text content of the comment.
+            depth (int, optional): The reply level, 0 for top level comments. Defaults to 0.
 
         Returns:
             xbmcgui.ListItem: A fully configured ListItem object representing the comment.
@@ -181,6 +337,7 @@ class CommentWindow(xbmcgui.WindowXML):
             - 'comment_author_name': The name of the comment's author
             - 'comment_post_time_ago': When the comment was posted
             - 'comment': The full text of the comment
+            - 'depth': The reply level
 
         These properties can be accessed later for refreshing the display or
         handling user interactions with the comment item.
@@ -191,13 +348,15 @@ class CommentWindow(xbmcgui.WindowXML):
                 comment_id,
                 comment_author_name,
                 comment_post_time_ago,
-                comment
+                comment,
+                depth=depth
             )
         )
         line_item.setProperty('id', comment_id)
         line_item.setProperty('comment_author_name', comment_author_name)
         line_item.setProperty('comment_post_time_ago', comment_post_time_ago)
         line_item.setProperty('comment', comment)
+        line_item.setProperty('depth', str(depth))
         return line_item
 
     def refresh_label(self, line_item, selected=True):
@@ -237,17 +396,19 @@ class CommentWindow(xbmcgui.WindowXML):
         comment_author_name = line_item.getProperty('comment_author_name')
         comment_post_time_ago = line_item.getProperty('comment_post_time_ago')
         comment = line_item.getProperty('comment')
+        depth = int(line_item.getProperty('depth') or 0)
         line_item.setLabel(
             self.create_label(
                 comment_id,
                 comment_author_name,
                 comment_post_time_ago,
                 comment,
-                selected
+                selected,
+                depth
             )
         )
 
-    def create_label(self, comment_id, comment_author_name, comment_post_time_ago, comment, selected=False):
+    def create_label(self, comment_id, comment_author_name, comment_post_time_ago, comment, selected=False, depth=0):
         """
         Creates a formatted label string for displaying a comment in the Kodi UI.
 
@@ -267,6 +428,8 @@ class CommentWindow(xbmcgui.WindowXML):
             selected (bool, optional): Indicates whether the comment is currently
                                        selected in the UI. Not used in the current
                                        implementation. Defaults to False.
+            depth (int, optional): The reply level; replies are indented and marked
+                                   with an arrow. Defaults to 0.
 
         Returns:
             str: A formatted string representing the comment, ready for display
@@ -282,5 +445,6 @@ class CommentWindow(xbmcgui.WindowXML):
             - Kodi color tags are used: white for the comment text and orange
               for the post time.
         """
-        return comment_author_name + ' [COLOR white]' + clean_text( comment ) \
+        indent = '    ' * depth + '[COLOR grey]\u21b3[/COLOR] ' if depth else ''
+        return indent + comment_author_name + ' [COLOR white]' + clean_text( comment ) \
             + '[/COLOR] [COLOR orange](' + comment_post_time_ago + ')[/COLOR]'
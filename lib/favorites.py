@@ -0,0 +1,174 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 12:20:54 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... favorites.py
+Description: ....... Provides `FavoritesStore`, the SQLite backed store of the add-on's own favorites.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage
+Examples: .......... _
+ (1) from lib.favorites import FavoritesStore, Favorite
+     store = FavoritesStore(legacy_path='/path/to/favorites.dat')
+     store.add(Favorite('Title', 'https://rumble.com/v1-x.html', 4, 'thumb.jpg', 'fanart.jpg', '', 'video', 'False', '2'))
+     for favorite in store.page(0, 50):
+        print(favorite.name)
+Notes: ............. _
+ (1) Replaces the favorites.dat JSON file that was re-read and rewritten in full on every change.
+     Adds and removes are single row statements and reads are sorted and paged by SQLite.
+ (2) The first time the database is opened an existing favorites.dat is imported and renamed
+     to favorites.dat.migrated.
+===========================================================================================
+"""
+
+import os
+import time
+
+from typing import List, NamedTuple, Optional
+
+import xbmc
+
+from lib.storage import Database
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# Sort orders for FavoritesStore.page, by the favorites_sort setting value
+SORT_ORDERS = {
+    '0': 'added',
+    '1': 'name COLLATE NOCASE',
+}
+
+
+class Favorite(NamedTuple):
+
+    """ a saved favorite, in the same field order as the legacy favorites.dat rows """
+
+    name: str
+    url: str
+    mode: int
+    thumb: str
+    fanart: str
+    plot: str
+    cat: str
+    folder: str
+    play: str
+
+
+class FavoritesStore(Database):
+
+    """ favorites indexed by URL and name """
+
+    filename = 'favorites.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS favorites ('
+        ' id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, url TEXT NOT NULL, mode INTEGER,'
+        ' thumb TEXT, fanart TEXT, plot TEXT, cat TEXT, folder TEXT, play TEXT, added REAL NOT NULL)',
+        'CREATE UNIQUE INDEX IF NOT EXISTS favorites_url ON favorites (url)',
+        'CREATE INDEX IF NOT EXISTS favorites_name ON favorites (name)',
+    )
+
+    def __init__( self, path=None, legacy_path=None ):
+
+        """ Construct with an optional path and the favorites.dat file to import """
+
+        super().__init__( path )
+        self.legacy_path = legacy_path
+
+    def setup( self, conn ):
+
+        """ imports the legacy favorites.dat file once """
+
+        if not self.legacy_path or not os.path.exists( self.legacy_path ):
+            return
+
+        try:
+            with open( self.legacy_path, 'r', encoding='utf-8' ) as fav_file:
+                fav_str = fav_file.read()
+            rows = json.loads( fav_str ) if fav_str else []
+            now = time.time()
+            conn.execute( 'BEGIN IMMEDIATE' )
+            for index, row in enumerate( rows ):
+                favorite = Favorite( *row )
+                conn.execute(
+                    'INSERT OR REPLACE INTO favorites (name, url, mode, thumb, fanart, plot, cat, folder, play, added)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    ( *self._values( favorite ), now + index * 0.001 )
+                )
+            conn.execute( 'COMMIT' )
+            os.replace( self.legacy_path, self.legacy_path + '.migrated' )
+            xbmc.log( f"[Favorites] Imported {len( rows )} favorites from {self.legacy_path}", xbmc.LOGINFO )
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute( 'ROLLBACK' )
+            xbmc.log( f"[Favorites] Unable to import {self.legacy_path}: {e}", xbmc.LOGERROR )
+
+    @staticmethod
+    def _values( favorite: Favorite ) -> tuple:
+
+        """ the column values of a favorite """
+
+        return (
+            favorite.name, favorite.url, int( favorite.mode ), favorite.thumb, favorite.fanart,
+            favorite.plot or '', favorite.cat or '', str( favorite.folder ), str( favorite.play )
+        )
+
+    def add( self, favorite: Favorite ) -> None:
+
+        """ saves a favorite, replacing any existing favorite with the same URL """
+
+        self.execute(
+            'INSERT OR REPLACE INTO favorites (name, url, mode, thumb, fanart, plot, cat, folder, play, added)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            ( *self._values( favorite ), time.time() )
+        )
+
+    def remove( self, name: Optional[str] = None, url: Optional[str] = None ) -> None:
+
+        """ removes favorites by URL, or by name when no URL is given """
+
+        if url:
+            self.execute( 'DELETE FROM favorites WHERE url = ?', ( url, ) )
+        elif name:
+            self.execute( 'DELETE FROM favorites WHERE name = ?', ( name, ) )
+
+    def contains( self, name: str ) -> bool:
+
+        """ if a favorite with this name exists """
+
+        return bool( self.execute( 'SELECT 1 FROM favorites WHERE name = ? LIMIT 1', ( name, ) ) )
+
+    def names( self ) -> set:
+
+        """ the names of all favorites """
+
+        return { row['name'] for row in self.execute( 'SELECT name FROM favorites' ) }
+
+    def count( self ) -> int:
+
+        """ the number of favorites """
+
+        return self.execute( 'SELECT COUNT(*) FROM favorites' )[0][0]
+
+    def page( self, offset: int = 0, limit: int = -1, sort: str = '0' ) -> List[Favorite]:
+
+        """ gets a page of favorites in the given sort order """
+
+        order = SORT_ORDERS.get( sort, SORT_ORDERS['0'] )
+        rows = self.execute(
+            'SELECT name, url, mode, thumb, fanart, plot, cat, folder, play FROM favorites'
+            ' ORDER BY ' + order + ' LIMIT ? OFFSET ?',
+            ( limit, offset )
+        )
+        return [ Favorite( *row ) for row in rows ]
@@ -0,0 +1,304 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 4:31:52 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... feed.py
+Description: ....... Builds one merged "all my channels" feed from the video pages of every followed channel, synced concurrently and incrementally into a persisted local feed.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.listing, lib.storage; the Rumble session cookie must be set for the followed channel list.
+Examples: .......... _
+ (1) from lib.feed import build_feed
+     for card in build_feed(limit=50):
+        print(card.published, card.channel, card.title)
+Notes: ............. _
+ (1) Channel pages are fetched through lib.general.request_many, which runs at most
+     HOST_LIMIT requests to one host at a time so Rumble is not hit with every channel at once.
+ (2) FEED_STORE (feed.db) keeps a watermark per channel (its newest known video) and the
+     videos seen so far. A sync parses a channel page only up to the watermark or the first
+     known video and stores just the new ones; channels synced within FEED_CHANNEL_TTL are
+     not fetched. Pruning keeps the newest FEED_CHANNEL_MIN_ROWS videos of every channel.
+ (3) The feed is read newest first from the published index of the stored videos, which
+     merges the channels without sorting them in memory.
+===========================================================================================
+"""
+
+import time
+
+from typing import Iterable, List, NamedTuple, Optional
+
+import xbmc
+
+from lib.cards import ChannelCard, VideoCard, dump_cards, load_cards
+from lib.general import Request, request_get, request_many
+from lib.listing import build_page_url, load_listing
+from lib.parser import BASE_URL, parse_cards
+from lib.storage import Database
+
+# Seconds after a sync before a channel is fetched again
+FEED_CHANNEL_TTL = 10 * 60
+
+# Stored feed videos kept before the oldest are dropped
+FEED_MAX_ROWS = 5000
+
+# Newest videos of each channel kept when pruning, at least a channel page's worth
+FEED_CHANNEL_MIN_ROWS = 30
+
+def _timestamp(card: VideoCard) -> float:
+    """ upload time of a video card as a unix time, 0 when unknown """
+    return card.published.timestamp() if card.published else 0.0
+
+
+def channel_videos_url(path: str) -> str:
+    """
+    Get the URL of the video listing of a followed channel or user.
+
+    Args:
+        path (str): The channel path from a ChannelCard, e.g. '/c/SomeChannel' or '/user/someone'.
+
+    Returns:
+        str: The URL of the channel's videos page.
+
+    Example:
+        >>> channel_videos_url('/c/SomeChannel')
+        'https://rumble.com/c/SomeChannel/videos'
+    """
+    if path.startswith('/c/'):
+        return BASE_URL + path.rstrip('/') + '/videos'
+    return BASE_URL + path
+
+
+def followed_channels() -> List[ChannelCard]:
+    """
+    Get the channels the logged in user follows.
+
+    Returns:
+        List[ChannelCard]: The followed channels, empty when there is no session.
+    """
+    url = build_page_url(BASE_URL + '/followed-channels', 1)
+    return [card for card in load_listing(url, 'following') if isinstance(card, ChannelCard)]
+
+
+class Watermark(NamedTuple):
+
+    """ the newest known video of a channel and when the channel was last synced """
+
+    channel: str
+    video_url: str
+    published: float
+    synced: float
+
+
+def new_channel_videos(html_data: str, watermark: Optional[Watermark], known: set) -> List[VideoCard]:
+    """
+    Parse a channel page up to the watermark or the first video that is already in the feed.
+
+    The watermark ends the scan even when its rows were pruned from the feed. A video at the
+    top of the page that is older than the watermark is taken as pinned and skipped instead.
+
+    Args:
+        html_data (str): The channel's videos page.
+        watermark (Optional[Watermark]): The channel's watermark, None on its first sync.
+        known (set): The URLs of the channel's videos already in the feed.
+
+    Returns:
+        List[VideoCard]: The new videos, in page order.
+    """
+    new = []
+    for index, card in enumerate(parse_cards(html_data, 'channel_video')):
+        if not isinstance(card, VideoCard):
+            continue
+        seen = watermark is not None and card.url == watermark.video_url
+        older = watermark is not None and 0 < _timestamp(card) < watermark.published
+        if seen or older or card.url in known:
+            if index == 0 and older:
+                continue
+            break
+        new.append(card)
+    return new
+
+
+def sync_channel(path: str) -> int:
+    """
+    Fetch a channel's videos page and add its new videos to FEED_STORE.
+
+    The page is revalidated even when the response cache holds it, otherwise a sync could
+    re-read a cached page, find nothing new and still mark the channel as synced.
+
+    Args:
+        path (str): The channel path from a ChannelCard.
+
+    Returns:
+        int: The number of new videos.
+    """
+    return add_channel_page(path, request_get(channel_videos_url(path), refresh=True))
+
+
+def add_channel_page(path: str, html_data: str) -> int:
+    """
+    Add the new videos on a downloaded channel page to FEED_STORE.
+
+    Args:
+        path (str): The channel path from a ChannelCard.
+        html_data (str): The channel's videos page, '' when it could not be loaded.
+
+    Returns:
+        int: The number of new videos.
+    """
+    if not html_data:
+        return 0
+    new = new_channel_videos(html_data, FEED_STORE.watermark(path), FEED_STORE.known_urls(path))
+    FEED_STORE.add(path, new)
+    return len(new)
+
+
+def sync_channels(paths: Iterable[str]) -> int:
+    """
+    Sync several channels, storing each page as soon as it arrives. The pages are revalidated
+    like in sync_channel.
+
+    Args:
+        paths (Iterable[str]): The channel paths.
+
+    Returns:
+        int: The number of new videos across all channels.
+    """
+    by_url = {channel_videos_url(path): path for path in paths}
+    added = 0
+    requests_ = [Request(url, refresh=True) for url in by_url]
+    for request, html_data in request_many(requests_, ordered=False):
+        try:
+            added += add_channel_page(by_url[request.url], html_data)
+        except Exception as e:
+            xbmc.log(f"[Feed] Syncing {by_url[request.url]} failed: {e}", xbmc.LOGWARNING)
+    return added
+
+
+def build_feed(limit: int, max_age: int = FEED_CHANNEL_TTL) -> List[VideoCard]:
+    """
+    Build the merged feed of every followed channel.
+
+    Args:
+        limit (int): The number of videos to return.
+        max_age (int, optional): Channels synced longer ago than this many seconds are synced
+                                 first, 0 syncs every channel. Defaults to FEED_CHANNEL_TTL.
+
+    Returns:
+        List[VideoCard]: The newest videos of the followed channels, newest first.
+    """
+    paths = sync_feed(max_age)
+    return FEED_STORE.newest(paths, limit)
+
+
+def sync_feed(max_age: int = FEED_CHANNEL_TTL) -> List[str]:
+    """
+    Sync the followed channels that were last synced more than max_age seconds ago.
+
+    Args:
+        max_age (int, optional): Sync age in seconds after which a channel is fetched again.
+                                 Defaults to FEED_CHANNEL_TTL.
+
+    Returns:
+        List[str]: The paths of every followed channel.
+    """
+    paths = [card.path for card in followed_channels()]
+    stale = FEED_STORE.stale(paths, max_age)
+    added = sync_channels(stale)
+    xbmc.log(f"[Feed] Synced {len(stale)} of {len(paths)} followed channels, {added} new videos", xbmc.LOGDEBUG)
+    return paths
+
+
+class FeedStore(Database):
+
+    """ persisted feed of followed channels with a watermark per channel """
+
+    filename = 'feed.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS watermarks ('
+        ' channel TEXT PRIMARY KEY, video_url TEXT NOT NULL, published REAL NOT NULL, synced REAL NOT NULL)',
+        'CREATE TABLE IF NOT EXISTS feed_videos ('
+        ' url TEXT PRIMARY KEY, channel TEXT NOT NULL, published REAL NOT NULL, card TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS feed_videos_published ON feed_videos (published)',
+        'CREATE INDEX IF NOT EXISTS feed_videos_channel ON feed_videos (channel)',
+    )
+
+    def watermark( self, channel: str ) -> Optional[Watermark]:
+
+        """ gets the watermark of a channel, None before its first sync """
+
+        rows = self.execute( 'SELECT channel, video_url, published, synced FROM watermarks WHERE channel = ?', ( channel, ) )
+        return Watermark( *rows[0] ) if rows else None
+
+    def known_urls( self, channel: str ) -> set:
+
+        """ the URLs of the channel's videos in the feed """
+
+        return { row['url'] for row in self.execute( 'SELECT url FROM feed_videos WHERE channel = ?', ( channel, ) ) }
+
+    def stale( self, channels: List[str], max_age: int ) -> List[str]:
+
+        """ the channels not synced within max_age seconds """
+
+        synced = { row['channel']: row['synced'] for row in self.execute( 'SELECT channel, synced FROM watermarks' ) }
+        cutoff = time.time() - max_age
+        return [ channel for channel in channels if synced.get( channel, 0 ) <= cutoff ]
+
+    def add( self, channel: str, cards: List[VideoCard] ) -> None:
+
+        """ stores new videos of a channel and moves its watermark to the newest one """
+
+        with self.transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO feed_videos (url, channel, published, card) VALUES (?, ?, ?, ?)',
+                [ ( card.url, channel, _timestamp( card ), dump_cards( [ card ] ) ) for card in cards ]
+            )
+            row = conn.execute( 'SELECT video_url, published FROM watermarks WHERE channel = ?', ( channel, ) ).fetchone()
+            mark = ( row['video_url'], row['published'] ) if row else ( '', 0.0 )
+            newest = max( cards, key=_timestamp ) if cards else None
+            if newest and _timestamp( newest ) >= mark[1]:
+                mark = ( newest.url, _timestamp( newest ) )
+            conn.execute(
+                'INSERT OR REPLACE INTO watermarks (channel, video_url, published, synced) VALUES (?, ?, ?, ?)',
+                ( channel, mark[0], mark[1], time.time() )
+            )
+            # drop the oldest videos past the cap, but never a channel's newest ones
+            conn.execute(
+                'DELETE FROM feed_videos WHERE url IN (SELECT url FROM ('
+                ' SELECT url, ROW_NUMBER() OVER (ORDER BY published DESC) AS overall,'
+                ' ROW_NUMBER() OVER (PARTITION BY channel ORDER BY published DESC) AS own FROM feed_videos)'
+                ' WHERE overall > ? AND own > ?)',
+                ( FEED_MAX_ROWS, FEED_CHANNEL_MIN_ROWS )
+            )
+
+    def newest( self, channels: List[str], limit: int ) -> List[VideoCard]:
+
+        """ the newest videos of the given channels, newest first """
+
+        wanted = set( channels )
+        cards = []
+        for row in self.execute( 'SELECT channel, card FROM feed_videos ORDER BY published DESC' ):
+            if row['channel'] in wanted:
+                cards.extend( load_cards( row['card'] ) )
+                if len( cards ) >= limit:
+                    break
+        return cards
+
+    def clear( self ) -> None:
+
+        """ forgets every watermark and stored video """
+
+        with self.transaction() as conn:
+            conn.execute( 'DELETE FROM watermarks' )
+            conn.execute( 'DELETE FROM feed_videos' )
+
+
+FEED_STORE = FeedStore()
@@ -23,8 +23,11 @@ Notes: ............. _
 ===========================================================================================
 """
 import sys
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 
 import html
 
@@ -36,6 +39,12 @@ import xbmcaddon
 import six
 from six.moves import urllib
 
+from lib.cache import RESPONSE_CACHE, cache_key, cache_ttl
+from lib.settings import SETTINGS, SessionCookies
+from lib.singleflight import SingleFlight
+from lib.throughput import THROUGHPUT
+from lib.timing import TIMER, TIMING_SETTING
+
 try:
     import json
 except ImportError:
@@ -47,16 +56,70 @@ ADDON = xbmcaddon.Addon()
 ADDON_ICON = ADDON.getAddonInfo('icon')
 ADDON_NAME = ADDON.getAddonInfo('name')
 
-KODI_VERSION = float(xbmcaddon.Addon('xbmc.addon').getAddonInfo('version')[:4])
-
 #language
 __language__ = ADDON.getLocalizedString
 
-# Disable urllib3's "InsecureRequestWarning: Unverified HTTPS request is being made" warnings
-from requests.packages.urllib3.exceptions import InsecureRequestWarning
-requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+# Threads of the shared pool request_many runs requests on
+FETCH_WORKERS = 8
+
+# Requests request_many keeps in flight to one host
+HOST_LIMIT = 4
+
+# the requests session, created by session() on the first request of the invocation
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# read from Kodi by kodi_version()
+_KODI_VERSION = None
+
+# identical requests in flight at the same time share one download, see request_stats()
+REQUESTS_IN_FLIGHT = SingleFlight()
+
+# the session's cookie jar, loaded from the cookies setting when the session is created and written back by COOKIES.flush()
+COOKIES = SessionCookies(lambda: session().cookies, SETTINGS)
+
+def session():
+    """
+    Gets the requests session shared by every request of this process, creating it on first use.
+
+    requests and urllib3 take longer to import than the rest of the add-on, so they are only
+    loaded by invocations that go to the network, not e.g. by the home and search menus.
+
+    Returns:
+        requests.Session: The session, with its connection pool sized to the fetch pool and the
+        stored cookies in its jar.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            # Disable urllib3's "InsecureRequestWarning: Unverified HTTPS request is being made" warnings
+            from requests.packages.urllib3.exceptions import InsecureRequestWarning
+            requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+
+            new_session = requests.session()
+            # one connection per fetch thread, so concurrent requests to a host reuse kept-alive connections
+            adapter = requests.adapters.HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS)
+            new_session.mount('http://', adapter)
+            new_session.mount('https://', adapter)
+            # DNS and connect times for the phase timings, see lib.timing
+            if SETTINGS.get_bool(TIMING_SETTING):
+                TIMER.instrument_connections()
+            _SESSION = new_session
+    COOKIES.attach(_SESSION.cookies)
+    return _SESSION
+
+def kodi_version():
+    """
+    Gets the major.minor version of Kodi, read from Kodi on first use.
 
-reqs = requests.session()
+    Returns:
+        float: The version, e.g. 21.1.
+    """
+    global _KODI_VERSION
+    if _KODI_VERSION is None:
+        _KODI_VERSION = float(xbmcaddon.Addon('xbmc.addon').getAddonInfo('version')[:4])
+    return _KODI_VERSION
 
 def to_unicode( text, encoding='utf-8', errors='strict' ):
 
@@ -68,28 +131,77 @@ def to_unicode( text, encoding='utf-8', errors='strict' ):
     return text
 
 
-def request_get(url, data=None, extra_headers=None):
+def request_get(url, data=None, extra_headers=None, max_age=None, refresh=False, timeout=10):
+    """
+    Makes an HTTP GET or POST request to the specified URL, sharing the result of an identical
+    request that is already in flight.
+
+    Plain GETs of the same URL while one is running, e.g. the video page for playback and for
+    comments, or a page the prefetch is loading, wait for that request instead of making their
+    own. POSTs are actions and always run; so do GETs with refresh, max_age or extra_headers,
+    which must not get the answer of a normal call. The arguments are those of _request_get.
+
+    Returns:
+        str: The text content of the response, as _request_get returns it.
+    """
+    if data or extra_headers or refresh or max_age is not None:
+        return _request_get( url, data, extra_headers, max_age, refresh, timeout )
+    return REQUESTS_IN_FLIGHT.do( url, lambda: _request_get( url, timeout=timeout ) )
+
+
+def request_stats():
+    """
+    Gets the request coalescing counters of this process.
+
+    Returns:
+        dict: 'calls' (plain GETs through request_get), 'coalesced' (calls that shared another call's
+              download) and 'in_flight' (requests running now).
+    """
+    return REQUESTS_IN_FLIGHT.stats()
+
+
+@TIMER.timed('request')
+def _request_get(url, data=None, extra_headers=None, max_age=None, refresh=False, timeout=10):
     """
     Makes an HTTP GET or POST request to the specified URL.
 
     This function handles setting up headers, managing cookies, and making the actual HTTP request.
     It supports both GET and POST methods, and can handle additional custom headers.
+    GET responses are kept in the on-disk response cache (lib.cache) so repeat visits to a
+    page within its lifetime do not touch the network.
 
     Args:
         url (str): The URL to make the request to.
         data (dict, optional): Data to send in a POST request. If provided, a POST request is made;
                                otherwise, a GET request is made. Defaults to None.
         extra_headers (dict, optional): Additional headers to include in the request. Defaults to None.
+        max_age (int, optional): Cache lifetime in seconds overriding the URL class lifetime from
+                                 lib.cache.CACHE_RULES. 0 bypasses the cache. Defaults to None.
+        refresh (bool, optional): Go to the network even when the cached copy is fresh, still
+                                  revalidating and updating it, e.g. to warm the cache in the
+                                  background service. Defaults to False.
+        timeout (float, optional): Connect/read timeout in seconds. Defaults to 10.
 
     Returns:
         str: The text content of the response. Returns an empty string if an exception occurs.
 
     Note:
         - This function uses a predefined set of headers, including a specific User-Agent.
-        - It manages cookies across requests, storing them in the Kodi addon settings.
-        - The function has a timeout of 10 seconds for the request.
+        - Cookies live in the shared session jar (COOKIES); they are written to the Kodi addon
+          settings by COOKIES.flush() at the end of the invocation, not per request.
+        - The function has a timeout of 10 seconds for the request unless timeout is given.
+        - Expired cache entries are revalidated with If-None-Match / If-Modified-Since and are
+          served as-is when the request fails.
     """
 
+    ttl = 0 if data else ( cache_ttl( url ) if max_age is None else max_age )
+    # account pages are kept per user
+    key = cache_key( url, SETTINGS.get( 'username' ) )
+    cached = RESPONSE_CACHE.lookup( key ) if ttl else None
+
+    if cached and cached.is_fresh( ttl ) and not refresh:
+        return cached.body
+
     try:
 
         # headers
@@ -107,35 +219,238 @@ def request_get(url, data=None, extra_headers=None):
         if extra_headers:
             my_headers.update(extra_headers)
 
-        # get stored cookie string
-        cookies = ADDON.getSetting('cookies')
-
-        # split cookies into dictionary
-        if cookies:
-            cookie_dict = json.loads( cookies )
-        else:
-            cookie_dict = None
+        # revalidate the stored copy instead of downloading it again
+        if cached:
+            my_headers.update( cached.validators() )
 
-        # make request
+        # make request, the session jar supplies the cookies
+        started = time.monotonic()
+        TIMER.begin_request()
         if data:
-            response = reqs.post(url, data=data, headers=my_headers, cookies=cookie_dict, timeout=10)
+            response = session().post(url, data=data, headers=my_headers, timeout=timeout)
         else:
-            response = reqs.get(url, headers=my_headers, cookies=cookie_dict, timeout=10)
+            response = session().get(url, headers=my_headers, timeout=timeout)
+        TIMER.end_request(url, response, time.monotonic() - started)
 
-        if response.cookies.get_dict():
-            if cookie_dict:
-                cookie_dict.update( response.cookies.get_dict() )
-            else:
-                cookie_dict = response.cookies.get_dict()
+        # keep one copy of each cookie for every host, as the cookies setting always did
+        if response.cookies:
+            COOKIES.merge( response.cookies.get_dict() )
 
-            # store cookies
-            ADDON.setSetting('cookies', json.dumps(cookie_dict))
+        if cached and response.status_code == 304:
+            RESPONSE_CACHE.touch( key )
+            return cached.body
+
+        # keep showing the stored copy when the server answers with an error page
+        if cached and response.status_code != 200:
+            return cached.body
+
+        if ttl and response.status_code == 200 and response.text:
+            RESPONSE_CACHE.store(
+                key,
+                response.text,
+                response.headers.get( 'ETag', '' ),
+                response.headers.get( 'Last-Modified', '' )
+            )
 
         return response.text
 
     except Exception:
+        # fall back to the stale copy when the network is unavailable
+        if cached:
+            return cached.body
         return ''
 
+class Request(NamedTuple):
+    """ One request for request_many, the fields are the arguments of request_get """
+    url: str
+    data: Optional[dict] = None
+    extra_headers: Optional[dict] = None
+    max_age: Optional[int] = None
+    refresh: bool = False
+    timeout: float = 10
+
+
+_FETCH_POOL = None
+_FETCH_POOL_LOCK = threading.Lock()
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _fetch_pool():
+    """ the shared thread pool of request_many, created on first use """
+    global _FETCH_POOL
+    with _FETCH_POOL_LOCK:
+        if _FETCH_POOL is None:
+            _FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='fetch')
+        return _FETCH_POOL
+
+
+def cancel_pending_requests():
+    """
+    Drops the requests still queued on the shared fetch pool, e.g. when the plugin exits.
+
+    Requests already running finish within their own timeout. The pool takes no new requests
+    afterwards.
+
+    Returns:
+        None
+    """
+    with _FETCH_POOL_LOCK:
+        pool = _FETCH_POOL
+    if pool is None:
+        return
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python 3.8 cannot cancel queued work
+        pool.shutdown(wait=False)
+
+
+def _host_slot(url):
+    """ the semaphore limiting concurrent requests to the host of a URL """
+    host = urllib.parse.urlsplit(url).netloc
+    with _FETCH_POOL_LOCK:
+        if host not in _HOST_SLOTS:
+            _HOST_SLOTS[host] = threading.BoundedSemaphore(HOST_LIMIT)
+        return _HOST_SLOTS[host]
+
+
+def _request_one(request):
+    """ runs one Request on a pool thread, within its host's slot """
+    with _host_slot(request.url):
+        return request_get(*request)
+
+
+def submit_request(request):
+    """
+    Starts a request on the shared fetch pool.
+
+    Args:
+        request (Union[str, Request]): A URL to GET, or a Request.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the text request_get returns for it.
+    """
+    if isinstance(request, str):
+        request = Request(request)
+    return _fetch_pool().submit(_request_one, request)
+
+
+def request_many(requests_: Iterable[Union[str, Request]], ordered: bool = True) -> Iterator[Tuple[Request, str]]:
+    """
+    Runs several GET/POST requests concurrently on the shared fetch pool.
+
+    Every request goes through request_get, so it uses the response cache, the session cookies
+    and its own timeout. At most FETCH_WORKERS requests run at once, and at most HOST_LIMIT of
+    them to one host, whoever submitted them.
+
+    Args:
+        requests_ (Iterable[Union[str, Request]]): URLs to GET, or Request records.
+        ordered (bool, optional): Yield the results in the order of requests_; False yields each
+                                  one as soon as it completes. Defaults to True.
+
+    Returns:
+        Iterator[Tuple[Request, str]]: Each request with its response text, '' when it failed.
+
+    Note:
+        - Must not be called from a function that itself runs on the fetch pool, it would wait
+          on threads that are all busy waiting.
+
+    Example:
+        for request, html in request_many(page_urls):
+            cards = parse_cards(html, 'cat_video')
+    """
+    items = [Request(item) if isinstance(item, str) else item for item in requests_]
+    if len(items) == 1:
+        yield items[0], _request_one(items[0])
+        return
+
+    futures = {submit_request(item): item for item in items}
+    done = futures if ordered else as_completed(futures)
+    for future in done:
+        try:
+            text = future.result()
+        except Exception as e:
+            xbmc.log(f"[Fetch] {futures[future].url} failed: {e}", xbmc.LOGWARNING)
+            text = ''
+        yield futures[future], text
+
+def _download_one(url, timeout):
+    """ downloads one binary file on a pool thread, within its host's slot """
+    with _host_slot(url):
+        started = time.monotonic()
+        response = session().get(url, headers={ 'User-Agent': 'Mozilla/5.0' }, timeout=timeout)
+        elapsed = time.monotonic() - started
+    if response.status_code != 200:
+        return b''
+    # media downloads feed the per-host throughput estimate, small files are ignored there
+    THROUGHPUT.record( url, len( response.content ), elapsed )
+    return response.content
+
+
+def download_many(urls: Iterable[str], timeout: float = 10) -> Iterator[Tuple[str, bytes]]:
+    """
+    Downloads binary files, e.g. thumbnails, concurrently on the shared fetch pool.
+
+    The responses are not cached, and the per-host limit of request_many applies. Each
+    download is a sample of its host's throughput in lib.throughput.THROUGHPUT.
+
+    Args:
+        urls (Iterable[str]): The URLs to download.
+        timeout (float, optional): Connect/read timeout of each download in seconds. Defaults to 10.
+
+    Returns:
+        Iterator[Tuple[str, bytes]]: Each URL with its content as soon as it completes, b'' when
+        the download failed.
+    """
+    futures = {_fetch_pool().submit(_download_one, url, timeout): url for url in dict.fromkeys(urls)}
+    for future in as_completed(futures):
+        try:
+            content = future.result()
+        except Exception as e:
+            xbmc.log(f"[Fetch] {futures[future]} failed: {e}", xbmc.LOGDEBUG)
+            content = b''
+        yield futures[future], content
+
+def probe_throughput(url, nbytes=512 * 1024, timeout=5):
+    """
+    Measures the download throughput to a host with a short Range request.
+
+    The first nbytes of the URL are downloaded and recorded in lib.throughput.THROUGHPUT,
+    so the next call for the same host can use the stored estimate instead.
+
+    Args:
+        url (str): A media URL on the host to measure, e.g. a rendition of the video to play.
+        nbytes (int, optional): How many bytes to download. Defaults to 512 KiB.
+        timeout (int, optional): Connect/read timeout in seconds. Defaults to 5.
+
+    Returns:
+        float: The measured throughput in kbps, or None if the probe failed.
+    """
+
+    try:
+        started = time.monotonic()
+        response = session().get(
+            url,
+            headers={ 'Range': 'bytes=0-%d' % ( nbytes - 1 ), 'User-Agent': 'Mozilla/5.0' },
+            stream=True,
+            timeout=timeout
+        )
+        received = 0
+        for chunk in response.iter_content( 64 * 1024 ):
+            received += len( chunk )
+            if received >= nbytes:
+                break
+        response.close()
+        elapsed = time.monotonic() - started
+    except Exception as e:
+        xbmc.log( f"[Throughput] probe of {url} failed: {e}", xbmc.LOGDEBUG )
+        return None
+
+    if response.status_code not in ( 200, 206 ) or elapsed <= 0:
+        return None
+    THROUGHPUT.record( url, received, elapsed )
+    return received * 8 / 1000.0 / elapsed
+
 def build_url(query):
     """
     Constructs a URL for Kodi xbmcgui.ListItem with encoded parameters.
@@ -379,6 +694,21 @@ def clean_text(text):
 
     return text
 
+# Video info tag setters by property name: (setter method name, value conversion)
+INFO_TAG_SETTERS = {
+    'year': ('setYear', int),
+    'episode': ('setEpisode', None),
+    'season': ('setSeason', None),
+    'plot': ('setPlot', None),
+    'title': ('setTitle', None),
+    'studio': ('setStudios', lambda x: [x]),
+    'writer': ('setWriters', lambda x: [x]),
+    'duration': ('setDuration', int),
+    'tvshowtitle': ('setTvShowTitle', None),
+    'mediatype': ('setMediaType', None),
+    'premiered': ('setPremiered', None),
+}
+
 def item_set_info(line_item: xbmcgui.ListItem, properties: dict) -> None:
     """Set video information properties on a Kodi ListItem object.
 
@@ -386,26 +716,13 @@ def item_set_info(line_item: xbmcgui.ListItem, properties: dict) -> None:
         line_item (xbmcgui.ListItem): The Kodi ListItem object to update.
         properties (dict): A dictionary containing video information properties.
     """
-    if KODI_VERSION > 19.8:
+    if kodi_version() > 19.8:
         vidtag = line_item.getVideoInfoTag()
 
-        # Use a mapping of property names to setter methods
-        setters = {
-            'year': lambda x: vidtag.setYear(int(x)),
-            'episode': vidtag.setEpisode,
-            'season': vidtag.setSeason,
-            'plot': vidtag.setPlot,
-            'title': vidtag.setTitle,
-            'studio': lambda x: vidtag.setStudios([x]),
-            'writer': lambda x: vidtag.setWriters([x]),
-            'duration': lambda x: vidtag.setDuration(int(x)),
-            'tvshowtitle': vidtag.setTvShowTitle,
-            'mediatype': vidtag.setMediaType,
-            'premiered': vidtag.setPremiered,
-        }
-
-        # Use dictionary comprehension with generator expression
-        {setter(value) for key, (setter, value)
-         in ((k, (setters[k], v)) for k, v in properties.items() if k in setters)}
+        # Use the module level mapping of property names to setter methods
+        for key, value in properties.items():
+            if key in INFO_TAG_SETTERS:
+                setter, convert = INFO_TAG_SETTERS[key]
+                getattr(vidtag, setter)(convert(value) if convert else value)
     else:
-        line_item.setInfo('video', properties)
\ No newline at end of file
+        line_item.setInfo('video', properties)
@@ -0,0 +1,772 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 3:20:05 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... listing.py
+Description: ....... Fetches and parses Rumble listing pages into cards, concurrently for multi-page folders, with a short-lived cache of parsed pages and background prefetching of the next page.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.general, lib.parser, lib.storage
+Examples: .......... _
+ (1) from lib.listing import listing_spec, load_listing, prefetch_listing
+     spec = listing_spec(page_url, 'subscriptions')
+     cards = load_listing(page_url, spec.listing_type)
+     prefetch_listing(next_page_url, spec.listing_type)
+ (2) pages = load_listings([page_1_url, page_2_url], 'cat_video')
+     cards = merge_listings(pages)
+Notes: ............. _
+ (1) The parsed cards of prefetched and warmed pages are used from LISTING_CACHE (cache.db)
+     for PREFETCH_TTL, or the page's own response cache lifetime if that is longer.
+ (2) main.py calls wait_for_background() before the plugin process exits. It gives background
+     page fetches BACKGROUND_TIMEOUT, longer than their BACKGROUND_REQUEST_TIMEOUT, so they
+     normally finish. Pages still pending then are put in the listing queue for the background
+     service (warm_queued), and only a cache write in progress is waited for.
+     Thumbnails are only queued here, the background service downloads them.
+ (3) Multi-page folders fetch their pages concurrently through lib.general.request_many, the
+     pages come back in order and merge_listings drops cards repeated across page boundaries.
+ (4) load_listings_stale serves pages matching STALE_PATTERN past their lifetime straight
+     from LISTING_CACHE, and revalidate_listings fetches them again in the background; its
+     callback only runs when the card URLs changed (listing_hash), so unchanged listings are
+     not redrawn. Other pages past their lifetime are fetched before they are shown.
+===========================================================================================
+"""
+
+import hashlib
+import re
+import threading
+import time
+
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+import xbmc
+
+from lib.cache import PRIVATE_PATTERN, cache_ttl
+from lib.cards import Card, dump_cards, load_cards
+from lib.general import Request, cancel_pending_requests, request_get, request_many
+from lib.parser import parse_cards
+from lib.settings import SETTINGS
+from lib.storage import Database
+from lib.thumbnails import THUMBNAILS
+from lib.timing import TIMER
+
+
+# Longest time a prefetched page is shown without fetching it again, unless the page's own
+# response cache lifetime is longer
+PREFETCH_TTL = 5 * 60
+
+# Items on one Rumble listing page, and the folder sizes offered by 'items_per_folder'
+ITEMS_PER_PAGE = 25
+ITEMS_PER_FOLDER = (25, 50, 100, 200)
+
+# Listings shown stale while they are revalidated: browse, leaderboards, followed channels and
+# playlists. Search results and lists the user changes (subscriptions, Watch Later) are not.
+STALE_PATTERN = re.compile(r'/browse|/battle-leaderboard|/followed-channels|/playlists/(?!watch-later)')
+
+# Connect/read timeout of the requests of background fetches
+BACKGROUND_REQUEST_TIMEOUT = 3
+
+# Seconds main.py waits for background fetches before the plugin exits, enough for a
+# fetch that uses its whole request timeout and the parse after it
+BACKGROUND_TIMEOUT = BACKGROUND_REQUEST_TIMEOUT + 2
+
+# Queued pages the background service fetches per round
+LISTING_QUEUE_BATCH = 20
+
+_BACKGROUND: List[threading.Thread] = []
+
+# pages background threads still have to store, by (url, listing_type)
+_PENDING: Dict[Tuple[str, str], bool] = {}
+
+# set once the plugin is exiting, background threads then stop storing results
+_EXITING = threading.Event()
+_WRITE_LOCK = threading.Lock()
+
+
+def build_page_url(base_url: str, page: int) -> str:
+    """
+    Given a base URL, update its query parameters to include the page number.
+    """
+    parsed = urlparse(base_url)
+    # parse_qs returns values as lists, so convert them into single values
+    query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+    query_params['page'] = str(page)
+    new_query = urlencode(query_params)
+    return urlunparse((parsed.scheme, parsed.netloc, parsed.path,
+                       parsed.params, new_query, parsed.fragment))
+
+
+def items_per_folder() -> int:
+    """
+    Get the number of items shown in one folder from the 'items_per_folder' setting.
+
+    Returns:
+        int: 25, 50, 100 or 200.
+    """
+    try:
+        return ITEMS_PER_FOLDER[int(SETTINGS.get('items_per_folder') or 0)]
+    except (ValueError, IndexError):
+        return ITEMS_PER_PAGE
+
+
+def pages_per_folder() -> int:
+    """
+    Get the number of Rumble pages shown in one folder from the 'items_per_folder' setting.
+
+    Returns:
+        int: 1, 2, 4 or 8 pages.
+    """
+    return items_per_folder() // ITEMS_PER_PAGE
+
+
+def folder_page_urls(url: str, folder: int = 1, paginated: bool = True) -> List[str]:
+    """
+    Get the URLs of the Rumble pages shown in one folder of a listing.
+
+    Args:
+        url (str): The listing URL, including any search query.
+        folder (int, optional): The folder number, starting at 1. Defaults to 1.
+        paginated (bool, optional): False for listings that only have one page. Defaults to True.
+
+    Returns:
+        List[str]: The page URLs, in page order.
+    """
+    per_folder = pages_per_folder() if paginated else 1
+    first_page = (folder - 1) * per_folder + 1
+    return [build_page_url(url, number) for number in range(first_page, first_page + per_folder)]
+
+
+class ListingSpec(NamedTuple):
+
+    """ how a listing URL is parsed and played """
+
+    category: str
+    listing_type: str
+    is_search: bool = False
+    play_mode: int = 0
+
+
+def listing_spec(url: str, cat: str) -> Optional[ListingSpec]:
+    """
+    Get the page layout and play mode of a listing from its URL and category.
+
+    Args:
+        url (str): The listing page URL.
+        cat (str): The category the listing was opened with.
+
+    Returns:
+        Optional[ListingSpec]: How to parse and render the page, None for unknown categories.
+    """
+    # Fix for favorites & search
+    if cat in {'other', 'channel'} and '/c/' in url:
+        cat = 'channel_video'
+
+    if 'search' in url:
+        if cat == 'video':
+            return ListingSpec(cat, 'video', True, 1)
+        return ListingSpec(cat, 'channel', True)
+    if cat in {'subscriptions', 'cat_video', 'live_stream', 'playlist'}:
+        return ListingSpec(cat, cat, False, 2)
+    if cat in {'channel', 'top', 'other'}:
+        return ListingSpec(cat, 'video', False, 2)
+    if cat in {'channel_video', 'user'}:
+        return ListingSpec(cat, 'channel_video', False, 2)
+    if cat == 'following':
+        return ListingSpec(cat, 'following', False, 2)
+    if cat == 'cat_list':
+        return ListingSpec(cat, cat)
+    return None
+
+
+def fetch_listing(url: str, listing_type: str, refresh: bool = False) -> List[Card]:
+    """
+    Download and parse a listing page.
+
+    Args:
+        url (str): The listing page URL.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+        refresh (bool, optional): Revalidate the page even when the response cache is fresh.
+                                  Defaults to False.
+
+    Returns:
+        List[Card]: The parsed cards, empty when the page could not be loaded.
+    """
+    html_data = request_get(url, refresh=refresh)
+    with TIMER.phase('parse'):
+        return list(parse_cards(html_data, listing_type))
+
+
+def fetch_listings(urls: Sequence[str], listing_type: str, refresh: bool = False, timeout: float = 10) -> Iterator[Tuple[str, List[Card]]]:
+    """
+    Download several listing pages concurrently and parse them.
+
+    Args:
+        urls (Sequence[str]): The listing page URLs.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+        refresh (bool, optional): Revalidate the pages even when the response cache is fresh.
+                                  Defaults to False.
+        timeout (float, optional): Connect/read timeout of each request in seconds. Defaults to 10.
+
+    Returns:
+        Iterator[Tuple[str, List[Card]]]: Each URL with its cards, in the order of urls. Pages
+        that could not be loaded or parsed are empty.
+    """
+    for request, html_data in request_many([Request(url, refresh=refresh, timeout=timeout) for url in urls]):
+        try:
+            with TIMER.phase('parse'):
+                cards = list(parse_cards(html_data, listing_type))
+        except Exception as e:
+            xbmc.log(f"[Listing] Parsing {request.url} failed: {e}", xbmc.LOGWARNING)
+            cards = []
+        yield request.url, cards
+
+
+def warm_listing(url: str, cat: str, paginated: bool = True) -> int:
+    """
+    Fetch and parse the first folder of a listing into LISTING_CACHE and its thumbnails into
+    lib.thumbnails.THUMBNAILS, so opening it later is a local read. Used by the background service.
+
+    Args:
+        url (str): The listing URL, as the home menu links to it.
+        cat (str): The category the listing is opened with.
+        paginated (bool, optional): False for listings that only have one page. Defaults to True.
+
+    Returns:
+        int: The number of cards stored.
+    """
+    spec = listing_spec(url, cat)
+    if not spec:
+        return 0
+    stored = []
+    for page_url, cards in fetch_listings(folder_page_urls(url, 1, paginated), spec.listing_type, refresh=True):
+        if not cards:
+            break
+        LISTING_CACHE.put(page_url, spec.listing_type, cards)
+        stored.extend(cards)
+    THUMBNAILS.prefetch(card_thumbnails(stored))
+    return len(stored)
+
+
+def load_listing(url: str, listing_type: str) -> List[Card]:
+    """
+    Get the cards of a listing page, from LISTING_CACHE when it was prefetched recently.
+
+    Args:
+        url (str): The listing page URL.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        List[Card]: The parsed cards.
+    """
+    cards = LISTING_CACHE.get(url, listing_type)
+    if cards is not None:
+        xbmc.log(f"[Listing] Using prefetched page {url}", xbmc.LOGDEBUG)
+        return cards
+    return fetch_listing(url, listing_type)
+
+
+def load_listings(urls: Sequence[str], listing_type: str) -> List[List[Card]]:
+    """
+    Get the cards of several listing pages, fetching the ones not in LISTING_CACHE concurrently.
+
+    Args:
+        urls (Sequence[str]): The listing page URLs.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        List[List[Card]]: The cards of each page, in the order of urls. Pages that failed are empty.
+    """
+    pages = {}
+    for url in urls:
+        cards = LISTING_CACHE.get(url, listing_type)
+        if cards is not None:
+            xbmc.log(f"[Listing] Using prefetched page {url}", xbmc.LOGDEBUG)
+            pages[url] = cards
+    pages.update(fetch_listings([url for url in urls if url not in pages], listing_type))
+    return [pages[url] for url in urls]
+
+
+def load_listings_stale(urls: Sequence[str], listing_type: str) -> Tuple[List[List[Card]], List[str]]:
+    """
+    Get the cards of several listing pages, serving pages past their lifetime from LISTING_CACHE.
+
+    Only pages matching STALE_PATTERN are served stale. Pages that were never fetched, or are
+    past their lifetime and not browse listings, are loaded concurrently and stored, so the
+    next visit can be served from the cache too.
+
+    Args:
+        urls (Sequence[str]): The listing page URLs.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        Tuple[List[List[Card]], List[str]]: The cards of each page in the order of urls, and
+        the URLs of the pages served stale, which should be passed to revalidate_listings.
+    """
+    pages: List[Optional[List[Card]]] = []
+    stale: List[str] = []
+    for url in urls:
+        entry = LISTING_CACHE.entry(url, listing_type)
+        if entry is None:
+            pages.append(None)
+            continue
+        cards, fresh = entry
+        if not fresh and not STALE_PATTERN.search(url):
+            pages.append(None)
+            continue
+        pages.append(cards)
+        if not fresh:
+            stale.append(url)
+
+    missing = [url for url, cards in zip(urls, pages) if cards is None]
+    fetched = dict(zip(missing, load_listings(missing, listing_type)))
+    for url, cards in fetched.items():
+        if cards:
+            LISTING_CACHE.put(url, listing_type, cards)
+    return [fetched[url] if cards is None else cards for url, cards in zip(urls, pages)], stale
+
+
+def revalidate_listings(urls: Sequence[str], listing_type: str, on_change: Callable[[], None]) -> Optional[threading.Thread]:
+    """
+    Fetch pages served stale again on a background thread and store them in LISTING_CACHE.
+
+    The plugin waits for the thread before it exits, up to BACKGROUND_TIMEOUT; pages not
+    stored by then are revalidated by the background service, without the refresh.
+
+    Args:
+        urls (Sequence[str]): The page URLs from load_listings_stale.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+        on_change (Callable[[], None]): Called when the cards of any page changed, e.g. to
+                                        refresh the Kodi container.
+
+    Returns:
+        Optional[threading.Thread]: The started thread, None when there is nothing to revalidate.
+    """
+    if not urls:
+        return None
+    old = {}
+    for url in urls:
+        entry = LISTING_CACHE.entry(url, listing_type)
+        if entry:
+            old[url] = listing_hash(entry[0])
+
+    track_pending(urls, listing_type)
+
+    def run():
+        changed = False
+        for url, cards in fetch_listings(urls, listing_type, refresh=True, timeout=BACKGROUND_REQUEST_TIMEOUT):
+            # a failed fetch keeps the stale page rather than emptying the listing
+            if not cards:
+                continue
+            if not store_pending(url, listing_type, cards):
+                return
+            changed = changed or listing_hash(cards) != old.get(url)
+        if changed and not _EXITING.is_set():
+            xbmc.log(f"[Listing] {urls[0]} changed, refreshing", xbmc.LOGDEBUG)
+            on_change()
+
+    return start_background(run, 'revalidate')
+
+
+def listing_hash(cards: Sequence[Card]) -> str:
+    """
+    Get a content hash of the card URLs of a page, to tell whether a listing changed.
+
+    Args:
+        cards (Sequence[Card]): The cards of a page.
+
+    Returns:
+        str: The hex digest.
+    """
+    return hashlib.sha1('\n'.join(card.url for card in cards).encode('utf-8')).hexdigest()
+
+
+def merge_listings(pages: Sequence[List[Card]]) -> List[Card]:
+    """
+    Merge the cards of consecutive pages, dropping cards already on an earlier page.
+
+    Listings shift while they are paged through, so a card can appear on two pages.
+
+    Args:
+        pages (Sequence[List[Card]]): The cards of each page, in page order.
+
+    Returns:
+        List[Card]: The unique cards, in page order.
+    """
+    seen = set()
+    merged = []
+    for cards in pages:
+        for card in cards:
+            if card.url in seen:
+                continue
+            seen.add(card.url)
+            merged.append(card)
+    return merged
+
+
+def prefetch_listing(url: str, listing_type: str) -> Optional[threading.Thread]:
+    """
+    Fetch and parse a listing page into LISTING_CACHE on a background thread.
+
+    Args:
+        url (str): The listing page URL, e.g. the next page from main.build_page_url.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        Optional[threading.Thread]: The started thread, None when the page is already cached.
+    """
+    return prefetch_listings([url], listing_type)
+
+
+def prefetch_listings(urls: Sequence[str], listing_type: str) -> Optional[threading.Thread]:
+    """
+    Fetch and parse listing pages into LISTING_CACHE on one background thread, the pages
+    themselves are fetched concurrently through fetch_listings. Their thumbnails are queued
+    for the background service, and so are pages not stored when the plugin exits.
+
+    Args:
+        urls (Sequence[str]): The listing page URLs, e.g. the pages of the next folder.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        Optional[threading.Thread]: The started thread, None when every page is already cached.
+    """
+    missing = [url for url in urls if LISTING_CACHE.get(url, listing_type) is None]
+    if not missing:
+        return None
+
+    track_pending(missing, listing_type)
+
+    def run():
+        for url, cards in fetch_listings(missing, listing_type, timeout=BACKGROUND_REQUEST_TIMEOUT):
+            # an empty page stays pending, the service tries it once more
+            if not cards:
+                continue
+            if not store_pending(url, listing_type, cards):
+                return
+            background_write(THUMBNAILS.enqueue, card_thumbnails(cards))
+
+    return start_background(run, 'prefetch')
+
+
+def card_thumbnails(cards: Sequence[Card]) -> List[str]:
+    """
+    Get the remote thumbnail URLs of cards.
+
+    Args:
+        cards (Sequence[Card]): Parsed cards.
+
+    Returns:
+        List[str]: The thumbnail URLs, without duplicates.
+    """
+    return list(dict.fromkeys(card.thumb for card in cards if card.thumb and card.thumb.startswith('http')))
+
+
+def queue_thumbnails(urls: Sequence[str]) -> int:
+    """
+    Queue thumbnails for the background service to download into lib.thumbnails.THUMBNAILS.
+
+    Args:
+        urls (Sequence[str]): The remote thumbnail URLs, e.g. from card_thumbnails.
+
+    Returns:
+        int: The number of URLs queued.
+    """
+    try:
+        return THUMBNAILS.enqueue(urls)
+    except Exception as e:
+        xbmc.log(f"[Thumbnails] Unable to queue thumbnails: {e}", xbmc.LOGWARNING)
+        return 0
+
+
+def start_background(target, name: str = 'background') -> threading.Thread:
+    """
+    Start a daemon thread that wait_for_background() gives a moment before the plugin exits.
+
+    Args:
+        target (callable): The function to run; it should store results with background_write.
+        name (str, optional): The thread name, shown in logs.
+
+    Returns:
+        threading.Thread: The started thread.
+    """
+    def run():
+        try:
+            target()
+        except Exception as e:
+            # e.g. the fetch pool was shut down at exit
+            xbmc.log(f"[Listing] {name} stopped: {e}", xbmc.LOGDEBUG)
+
+    thread = threading.Thread(target=run, name=f"rumble-{name}", daemon=True)
+    thread.start()
+    _BACKGROUND.append(thread)
+    return thread
+
+
+def track_pending(urls: Sequence[str], listing_type: str) -> None:
+    """
+    Note pages a background thread is about to fetch, so wait_for_background can hand the ones
+    not stored by then to the background service.
+
+    Args:
+        urls (Sequence[str]): The page URLs.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+
+    Returns:
+        None
+    """
+    with _WRITE_LOCK:
+        for url in urls:
+            _PENDING[(url, listing_type)] = True
+
+
+def store_pending(url: str, listing_type: str, cards: List[Card]) -> bool:
+    """
+    Store a page fetched on a background thread in LISTING_CACHE and take it off the pending pages.
+
+    Args:
+        url (str): The page URL.
+        listing_type (str): The page layout, see lib.parser.parse_cards.
+        cards (List[Card]): The parsed cards.
+
+    Returns:
+        bool: True if the page was stored, False when the plugin is already exiting.
+    """
+    def store():
+        LISTING_CACHE.put(url, listing_type, cards)
+        _PENDING.pop((url, listing_type), None)
+    return background_write(store)
+
+
+def warm_queued(limit: int = LISTING_QUEUE_BATCH) -> int:
+    """
+    Fetch the pages the plugin queued at exit into LISTING_CACHE, with their thumbnails. Used by
+    the background service.
+
+    Args:
+        limit (int, optional): The most pages to fetch. Defaults to LISTING_QUEUE_BATCH.
+
+    Returns:
+        int: The number of pages stored.
+    """
+    queued = LISTING_CACHE.queued(limit)
+    by_type: Dict[str, List[str]] = {}
+    for url, listing_type in queued:
+        by_type.setdefault(listing_type, []).append(url)
+
+    stored = 0
+    thumbs = []
+    for listing_type, urls in by_type.items():
+        for url, cards in fetch_listings(urls, listing_type, refresh=True):
+            if cards:
+                LISTING_CACHE.put(url, listing_type, cards)
+                thumbs.extend(card_thumbnails(cards))
+                stored += 1
+    # failed pages are not retried, the plugin queues them again when it needs them
+    LISTING_CACHE.dequeue(queued)
+    THUMBNAILS.prefetch(thumbs)
+    return stored
+
+
+def background_write(func, *args) -> bool:
+    """
+    Run a cache write of a background thread, unless the plugin is already exiting.
+
+    Args:
+        func (callable): The write, e.g. LISTING_CACHE.put.
+        *args: Its arguments.
+
+    Returns:
+        bool: True if the write ran, False when it was skipped because the plugin is exiting.
+    """
+    with _WRITE_LOCK:
+        if _EXITING.is_set():
+            return False
+        func(*args)
+        return True
+
+
+def wait_for_background(timeout: float = BACKGROUND_TIMEOUT) -> None:
+    """
+    Give the background threads of this invocation up to timeout seconds, then wait only for
+    a cache write in progress. Pages they have not stored yet are queued for the background
+    service, and their downloads are abandoned.
+
+    Args:
+        timeout (float, optional): The longest time to wait for downloads. Defaults to BACKGROUND_TIMEOUT.
+
+    Returns:
+        None
+    """
+    deadline = time.monotonic() + timeout
+    for thread in _BACKGROUND:
+        thread.join(max(deadline - time.monotonic(), 0))
+
+    # no write starts after this, and one in progress finishes before the lock is free
+    with _WRITE_LOCK:
+        _EXITING.set()
+        pending = list(_PENDING)
+        _PENDING.clear()
+    cancel_pending_requests()
+    if pending:
+        try:
+            LISTING_CACHE.enqueue(pending)
+            xbmc.log(f"[Listing] Queued {len(pending)} unfinished pages for the service", xbmc.LOGDEBUG)
+        except Exception as e:
+            xbmc.log(f"[Listing] Unable to queue unfinished pages: {e}", xbmc.LOGWARNING)
+
+    running = [thread.name for thread in _BACKGROUND if thread.is_alive()]
+    if running:
+        xbmc.log(f"[Listing] Abandoned at exit: {', '.join(running)}", xbmc.LOGDEBUG)
+    _BACKGROUND.clear()
+
+
+class ListingCache(Database):
+
+    """ parsed cards of recently fetched listing pages """
+
+    filename = 'cache.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS listings ('
+        ' url TEXT NOT NULL, listing_type TEXT NOT NULL, cards TEXT NOT NULL, fetched REAL NOT NULL,'
+        ' PRIMARY KEY (url, listing_type))',
+        'CREATE TABLE IF NOT EXISTS listing_queue ('
+        ' url TEXT NOT NULL, listing_type TEXT NOT NULL, queued REAL NOT NULL, PRIMARY KEY (url, listing_type))',
+    )
+
+    def get( self, url: str, listing_type: str, ttl: Optional[int] = None ) -> Optional[List[Card]]:
+
+        """ gets the cards of a page stored less than ttl seconds ago, None when there are none """
+
+        if ttl is None:
+            ttl = max( PREFETCH_TTL, cache_ttl( url ) )
+        rows = self.execute(
+            'SELECT cards FROM listings WHERE url = ? AND listing_type = ? AND fetched > ?',
+            ( url, listing_type, time.time() - ttl )
+        )
+        if not rows:
+            return None
+        try:
+            return load_cards( rows[0]['cards'] )
+        except ( ValueError, TypeError, KeyError ):
+            self.invalidate( url )
+            return None
+
+    def entry( self, url: str, listing_type: str ) -> Optional[Tuple[List[Card], bool]]:
+
+        """ gets the cards of a page whatever their age, with whether they are still fresh """
+
+        rows = self.execute(
+            'SELECT cards, fetched FROM listings WHERE url = ? AND listing_type = ?',
+            ( url, listing_type )
+        )
+        if not rows:
+            return None
+        try:
+            cards = load_cards( rows[0]['cards'] )
+        except ( ValueError, TypeError, KeyError ):
+            self.invalidate( url )
+            return None
+        ttl = max( PREFETCH_TTL, cache_ttl( url ) )
+        return cards, time.time() - rows[0]['fetched'] < ttl
+
+    def put( self, url: str, listing_type: str, cards: List[Card] ) -> None:
+
+        """ stores the cards of a page and drops entries older than a day """
+
+        self.execute( 'DELETE FROM listings WHERE fetched < ?', ( time.time() - 24 * 60 * 60, ) )
+        self.execute(
+            'INSERT OR REPLACE INTO listings (url, listing_type, cards, fetched) VALUES (?, ?, ?, ?)',
+            ( url, listing_type, dump_cards( cards ), time.time() )
+        )
+
+    def update( self, url_pattern: str, transform: Callable[[List[Card]], List[Card]] ) -> int:
+
+        """
+        rewrites the cached cards of every page whose URL matches the LIKE pattern, e.g. to
+        apply a local change; changed pages count as freshly fetched. Returns the pages changed.
+        """
+
+        changed = 0
+        with self.transaction() as conn:
+            rows = conn.execute( 'SELECT url, listing_type, cards FROM listings WHERE url LIKE ?', ( url_pattern, ) ).fetchall()
+            for row in rows:
+                try:
+                    cards = load_cards( row['cards'] )
+                except ( ValueError, TypeError, KeyError ):
+                    continue
+                updated = transform( cards )
+                if updated == cards:
+                    continue
+                conn.execute(
+                    'UPDATE listings SET cards = ?, fetched = ? WHERE url = ? AND listing_type = ?',
+                    ( dump_cards( updated ), time.time(), row['url'], row['listing_type'] )
+                )
+                changed += 1
+        return changed
+
+    def enqueue( self, pages: Sequence[Tuple[str, str]] ) -> None:
+
+        """ queues ( url, listing_type ) pages for the background service to fetch """
+
+        now = time.time()
+        self.executemany(
+            'INSERT OR REPLACE INTO listing_queue (url, listing_type, queued) VALUES (?, ?, ?)',
+            [ ( url, listing_type, now ) for url, listing_type in pages ]
+        )
+
+    def queued( self, limit: int ) -> List[Tuple[str, str]]:
+
+        """ the queued ( url, listing_type ) pages, most recently queued first """
+
+        rows = self.execute( 'SELECT url, listing_type FROM listing_queue ORDER BY queued DESC LIMIT ?', ( limit, ) )
+        return [ ( row['url'], row['listing_type'] ) for row in rows ]
+
+    def dequeue( self, pages: Sequence[Tuple[str, str]] ) -> None:
+
+        """ takes ( url, listing_type ) pages off the queue """
+
+        self.executemany( 'DELETE FROM listing_queue WHERE url = ? AND listing_type = ?', list( pages ) )
+
+    def find_card( self, card_url: str ) -> Optional[Card]:
+
+        """ finds a card by its URL in any cached page, most recently fetched first """
+
+        rows = self.execute(
+            'SELECT cards FROM listings WHERE instr(cards, ?) > 0 ORDER BY fetched DESC',
+            ( '"%s"' % card_url, )
+        )
+        for row in rows:
+            try:
+                for card in load_cards( row['cards'] ):
+                    if card.url == card_url:
+                        return card
+            except ( ValueError, TypeError, KeyError ):
+                continue
+        return None
+
+    def invalidate( self, url: str ) -> None:
+
+        """ drops the cached cards of a page """
+
+        self.execute( 'DELETE FROM listings WHERE url = ?', ( url, ) )
+
+    def invalidate_private( self ) -> int:
+
+        """ drops the cached cards of every page that depends on the logged in account, returns how many """
+
+        with self.transaction() as conn:
+            urls = [ row['url'] for row in conn.execute( 'SELECT DISTINCT url FROM listings' ).fetchall() if PRIVATE_PATTERN.search( row['url'] ) ]
+            conn.executemany( 'DELETE FROM listings WHERE url = ?', [ ( url, ) for url in urls ] )
+        return len( urls )
+
+
+LISTING_CACHE = ListingCache()
@@ -0,0 +1,281 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 8:16:55 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... livechat.py
+Description: ....... Streaming client for the live chat of Rumble live streams, reading the chat's event stream over one persistent connection into a bounded buffer.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.general (the shared requests session)
+Examples: .......... _
+ (1) chat = LiveChat('403302952')
+     chat.start()
+     seq = 0
+     while watching:
+        seq, messages = chat.wait_since(seq, timeout=1)
+        for message in messages:
+            print(message.user, message.text)
+     chat.stop()
+ (2) LiveChat('1', url_template='http://127.0.0.1:8000/chat/{chat_id}/stream') reads from a
+     local stand-in server.
+Notes: ............. _
+ (1) The chat endpoint is a server-sent event stream. Its 'init' event carries the recent
+     history, 'messages' events carry new messages; both are JSON with 'messages' and
+     'users' lists under 'data'.
+ (2) Messages are kept in a deque of CHAT_BUFFER entries, the oldest drop out. Readers ask
+     for the messages after the sequence number they last saw, so they only ever render
+     the new ones.
+ (3) Dropped connections are reopened after the server's 'retry' delay (CHAT_RETRY by
+     default) with Last-Event-ID; messages already seen are skipped by id. A 'retry' sent
+     in an event of its own is applied too. tools/livechat_check.py runs the client against
+     a local stand-in server.
+===========================================================================================
+"""
+
+import socket
+import threading
+
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import xbmc
+
+from lib.general import session
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# Event stream of a live stream's chat, by the numeric video id
+LIVE_CHAT_URL = 'https://web7.rumble.com/chat/api/chat/{chat_id}/stream'
+
+# Messages kept for readers, oldest dropped first
+CHAT_BUFFER = 500
+
+# Seconds before reconnecting when the server sent no retry delay
+CHAT_RETRY = 3.0
+
+# Connect and read timeouts in seconds, the server sends keep-alive comments between messages
+CHAT_TIMEOUT = (10, 60)
+
+
+class ChatMessage(NamedTuple):
+
+    """ a message of a live chat """
+
+    id: str
+    user: str
+    text: str
+    time: str
+
+
+class ChatEvent(NamedTuple):
+
+    """ one server-sent event """
+
+    event: str
+    data: str
+    id: str
+    retry: Optional[float]
+
+
+def parse_events(lines: Iterable[str]) -> Iterator[ChatEvent]:
+    """
+    Split the lines of an event stream into events as they arrive.
+
+    Args:
+        lines (Iterable[str]): The decoded lines of the stream, without line endings.
+
+    Returns:
+        Iterator[ChatEvent]: Each complete event. An event with only a 'retry' field comes
+        with empty data so the reconnect delay is still applied; other events without data
+        are skipped.
+    """
+    event, data, event_id, retry = '', [], '', None
+    for line in lines:
+        if not line:
+            if data or retry is not None:
+                yield ChatEvent(event or 'message', '\n'.join(data), event_id, retry)
+            event, data, retry = '', [], None
+            continue
+        if line.startswith(':'):
+            continue
+        field, _, value = line.partition(':')
+        if value.startswith(' '):
+            value = value[1:]
+        if field == 'event':
+            event = value
+        elif field == 'data':
+            data.append(value)
+        elif field == 'id':
+            event_id = value
+        elif field == 'retry' and value.isdigit():
+            retry = int(value) / 1000.0
+
+
+def chat_messages(data: str) -> List[ChatMessage]:
+    """
+    Get the chat messages of an event.
+
+    Args:
+        data (str): The event's JSON data.
+
+    Returns:
+        List[ChatMessage]: The messages with their user names, empty for other events.
+    """
+    try:
+        payload = json.loads(data).get('data') or {}
+    except (ValueError, AttributeError):
+        return []
+    users = {str(user.get('id')): user.get('username', '') for user in payload.get('users') or []}
+    return [
+        ChatMessage(
+            str(message.get('id', '')),
+            users.get(str(message.get('user_id')), ''),
+            message.get('text', ''),
+            message.get('time', ''),
+        )
+        for message in payload.get('messages') or []
+    ]
+
+
+class LiveChat:
+
+    """ reads a live chat on a background thread into a ring buffer """
+
+    def __init__( self, chat_id: str, url_template: str = LIVE_CHAT_URL, maxlen: int = CHAT_BUFFER ):
+
+        """ Construct for a chat id, the stream URL template and the buffer size """
+
+        self.url = url_template.format( chat_id=chat_id )
+        self.messages: Deque[Tuple[int, ChatMessage]] = deque( maxlen=maxlen )
+        self.seq = 0
+        self.connected = False
+        self._seen: Deque[str] = deque( maxlen=maxlen * 2 )
+        self._seen_ids = set()
+        self._last_event_id = ''
+        self._retry = CHAT_RETRY
+        self._response = None
+        self._stop = threading.Event()
+        self._changed = threading.Condition()
+        self._thread = None
+
+    def start( self ) -> None:
+
+        """ starts reading the chat """
+
+        if self._thread is None:
+            self._thread = threading.Thread( target=self._run, name='livechat', daemon=True )
+            self._thread.start()
+
+    def stop( self, timeout: float = 2 ) -> None:
+
+        """ stops reading and closes the connection """
+
+        self._stop.set()
+        self._interrupt()
+        with self._changed:
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join( timeout )
+
+    def since( self, seq: int ) -> Tuple[int, List[ChatMessage]]:
+
+        """ the latest sequence number and the buffered messages after seq """
+
+        with self._changed:
+            return self.seq, [ message for number, message in self.messages if number > seq ]
+
+    def wait_since( self, seq: int, timeout: float ) -> Tuple[int, List[ChatMessage]]:
+
+        """ like since, waiting up to timeout seconds for a message after seq """
+
+        with self._changed:
+            if self.seq <= seq and not self._stop.is_set():
+                self._changed.wait( timeout )
+        return self.since( seq )
+
+    def add( self, messages: Iterable[ChatMessage] ) -> int:
+
+        """ buffers the messages not seen before, returns how many were new """
+
+        added = 0
+        with self._changed:
+            for message in messages:
+                if message.id:
+                    if message.id in self._seen_ids:
+                        continue
+                    if len( self._seen ) == self._seen.maxlen:
+                        self._seen_ids.discard( self._seen[0] )
+                    self._seen.append( message.id )
+                    self._seen_ids.add( message.id )
+                self.seq += 1
+                self.messages.append( ( self.seq, message ) )
+                added += 1
+            if added:
+                self._changed.notify_all()
+        return added
+
+    def _interrupt( self ) -> None:
+
+        """ shuts the connection's socket down, which wakes the reader thread from a blocked read """
+
+        # closing the response here would wait for the read holding its buffer
+        connection = getattr( getattr( self._response, 'raw', None ), '_connection', None )
+        sock = getattr( connection, 'sock', None )
+        if sock is not None:
+            try:
+                sock.shutdown( socket.SHUT_RDWR )
+            except OSError:
+                pass
+
+    def _run( self ) -> None:
+
+        """ keeps a connection open until stopped """
+
+        while not self._stop.is_set():
+            try:
+                self._read()
+            except Exception as e:
+                if not self._stop.is_set():
+                    xbmc.log( f"[LiveChat] {self.url} dropped: {e}", xbmc.LOGDEBUG )
+            self.connected = False
+            self._stop.wait( self._retry )
+
+    def _read( self ) -> None:
+
+        """ reads one connection until it ends """
+
+        headers = { 'Accept': 'text/event-stream', 'Cache-Control': 'no-cache', 'User-Agent': 'Mozilla/5.0' }
+        if self._last_event_id:
+            headers['Last-Event-ID'] = self._last_event_id
+        self._response = session().get( self.url, headers=headers, stream=True, timeout=CHAT_TIMEOUT )
+        try:
+            if self._response.status_code != 200:
+                xbmc.log( f"[LiveChat] {self.url} answered {self._response.status_code}", xbmc.LOGDEBUG )
+                return
+            self.connected = True
+            # event streams are UTF-8 whatever the headers say
+            self._response.encoding = 'utf-8'
+            for event in parse_events( self._response.iter_lines( decode_unicode=True ) ):
+                if self._stop.is_set():
+                    return
+                if event.id:
+                    self._last_event_id = event.id
+                if event.retry is not None:
+                    self._retry = event.retry
+                if event.data:
+                    self.add( chat_messages( event.data ) )
+        finally:
+            self._response.close()
+            self._response = None
@@ -1,64 +1,316 @@
 # Auto updated?
 #   Yes
 # Modified:
-#   Sunday, March 2, 2025 8:08:51 PM PST
+#   Sunday, October 18, 2026 2:12:40 PM PDT
 #
 """
 The snippet above is from an Ext from TheRepoClub called File Header Generator
 ==========================================================================================
 Procedure: ......... m3u8.py
-Description: ....... Provides functionality to process M3U8 file content specifically for streaming live videos on Kodi. It has been refactored to work with PY3+ and utilizes Kodi's xbmc logging system.
-Version: ........... 1.0.0 - major.minor.patch
+Description: ....... Parses HLS master and media playlists (RFC 8216) into variant, rendition and segment records for streaming videos on Kodi.
+Version: ........... 2.0.0 - major.minor.patch
 Created: ........... 2025-03-02
-Updated: ........... 2025-03-02
+Updated: ........... 2026-10-18
 Module URL: ........ weburl
 Installs to: ....... plugin.video.rumbleinthejungle/lib
 Compatibility: ..... XBMC, Kodi 16+
 Contact Author: .... lundeen-bryan
 Copyright:  ........ n/a © 2025. All rights reserved.
-Parameters: ........ name(type): param_description
-Returns: ........... type param_description
-Preconditions: ..... precondition
-Calls To: .......... procedure
-Called By: ......... procedure
+Parameters: ........ text(str): playlist content, base_url(str): URL the playlist was loaded from
+Returns: ........... Playlist with variants, media renditions and segments
+Preconditions: ..... none
+Calls To: .......... parse_attributes
+Called By: ......... main.hls_renditions
 Examples: .......... _
- (1) examples_here
+ (1) playlist = parse_playlist(request_get(url), base_url=url)
+     for variant in playlist.variants:
+        print(variant.height, variant.bandwidth, variant.uri)
 Notes: ............. _
  (1) Changes to previous versions:
-     - Added type hints for improved clarity and maintainability.
-     - Replaced multiple pop() calls with slicing to skip the first two lines of the file.
-     - Utilized splitlines for robust and consisten line splitting.
-     - Procesed the M3U8 content lines in pairs to extract resolution and URL
-     - Integrated Kodi's xbmc.log for error logging during processing
-     - Reveresed the list of URLs to maintain the original behavior
+     - Replaced the (resolution line, URL line) pair reader with a line by line parser of
+       the tags, so EXT-X-MEDIA, EXT-X-INDEPENDENT-SEGMENTS, I-frame playlists, comments and
+       blank lines no longer shift the pairs.
+     - Variants keep BANDWIDTH, AVERAGE-BANDWIDTH, RESOLUTION, CODECS, FRAME-RATE and their
+       AUDIO/VIDEO/SUBTITLES groups; relative URIs are resolved against base_url.
+     - Audio-only variants (no RESOLUTION, audio codecs only) are flagged as audio_only.
+     - M3U8Processor.process is kept for callers of the old (height, URL) list.
 ===========================================================================================
 """
 import xbmc
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+
+# Codec prefixes that carry video; a variant listing only other codecs is audio-only
+VIDEO_CODECS = ('avc', 'hvc', 'hev', 'vp8', 'vp9', 'vp09', 'av01', 'mp4v', 'dvh')
+
+
+def parse_attributes(text: str) -> Dict[str, str]:
+    """
+    Parse an HLS attribute list such as 'BANDWIDTH=800000,CODECS="avc1.4d401f,mp4a.40.2"'.
+
+    Args:
+        text (str): The part of the tag line after the colon.
+
+    Returns:
+        Dict[str, str]: Attribute names to values, with quotes removed from quoted strings.
+
+    Example:
+        >>> parse_attributes('BANDWIDTH=800000,CODECS="avc1.4d401f,mp4a.40.2"')
+        {'BANDWIDTH': '800000', 'CODECS': 'avc1.4d401f,mp4a.40.2'}
+    """
+    attributes: Dict[str, str] = {}
+    i, length = 0, len(text)
+    while i < length:
+        equals = text.find('=', i)
+        if equals < 0:
+            break
+        name = text[i:equals].strip().strip(',').strip()
+        i = equals + 1
+        if i < length and text[i] == '"':
+            end = text.find('"', i + 1)
+            end = length if end < 0 else end
+            value = text[i + 1:end]
+            i = end + 1
+        else:
+            end = text.find(',', i)
+            end = length if end < 0 else end
+            value = text[i:end].strip()
+            i = end
+        attributes[name] = value
+        # skip the separating comma
+        if i < length and text[i] == ',':
+            i += 1
+    return attributes
+
+
+def _int(value: Optional[str]) -> int:
+    """ converts a decimal-integer attribute, 0 when missing or invalid """
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
+def _float(value: Optional[str]) -> float:
+    """ converts a decimal-floating-point attribute, 0.0 when missing or invalid """
+    try:
+        return float(value or 0)
+    except ValueError:
+        return 0.0
+
+
+class Variant(NamedTuple):
+
+    """ an EXT-X-STREAM-INF or EXT-X-I-FRAME-STREAM-INF entry of a master playlist """
+
+    uri: str
+    bandwidth: int
+    average_bandwidth: int = 0
+    width: int = 0
+    height: int = 0
+    codecs: str = ''
+    frame_rate: float = 0.0
+    audio: str = ''
+    video: str = ''
+    subtitles: str = ''
+    iframe: bool = False
+
+    @property
+    def audio_only(self) -> bool:
+        """ if the variant carries no video """
+        if self.height or self.width:
+            return False
+        codecs = [codec.strip().lower() for codec in self.codecs.split(',') if codec.strip()]
+        return bool(codecs) and not any(codec.startswith(VIDEO_CODECS) for codec in codecs)
+
+    @property
+    def bitrate(self) -> int:
+        """ the average bitrate in kbps when known, else the peak """
+        return (self.average_bandwidth or self.bandwidth) // 1000
+
+
+class Media(NamedTuple):
+
+    """ an EXT-X-MEDIA alternative rendition (audio track, subtitles, ...) """
+
+    type: str
+    group_id: str
+    name: str
+    uri: str = ''
+    language: str = ''
+    default: bool = False
+    autoselect: bool = False
+    channels: str = ''
+
+
+class Segment(NamedTuple):
+
+    """ a media segment of a media playlist """
+
+    uri: str
+    duration: float
+    sequence: int
+    title: str = ''
+    discontinuity: bool = False
+
+
+@dataclass
+class Playlist:
+
+    """ a parsed master or media playlist """
+
+    version: int = 1
+    independent_segments: bool = False
+    variants: List[Variant] = field(default_factory=list)
+    iframe_variants: List[Variant] = field(default_factory=list)
+    media: List[Media] = field(default_factory=list)
+    segments: List[Segment] = field(default_factory=list)
+    target_duration: int = 0
+    media_sequence: int = 0
+    playlist_type: str = ''
+    endlist: bool = False
+
+    @property
+    def is_master(self) -> bool:
+        """ if the playlist lists variant streams rather than segments """
+        return bool(self.variants or self.iframe_variants)
+
+    @property
+    def is_live(self) -> bool:
+        """ if this is a media playlist that is still being appended to """
+        return not self.is_master and not self.endlist and self.playlist_type != 'VOD'
+
+    @property
+    def duration(self) -> float:
+        """ total duration of the segments in seconds """
+        return sum(segment.duration for segment in self.segments)
+
+    def sorted_variants(self) -> List[Variant]:
+        """ the playable variants, highest resolution and bitrate first, audio-only last """
+        return sorted(
+            self.variants,
+            key=lambda v: (v.audio_only, -v.height, -v.bitrate)
+        )
+
+    def media_group(self, group_id: str, media_type: str = 'AUDIO') -> List[Media]:
+        """ the alternative renditions of one group, e.g. the audio tracks of a variant """
+        return [m for m in self.media if m.group_id == group_id and m.type == media_type]
+
+
+def _variant(attributes: Dict[str, str], uri: str, iframe: bool = False) -> Variant:
+    """ builds a Variant from the attributes of a stream tag """
+    width, _, height = attributes.get('RESOLUTION', '').lower().partition('x')
+    return Variant(
+        uri=uri,
+        bandwidth=_int(attributes.get('BANDWIDTH')),
+        average_bandwidth=_int(attributes.get('AVERAGE-BANDWIDTH')),
+        width=_int(width),
+        height=_int(height),
+        codecs=attributes.get('CODECS', ''),
+        frame_rate=_float(attributes.get('FRAME-RATE')),
+        audio=attributes.get('AUDIO', ''),
+        video=attributes.get('VIDEO', ''),
+        subtitles=attributes.get('SUBTITLES', ''),
+        iframe=iframe,
+    )
+
+
+def parse_playlist(text: str, base_url: str = '') -> Playlist:
+    """
+    Parse an HLS master or media playlist line by line.
+
+    Unknown tags and comments are ignored, as the specification requires.
+
+    Args:
+        text (str): The playlist content.
+        base_url (str, optional): The URL the playlist was loaded from, used to resolve relative URIs.
+
+    Returns:
+        Playlist: The variants, alternative renditions and segments of the playlist.
+    """
+    playlist = Playlist()
+    stream_info: Optional[Dict[str, str]] = None
+    segment_duration: Optional[float] = None
+    segment_title = ''
+    discontinuity = False
+    sequence = 0
+
+    for raw_line in (text or '').splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        if not line.startswith('#'):
+            uri = urljoin(base_url, line) if base_url else line
+            if stream_info is not None:
+                playlist.variants.append(_variant(stream_info, uri))
+                stream_info = None
+            elif segment_duration is not None:
+                playlist.segments.append(Segment(uri, segment_duration, sequence, segment_title, discontinuity))
+                sequence += 1
+                segment_duration, segment_title, discontinuity = None, '', False
+            continue
+
+        if not line.startswith('#EXT'):
+            continue
+        tag, _, value = line.partition(':')
+
+        try:
+            if tag == '#EXT-X-STREAM-INF':
+                stream_info = parse_attributes(value)
+            elif tag == '#EXT-X-I-FRAME-STREAM-INF':
+                attributes = parse_attributes(value)
+                uri = attributes.get('URI', '')
+                playlist.iframe_variants.append(
+                    _variant(attributes, urljoin(base_url, uri) if base_url else uri, iframe=True)
+                )
+            elif tag == '#EXT-X-MEDIA':
+                attributes = parse_attributes(value)
+                uri = attributes.get('URI', '')
+                playlist.media.append(Media(
+                    type=attributes.get('TYPE', ''),
+                    group_id=attributes.get('GROUP-ID', ''),
+                    name=attributes.get('NAME', ''),
+                    uri=urljoin(base_url, uri) if base_url and uri else uri,
+                    language=attributes.get('LANGUAGE', ''),
+                    default=attributes.get('DEFAULT') == 'YES',
+                    autoselect=attributes.get('AUTOSELECT') == 'YES',
+                    channels=attributes.get('CHANNELS', ''),
+                ))
+            elif tag == '#EXTINF':
+                duration, _, segment_title = value.partition(',')
+                segment_duration = _float(duration)
+            elif tag == '#EXT-X-VERSION':
+                playlist.version = _int(value)
+            elif tag == '#EXT-X-INDEPENDENT-SEGMENTS':
+                playlist.independent_segments = True
+            elif tag == '#EXT-X-TARGETDURATION':
+                playlist.target_duration = _int(value)
+            elif tag == '#EXT-X-MEDIA-SEQUENCE':
+                playlist.media_sequence = sequence = _int(value)
+            elif tag == '#EXT-X-PLAYLIST-TYPE':
+                playlist.playlist_type = value.strip()
+            elif tag == '#EXT-X-DISCONTINUITY':
+                discontinuity = True
+            elif tag == '#EXT-X-ENDLIST':
+                playlist.endlist = True
+        except Exception as e:
+            xbmc.log(f"Error processing M3U8 line '{line}': {e}", level=xbmc.LOGERROR)
+
+    return playlist
+
 
 class M3U8Processor:
-    def process(self, m3u8_data: str) -> List[Tuple[str, str]]:
+    def process(self, m3u8_data: str, base_url: str = '') -> List[Tuple[str, str]]:
         """
-        Process the M3U8 file content and return a list of tuples (resolution, URL).
+        Process the M3U8 file content and return a list of tuples (height, URL), highest first.
+
+        Kept for callers of the original pair based reader, new code should use parse_playlist.
         """
-        urls: List[Tuple[str, str]] = []
-        # Use strip() and splitlines() for robust line splitting
-        lines = m3u8_data.strip().splitlines()
-        # Skip the first two lines (if present)
-        content_lines = lines[2:] if len(lines) > 2 else []
-
-        # Process lines in pairs (first line: resolution, second line: URL)
-        for i in range(0, len(content_lines) - 1, 2):
-            try:
-                resolution_line = content_lines[i]
-                url_line = content_lines[i + 1]
-                # Extract resolution from the resolution line (e.g., "1920x1080" -> "1080")
-                resolution_parts = resolution_line.split('x')
-                resolution = resolution_parts[-1].strip() if resolution_parts else ''
-                urls.append((resolution, url_line.strip()))
-            except Exception as e:
-                xbmc.log(f"Error processing pair starting at line {i}: {e}", level=xbmc.LOGERROR)
-
-        # Reverse the list to maintain the original behavior (if required)
-        urls.reverse()
-        return urls
+        playlist = parse_playlist(m3u8_data, base_url)
+        return [
+            (str(variant.height) if variant.height else '', variant.uri)
+            for variant in playlist.sorted_variants()
+            if not variant.audio_only
+        ]
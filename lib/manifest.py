@@ -0,0 +1,322 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 1:34:09 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... manifest.py
+Description: ....... Parses the Rumble embedJS video API response into a typed `StreamManifest` of every mp4/webm/hls rendition.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage
+Examples: .......... _
+ (1) from lib.manifest import StreamManifest
+     manifest = StreamManifest.from_json(request_get(embed_url), video_id)
+     best = manifest.playable()[0]
+     print(best.label, best.bitrate, best.url)
+Notes: ............. _
+ (1) The response is parsed once with json.loads instead of one regex per quality, and the
+     URLs come back already unescaped.
+ (2) Renditions are read from 'ua' (every quality per container, with bitrate, size and
+     dimensions in 'meta') and from 'u' (one default URL per container) as a fallback.
+ (3) MANIFEST_CACHE keeps resolved manifests by video id until their signed URLs expire or
+     the configured lifetime passes, so replaying a video skips the API call. Live streams
+     are never cached.
+===========================================================================================
+"""
+
+import time
+
+from dataclasses import asdict, dataclass, field
+from typing import List, NamedTuple, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from lib.storage import Database
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# Containers Kodi can play directly, in order of preference
+PROGRESSIVE_CONTAINERS = ('mp4', 'webm')
+
+# Query parameters holding the unix time a signed URL stops working
+EXPIRY_PARAMS = ('expires', 'Expires', 'exp', 'e')
+
+
+def _int(value) -> int:
+    """ converts an API number to int, 0 when missing or invalid """
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def url_expiry(url: str) -> Optional[float]:
+    """
+    Get the expiry time from the signature parameters of a media URL.
+
+    Args:
+        url (str): The media URL.
+
+    Returns:
+        Optional[float]: The unix time the URL expires, or None when the URL carries no expiry.
+
+    Example:
+        >>> url_expiry('https://hugh.cdn.rumble.cloud/video/x.mp4?expires=1760000000&sig=abc')
+        1760000000.0
+    """
+    query = parse_qs(urlsplit(url).query)
+    for name in EXPIRY_PARAMS:
+        values = query.get(name)
+        if values and values[0].isdigit():
+            return float(values[0])
+    return None
+
+
+class Rendition(NamedTuple):
+
+    """ one playable version of a video """
+
+    container: str
+    label: str
+    url: str
+    height: int = 0
+    width: int = 0
+    bitrate: int = 0
+    size: int = 0
+    codecs: str = ''
+
+    @property
+    def is_hls( self ) -> bool:
+
+        """ if this is an HLS playlist rather than a single file """
+
+        return self.container == 'hls' or '.m3u8' in self.url
+
+    def describe( self ) -> str:
+
+        """ label for the quality selection dialog, e.g. '720p - 2100 kbps (MP4)' """
+
+        if self.height:
+            text = '%dp' % self.height
+        elif self.is_hls:
+            text = 'Auto' if self.label in ( 'hls', 'auto' ) else self.label
+        else:
+            text = self.label
+        if self.bitrate:
+            text += ' - %d kbps' % self.bitrate
+        return text + ' (%s)' % self.container.upper()
+
+
+@dataclass
+class StreamManifest:
+
+    """ the renditions and live state of a video from the embedJS API """
+
+    video_id: str
+    renditions: List[Rendition] = field(default_factory=list)
+    live: int = 0
+    duration: int = 0
+    title: str = ''
+    thumb: str = ''
+
+    @classmethod
+    def from_json( cls, text: str, video_id: str = '' ) -> Optional['StreamManifest']:
+
+        """ parses the API response, None when it is not a video object """
+
+        try:
+            data = json.loads( text ) if text else None
+        except ValueError:
+            return None
+        if not isinstance( data, dict ):
+            return None
+        return cls.from_dict( data, video_id )
+
+    @classmethod
+    def from_cache( cls, text: str ) -> 'StreamManifest':
+
+        """ rebuilds a manifest saved with to_cache """
+
+        data = json.loads( text )
+        data['renditions'] = [ Rendition( *rendition ) for rendition in data['renditions'] ]
+        return cls( **data )
+
+    def to_cache( self ) -> str:
+
+        """ serialises the manifest for ManifestCache """
+
+        return json.dumps( asdict( self ) )
+
+    @classmethod
+    def from_dict( cls, data: dict, video_id: str = '' ) -> 'StreamManifest':
+
+        """ builds the manifest from the decoded API response """
+
+        renditions = []
+        seen = set()
+
+        for container, qualities in ( data.get( 'ua' ) or {} ).items():
+            if not isinstance( qualities, dict ):
+                continue
+            for label, info in qualities.items():
+                if not isinstance( info, dict ) or not info.get( 'url' ) or info['url'] in seen:
+                    continue
+                meta = info.get( 'meta' ) or {}
+                seen.add( info['url'] )
+                renditions.append( Rendition(
+                    container=container,
+                    label=str( label ),
+                    url=info['url'],
+                    height=_int( meta.get( 'h' ) ) or ( _int( label ) if str( label ).isdigit() else 0 ),
+                    width=_int( meta.get( 'w' ) ),
+                    bitrate=_int( meta.get( 'bitrate' ) ),
+                    size=_int( meta.get( 'size' ) ),
+                    codecs=str( meta.get( 'codecs' ) or meta.get( 'codec' ) or '' ),
+                ) )
+
+        # 'u' only holds one URL per container, used when 'ua' is missing
+        for container, info in ( data.get( 'u' ) or {} ).items():
+            if not isinstance( info, dict ) or not info.get( 'url' ) or info['url'] in seen:
+                continue
+            meta = info.get( 'meta' ) or {}
+            seen.add( info['url'] )
+            renditions.append( Rendition(
+                container=container,
+                label=container,
+                url=info['url'],
+                height=_int( meta.get( 'h' ) ),
+                width=_int( meta.get( 'w' ) ),
+                bitrate=_int( meta.get( 'bitrate' ) ),
+                size=_int( meta.get( 'size' ) ),
+            ) )
+
+        return cls(
+            video_id=str( video_id ),
+            renditions=renditions,
+            live=_int( data.get( 'live' ) ),
+            duration=_int( data.get( 'duration' ) ),
+            title=str( data.get( 'title' ) or '' ),
+            thumb=str( data.get( 'i' ) or '' ),
+        )
+
+    @property
+    def is_live( self ) -> bool:
+
+        """ if the video is a stream, any non-zero live value counts so a stream is never cached by mistake """
+
+        return self.live != 0
+
+    @property
+    def expires( self ) -> Optional[float]:
+
+        """ the earliest expiry of the signed rendition URLs, None when they do not expire """
+
+        expiries = [ expiry for expiry in ( url_expiry( r.url ) for r in self.renditions ) if expiry ]
+        return min( expiries ) if expiries else None
+
+    def is_expired( self, margin: int = 60 ) -> bool:
+
+        """ if a signed URL expires within the margin in seconds """
+
+        expires = self.expires
+        return expires is not None and expires - margin <= time.time()
+
+    def progressive( self ) -> List[Rendition]:
+
+        """ single file renditions, highest first, preferring mp4 over webm at the same height """
+
+        files = [ r for r in self.renditions if r.container in PROGRESSIVE_CONTAINERS and not r.is_hls ]
+        files.sort( key=lambda r: ( -r.height, PROGRESSIVE_CONTAINERS.index( r.container ), -r.bitrate ) )
+
+        heights = set()
+        unique = []
+        for rendition in files:
+            if rendition.height and rendition.height in heights:
+                continue
+            heights.add( rendition.height )
+            unique.append( rendition )
+        return unique
+
+    def hls( self ) -> Optional[Rendition]:
+
+        """ the HLS master playlist, if any """
+
+        for rendition in self.renditions:
+            if rendition.is_hls:
+                return rendition
+        return None
+
+    def playable( self ) -> List[Rendition]:
+
+        """ every rendition offered to the user: single files highest first, then HLS """
+
+        renditions = self.progressive()
+        hls = self.hls()
+        if hls:
+            renditions.append( hls )
+        return renditions
+
+
+class ManifestCache(Database):
+
+    """ resolved stream manifests by video id """
+
+    filename = 'cache.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS manifests ('
+        ' video_id TEXT PRIMARY KEY, manifest TEXT NOT NULL, expires REAL NOT NULL)',
+    )
+
+    def get( self, video_id: str ) -> Optional[StreamManifest]:
+
+        """ gets a cached manifest that has not expired """
+
+        rows = self.execute(
+            'SELECT manifest FROM manifests WHERE video_id = ? AND expires > ?',
+            ( str( video_id ), time.time() )
+        )
+        if not rows:
+            return None
+        try:
+            return StreamManifest.from_cache( rows[0]['manifest'] )
+        except ( ValueError, TypeError, KeyError ):
+            self.invalidate( video_id )
+            return None
+
+    def put( self, manifest: StreamManifest, ttl: int ) -> None:
+
+        """
+        stores a manifest until the earlier of the lifetime in seconds and one minute before
+        its signed URLs expire, live streams and empty manifests are not stored
+        """
+
+        if ttl <= 0 or manifest.is_live or not manifest.renditions:
+            return
+        expires = time.time() + ttl
+        if manifest.expires:
+            expires = min( expires, manifest.expires - 60 )
+        self.execute( 'DELETE FROM manifests WHERE expires <= ?', ( time.time(), ) )
+        if expires > time.time():
+            self.execute(
+                'INSERT OR REPLACE INTO manifests (video_id, manifest, expires) VALUES (?, ?, ?)',
+                ( manifest.video_id, manifest.to_cache(), expires )
+            )
+
+    def invalidate( self, video_id: str ) -> None:
+
+        """ drops the cached manifest of a video """
+
+        self.execute( 'DELETE FROM manifests WHERE video_id = ?', ( str( video_id ), ) )
+
+
+MANIFEST_CACHE = ManifestCache()
@@ -0,0 +1,141 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 12:58:16 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... metadata.py
+Description: ....... Provides `VideoIndex`, a persistent map of Rumble video page URLs to their numeric video ids, and `SubscriptionState`, the subscribe/unsubscribe actions taken in the add-on.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage
+Examples: .......... _
+ (1) from lib.metadata import VIDEO_INDEX
+     VIDEO_INDEX.put('https://rumble.com/v6abc-title.html', 403302952)
+     VIDEO_INDEX.get('https://rumble.com/v6abc-title.html?e9s=src_v1_ucp')  # '403302952'
+Notes: ............. _
+ (1) Playing a video, opening its comments and the Watch Later actions all need the numeric id,
+     which otherwise means downloading the whole video page. Listing pages expose the id on
+     every card, so the index is filled while browsing and consulted before any page fetch.
+ (2) SUBSCRIPTIONS remembers channels subscribed or unsubscribed from the add-on, so listings
+     parsed before the change still show the right context menu item.
+===========================================================================================
+"""
+
+import time
+
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from lib.storage import Database
+
+# Rows kept before the least recently seen ids are dropped
+VIDEO_INDEX_MAX_ROWS = 50000
+
+# Seconds a subscribe/unsubscribe action overrides parsed listings
+SUBSCRIPTION_OVERRIDE_TTL = 24 * 60 * 60
+
+
+def canonical_video_url(url: str) -> str:
+    """
+    Strip the query string and fragment from a video page URL so tracking parameters do not
+    create separate entries.
+
+    Args:
+        url (str): The video page URL.
+
+    Returns:
+        str: The URL without query string or fragment.
+
+    Example:
+        >>> canonical_video_url('https://rumble.com/v6abc-title.html?e9s=src_v1_ucp#comments')
+        'https://rumble.com/v6abc-title.html'
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+class VideoIndex(Database):
+
+    """ video page URL to numeric video id """
+
+    filename = 'metadata.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS video_ids ('
+        ' url TEXT PRIMARY KEY, video_id INTEGER NOT NULL, seen REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS video_ids_seen ON video_ids (seen)',
+    )
+
+    def get( self, url: str ) -> Optional[str]:
+
+        """ gets the video id for a URL, as a string like the page parsers return """
+
+        rows = self.execute( 'SELECT video_id FROM video_ids WHERE url = ?', ( canonical_video_url( url ), ) )
+        return str( rows[0]['video_id'] ) if rows else None
+
+    def put( self, url: str, video_id ) -> None:
+
+        """ stores the video id of a URL """
+
+        self.put_many( ( ( url, video_id ), ) )
+
+    def put_many( self, pairs: Iterable[Tuple[str, int]] ) -> None:
+
+        """ stores (url, video id) pairs in one transaction, ignoring empty ids """
+
+        now = time.time()
+        rows = [ ( canonical_video_url( url ), int( video_id ), now ) for url, video_id in pairs if video_id ]
+        if not rows:
+            return
+        self.executemany( 'INSERT OR REPLACE INTO video_ids (url, video_id, seen) VALUES (?, ?, ?)', rows )
+        self.prune()
+
+    def prune( self, max_rows: int = VIDEO_INDEX_MAX_ROWS ) -> None:
+
+        """ drops the least recently seen ids over the row limit """
+
+        self.execute(
+            'DELETE FROM video_ids WHERE url IN'
+            ' (SELECT url FROM video_ids ORDER BY seen DESC LIMIT -1 OFFSET ?)',
+            ( max_rows, )
+        )
+
+
+VIDEO_INDEX = VideoIndex()
+
+
+class SubscriptionState(Database):
+
+    """ channels subscribed or unsubscribed from the add-on, by channel path """
+
+    filename = 'metadata.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS subscriptions ('
+        ' path TEXT PRIMARY KEY, subscribed INTEGER NOT NULL, updated REAL NOT NULL)',
+    )
+
+    def set( self, path: str, subscribed: bool ) -> None:
+
+        """ records a subscribe or unsubscribe action """
+
+        self.execute(
+            'INSERT OR REPLACE INTO subscriptions (path, subscribed, updated) VALUES (?, ?, ?)',
+            ( path, int( subscribed ), time.time() )
+        )
+
+    def overrides( self ) -> Dict[str, bool]:
+
+        """ the recent actions, channel path to whether it is now subscribed """
+
+        self.execute( 'DELETE FROM subscriptions WHERE updated < ?', ( time.time() - SUBSCRIPTION_OVERRIDE_TTL, ) )
+        return { row['path']: bool( row['subscribed'] ) for row in self.execute( 'SELECT path, subscribed FROM subscriptions' ) }
+
+
+SUBSCRIPTIONS = SubscriptionState()
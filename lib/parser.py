@@ -0,0 +1,416 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 10:14:02 AM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... parser.py
+Description: ....... Single pass extraction of listing cards (videos, channels, categories) from Rumble HTML pages into lib.cards records, and of comment threads.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.general and lib.cards
+Examples: .......... _
+ (1) from lib.parser import parse_cards
+     for card in parse_cards(html_data, 'subscriptions'):
+        print(card.title, card.url)
+Notes: ............. _
+ (1) Every layout has one precompiled scanner. A scanner is a single alternation of all
+     the tokens a card can contain plus the token that starts a new card, so the page is
+     walked once with finditer instead of split and re-searched with one regex per field.
+ (2) Like the regexes it replaces, the first occurrence of a field inside a card wins.
+ (3) scan_cards yields the raw field values, parse_cards turns them into VideoCard,
+     ChannelCard and CategoryCard records.
+ (4) scan_comments walks the comment.list HTML the same way, counting <ul> levels to tell
+     replies from top level comments, so long threads are read in linear time.
+===========================================================================================
+"""
+
+import re
+
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+from lib.cards import Card, CategoryCard, ChannelCard, VideoCard
+from lib.general import clean_text, duration_to_secs
+
+BASE_URL = 'https://rumble.com'
+
+
+class CardScanner:
+
+    """ single pass scanner for one listing layout """
+
+    def __init__( self, boundary: str, tokens: Tuple[str, ...], section: Optional[Tuple[str, str]] = None ):
+
+        """
+        Construct the scanner.
+
+        Args:
+            boundary (str): Literal text that starts a new card.
+            tokens (tuple): Regexes for the fields of a card. Each one names the values it
+                            captures, e.g. r'<h3[^>]*>(?P<title>.*?)</h3>'.
+            section (tuple, optional): (start regex, end literal) bounding the part of the page
+                                       that holds the cards, from the first start to the last end.
+        """
+
+        self.boundary = boundary
+        self.tokens = tokens
+        self.section = section
+        self.fields = {}
+        self.pattern = None
+        self.section_start = None
+        self.section_end = section[1] if section else None
+
+    def compile( self ) -> None:
+
+        """ compiles the scanner's regexes, done on first use so importing the module stays cheap """
+
+        alternatives = [ '(?P<_card>' + re.escape( self.boundary ) + ')' ]
+        fields = {}
+        for index, token in enumerate( self.tokens ):
+            key = '_t%d' % index
+            alternatives.append( '(?P<%s>%s)' % ( key, token ) )
+            fields[key] = tuple( re.compile( token ).groupindex )
+
+        self.fields = fields
+        if self.section:
+            self.section_start = re.compile( self.section[0], re.DOTALL | re.IGNORECASE )
+        # set last, a scanner with a pattern is ready for other threads
+        self.pattern = re.compile( '|'.join( alternatives ), re.DOTALL | re.IGNORECASE )
+
+    def bounds( self, html_data: str ) -> Optional[Tuple[int, int]]:
+
+        """ gets the start and end position of the card section """
+
+        if self.pattern is None:
+            self.compile()
+
+        if not self.section_start:
+            return 0, len( html_data )
+
+        start = self.section_start.search( html_data )
+        if not start:
+            return None
+
+        end = html_data.rfind( self.section_end )
+        if end < start.end():
+            return None
+
+        return start.end(), end
+
+    def scan( self, html_data: str ) -> Iterator[Dict[str, str]]:
+
+        """ yields one dictionary of field values per card """
+
+        bounds = self.bounds( html_data )
+        if not bounds:
+            return
+
+        card = None
+        seen = set()
+        for match in self.pattern.finditer( html_data, *bounds ):
+            key = match.lastgroup
+            if key == '_card':
+                if card is not None:
+                    yield card
+                card = {}
+                seen = set()
+            elif card is not None and key not in seen:
+                seen.add( key )
+                for name in self.fields[key]:
+                    card[name] = match.group( name )
+
+        if card is not None:
+            yield card
+
+
+# Fields shared by the thumbnail grid layouts
+GRID_TOKENS = (
+    r'data-video-id="(?P<video_id>[0-9]+)"',
+    r'<h3(?:[^>]+)?>(?P<title>.*?)</h3>',
+    r'<a\sclass="videostream__link link"\sdraggable="false"\shref="(?P<link>[^"]+)">',
+    r'<img\s*class="thumbnail__image"\s*draggable="false"\s*src="(?P<img>[^"]+)"',
+    r'(?P<live>videostream__status--live)',
+    r'(?P<upcoming>videostream__status--upcoming)',
+    r'videostream__status--duration"\s*>(?P<duration>[^<]+)</div>',
+    r'<span\sclass="channel__name(?:[^"]+)" title="(?:[^"]+)">(?P<channel>[^<]+)</span>(?P<channel_verified>\s*<svg class=channel__verified)?',
+    r'<a\s*rel="author"\s*class="channel__link\slink\s(?:[^"]+)"\s*href="(?P<channel_link>[^"]+)"\s*>',
+    r'<time\s*class="(?:[^"]+)"\s*datetime="(?P<datetime>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[-+]\d{2}:\d{2})"',
+)
+
+GRID_SCANNER = CardScanner(
+    '"videostream thumbnail__grid-',
+    GRID_TOKENS,
+    ( r'<ol\s*class="thumbnail__grid">', '</ol>' )
+)
+
+LIVE_STREAM_SCANNER = CardScanner(
+    '"videostream thumbnail__grid-',
+    GRID_TOKENS,
+    ( r'<div class="thumbnail__grid"\s*role="list">', '<nav class="paginator">' )
+)
+
+PLAYLIST_SCANNER = CardScanner(
+    '"videostream videostream__list-item',
+    GRID_TOKENS,
+    ( r'<ol\s*class="videostream__list"(?:[^>]+)>', '</ol>' )
+)
+
+FOLLOWING_SCANNER = CardScanner(
+    '"followed-channel flex items-',
+    (
+        r'<span\s*class="line-clamp-2">(?P<title>[^<]+)</span>',
+        r'<div\s*class="followed-channel__followers(?:[^"]+)">(?P<followers>[^<]+)</div>',
+        r'<a\s*class="(?:[^"]+)"\s*href="(?P<link>/(?:c|user)/[^"]+)"\s*>',
+        r'<(?:img|span)\s*class="channel__avatar(?P<avatar_class>[^"]+)"\s*(?:src="(?P<img>[^"]+)")?',
+        r'(?P<verified><use href="#channel_verified" />)',
+    ),
+    ( r'<ol\s*class="followed-channels__list">', '</ol>' )
+)
+
+CHANNEL_SCANNER = CardScanner(
+    '<article',
+    (
+        r'<a\shref=(?P<link>[^\s]+)\sclass="(?:[^"]+)">',
+        r'<span\sclass="block\struncate">(?P<title>[^<]+)</span>',
+        r'(?P<verified><title>Verified</title>)',
+        r'<span\sclass="(?:[^"]+)">\s+(?P<followers>[^&<]+)&nbsp;Follower(?:s)?\s+</span>',
+        r'user-image--img--id-(?P<img_id>[^\s]+)\s',
+    ),
+    ( r'<div class="main-and-sidebar">', '<nav class="paginator">' )
+)
+
+# The older search / leaderboard layout keeps all fields of a card in one fixed order
+VIDEO_PATTERN = re.compile(
+    r'href="(?P<link>[^"]+)"><div class="(?:[^"]+)"><img\s*class="video-item--img"\s*src="(?P<img>[^"]+)"\s*alt="(?:[^"]+)"\s*>(?:<span class="video-item--watching">[^<]+</span>)?(?:<div class=video-item--overlay-rank>(?:[0-9]+)</div>)?</div><(?:[^>]+)></span></a><div class="video-item--info"><time class="video-item--meta video-item--time" datetime=(?P<year>.+?)-(?P<month>.+?)-(?P<day>.+?)T(?:.+?) title="(?:[^"]+)">(?:[^<]+)</time><h3 class=video-item--title>(?P<title>.+?)</h3><address(?:[^>]+)><a rel=author class="(?:[^=]+)=(?P<channel_link>.+?)><div class=ellipsis-1>(?P<channel>.+?)</div>',
+    re.MULTILINE | re.DOTALL | re.IGNORECASE
+)
+
+CATEGORY_PATTERN = re.compile(
+    r'<a\s*class="category__link link"\s*href="(?P<link>[^"]+)"\s*>\s*<img\s*class="category__image"\s*src="(?P<img>[^"]+)"\s*alt=(?:[^>]+)>\s*<strong class="category__title">(?P<title>[^<]+)</strong>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# CSS rules holding the avatar of each channel in the channel search results
+USER_IMAGE_PATTERN = re.compile(
+    r'i\.user-image--img--id-(?P<img_id>[^\s{.]+)[^{]*\{\s*background-image:\s*url\((?P<url>[^)]*)\);',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Tokens of a comment thread: list levels, the author link, the time link and the text
+COMMENT_PATTERN = re.compile(
+    r'(?P<_open><ul\b)'
+    r'|(?P<_close></ul>)'
+    r'|<a\s+class="comments-meta-author"\s+href="(?P<author_url>[^"]+)"[^>]*>(?P<author_name>[^<]+)</a>'
+    r"|<a\s+class='comments-meta-post-time'\s+href='#comment-(?P<comment_id>[0-9]+)'\s+title='(?P<title>[^']*)'[^>]*>(?P<post_time_ago>[^<]+)</a>"
+    r'|<p\s+class="comment-text"[^>]*>(?P<comment_text>.*?)</p>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Full date in the title of a comment's time link, e.g. 'Monday, March 3, 2025 10:05 AM -0500'
+COMMENT_DATE_PATTERN = re.compile(
+    r'(?P<post_day>[^,]+),\s*(?P<post_month>\S+)\s+(?P<post_date>[0-9]+),\s*(?P<post_year>[0-9]+)'
+    r'\s+(?P<post_hour>[0-9]+):(?P<post_minute>[0-9]+)\s*(?P<post_meridiem>AM|PM)',
+    re.IGNORECASE
+)
+
+# Line breaks and other tags inside a comment's text
+COMMENT_BREAK_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+COMMENT_DATE_FIELDS = ('post_day', 'post_month', 'post_date', 'post_year', 'post_hour', 'post_minute', 'post_meridiem')
+
+GRID_SCANNERS = {
+    'cat_video': GRID_SCANNER,
+    'subscriptions': GRID_SCANNER,
+    'channel_video': GRID_SCANNER,
+    'live_stream': LIVE_STREAM_SCANNER,
+    'playlist': PLAYLIST_SCANNER,
+}
+
+
+def scan_user_images(html_data: str) -> Dict[str, str]:
+    """
+    Collect the channel avatar URLs from the CSS rules of a channel search page in one pass.
+
+    Args:
+        html_data (str): The HTML content of the page.
+
+    Returns:
+        dict: Image URLs keyed by the id used in the 'user-image--img--id-{id}' CSS class.
+    """
+    images = {}
+    for match in USER_IMAGE_PATTERN.finditer(html_data):
+        images.setdefault(match.group('img_id'), match.group('url'))
+    return images
+
+
+def scan_cards(html_data: str, listing_type: str) -> Iterator[Dict[str, str]]:
+    """
+    Walk a listing page once and yield the fields of every card on it.
+
+    Args:
+        html_data (str): The HTML content of the listing page.
+        listing_type (str): The layout of the page. Supported types include 'video', 'cat_video',
+            'subscriptions', 'live_stream', 'channel_video', 'playlist', 'cat_list', 'following';
+            any other type is treated as a channel search page.
+
+    Returns:
+        Iterator[dict]: One dictionary per card, keyed by field name (e.g. 'title', 'link', 'img').
+                        Fields missing from a card are absent or None.
+    """
+    if not html_data:
+        return iter(())
+
+    if listing_type == 'video':
+        return (match.groupdict() for match in VIDEO_PATTERN.finditer(html_data))
+    if listing_type == 'cat_list':
+        return (match.groupdict() for match in CATEGORY_PATTERN.finditer(html_data))
+    if listing_type in GRID_SCANNERS:
+        return GRID_SCANNERS[listing_type].scan(html_data)
+    if listing_type == 'following':
+        return FOLLOWING_SCANNER.scan(html_data)
+    return CHANNEL_SCANNER.scan(html_data)
+
+
+def scan_comments(html_data: str) -> Iterator[Dict[str, object]]:
+    """
+    Walk the HTML of a comment thread once and yield the fields of every comment, replies
+    directly after the comment they answer.
+
+    Args:
+        html_data (str): The 'html' of a comment.list response.
+
+    Returns:
+        Iterator[dict]: One dictionary per comment with the fields of lib.comments.Comment:
+                        'author_url', 'author_name', 'comment_id', the post date parts, 'post_time_ago',
+                        'comment_text', 'depth' (0 for top level comments) and 'parent_id'.
+    """
+    if not html_data:
+        return
+
+    level = 0
+    base_level = None
+    ancestors = []
+    comment = None
+    for match in COMMENT_PATTERN.finditer(html_data):
+        if match.group('_open'):
+            level += 1
+        elif match.group('_close'):
+            level -= 1
+        elif match.group('author_url') is not None:
+            if base_level is None:
+                base_level = level
+            comment = {
+                'author_url': match.group('author_url'),
+                'author_name': clean_text(match.group('author_name')),
+                'comment_id': '',
+                'depth': max(level - base_level, 0),
+            }
+        elif comment is None:
+            continue
+        elif match.group('comment_id') is not None:
+            date = COMMENT_DATE_PATTERN.match(match.group('title'))
+            comment['comment_id'] = match.group('comment_id')
+            comment.update((field, date.group(field) if date else '') for field in COMMENT_DATE_FIELDS)
+            comment['post_time_ago'] = clean_text(match.group('post_time_ago'))
+        else:
+            text = TAG_PATTERN.sub('', COMMENT_BREAK_PATTERN.sub('\n', match.group('comment_text')))
+            comment['comment_text'] = clean_text(text)
+            for field in COMMENT_DATE_FIELDS + ('post_time_ago',):
+                comment.setdefault(field, '')
+            depth = comment['depth']
+            del ancestors[depth:]
+            comment['parent_id'] = ancestors[-1] if ancestors else ''
+            # a reply whose parent was not found counts as top level
+            comment['depth'] = len(ancestors)
+            ancestors.append(comment['comment_id'])
+            yield comment
+            comment = None
+
+
+def _published(card: Dict[str, str]) -> Optional[datetime]:
+    """ gets the upload time of a scanned video, dates without an offset are taken as UTC """
+    try:
+        if card.get('datetime'):
+            return datetime.fromisoformat(card['datetime'])
+        if card.get('year'):
+            return datetime(int(card['year']), int(card['month']), int(card['day']), tzinfo=timezone.utc)
+    except ValueError:
+        pass
+    return None
+
+
+def _video_card(card: Dict[str, str]) -> VideoCard:
+    """ builds a VideoCard from the fields of a scanned video """
+    channel = card.get('channel') or ''
+    verified = bool(card.get('channel_verified'))
+    if '<svg' in channel:
+        channel, verified = channel.split('<svg')[0], True
+    return VideoCard(
+        url=BASE_URL + card['link'],
+        video_id=int(card.get('video_id') or 0),
+        title=clean_text(card.get('title') or ''),
+        channel=clean_text(channel),
+        channel_url=card.get('channel_link') or '',
+        published=_published(card),
+        duration=int(duration_to_secs((card.get('duration') or '').strip(), '0')),
+        thumb=card.get('img') or '',
+        live=bool(card.get('live')),
+        upcoming=bool(card.get('upcoming')),
+        verified=verified,
+    )
+
+
+def parse_cards(html_data: str, listing_type: str) -> Iterator[Card]:
+    """
+    Walk a listing page once and yield a typed card for every entry on it.
+
+    Args:
+        html_data (str): The HTML content of the listing page.
+        listing_type (str): The layout of the page, see scan_cards.
+
+    Returns:
+        Iterator[Card]: VideoCard for video layouts, ChannelCard for 'following' and channel
+                        search pages, CategoryCard for 'cat_list'. Cards without a link are skipped.
+    """
+    if listing_type == 'cat_list':
+        for card in scan_cards(html_data, listing_type):
+            yield CategoryCard(
+                url=BASE_URL + card['link'].strip() + '/videos',
+                title=clean_text(card['title']),
+                thumb=card['img'],
+            )
+    elif listing_type == 'video' or listing_type in GRID_SCANNERS:
+        for card in scan_cards(html_data, listing_type):
+            if card.get('link'):
+                yield _video_card(card)
+    else:
+        following = listing_type == 'following'
+        user_images = None
+        for card in scan_cards(html_data, listing_type):
+            path = card.get('link') or ''
+            avatar_class = card.get('avatar_class') or ''
+            thumb = '' if 'channel__letter' in avatar_class else card.get('img') or ''
+            if card.get('img_id'):
+                # avatars live in one style block, collect them all in a single pass
+                if user_images is None:
+                    user_images = scan_user_images(html_data)
+                thumb = user_images.get(card['img_id'], '')
+            yield ChannelCard(
+                url=BASE_URL + path,
+                path=path,
+                title=clean_text(card.get('title') or ''),
+                thumb=thumb,
+                followers=(card.get('followers') or '').strip(),
+                verified=bool(card.get('verified')),
+                live='channel__live' in avatar_class,
+                subscribed=following,
+            )
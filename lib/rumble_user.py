@@ -43,21 +43,19 @@ Notes: ............. _
 
 import math
 import time
-import re
 
 import xbmc
-import xbmcaddon
 
-from lib.general import request_get
+from lib.general import COOKIES, request_get
+from lib.settings import SETTINGS
 from lib.md5ex import MD5Ex
+from lib.parser import scan_comments
 
 try:
     import json
 except ImportError:
     import simplejson as json
 
-ADDON = xbmcaddon.Addon()
-
 class RumbleUser:
 
     """ main rumble user class """
@@ -78,10 +76,10 @@ class RumbleUser:
 
         """ get the saved login details """
 
-        self.username = ADDON.getSetting( 'username' )
-        self.password = ADDON.getSetting( 'password' )
-        self.session = ADDON.getSetting( 'session' )
-        self.expiry = ADDON.getSetting( 'expiry' )
+        self.username = SETTINGS.get( 'username' )
+        self.password = SETTINGS.get( 'password' )
+        self.session = SETTINGS.get( 'session' )
+        self.expiry = SETTINGS.get( 'expiry' )
 
         if self.expiry:
             self.expiry = float( self.expiry )
@@ -99,8 +97,13 @@ class RumbleUser:
         Used for login in & when token is expired
         """
 
-        ADDON.setSetting( 'session', self.session )
-        ADDON.setSetting( 'expiry', str( self.expiry ) )
+        # parsed account pages belong to the previous session, the response cache keys them by user
+        if self.session != SETTINGS.get( 'session' ):
+            from lib.listing import LISTING_CACHE
+            LISTING_CACHE.invalidate_private()
+
+        SETTINGS.set( 'session', self.session )
+        SETTINGS.set( 'expiry', str( self.expiry ) )
         self.set_session_cookie()
 
     def reset_session_details( self ):
@@ -173,7 +176,7 @@ class RumbleUser:
 
     def get_comments( self, video_id ):
 
-        """ method to get comments for video """
+        """ method to get comments for video, a list of scanned comment fields in thread order, see lib.parser.scan_comments """
 
         if video_id and self.has_session():
 
@@ -192,32 +195,17 @@ class RumbleUser:
             if data:
                 comment_data = json.loads(data)
                 if comment_data.get('html'):
-                    return re.compile(
-                        r"<a\sclass=\"comments-meta-author\"\shref=\"([^\"]+)\">([^\<]+)</a>(?:[\s|\n||\\n|\\t]+)<a\sclass='comments-meta-post-time'\shref='#comment-([0-9]+)' title='([A-Z][^\,]+),\s([A-Z][^\s]+)\s([0-9]+),\s([0-9]+)\s([0-9]{2}):([0-9]{2})\s(AM|PM)\s-(?:[0-9]+)'>([^\<]+)</a>(?:[\s|\n||\\n|\\t]+)</div>(?:[\s|\n||\\n|\\t]+)<p class=\"comment-text\">([^\<]+)</p>",
-                        re.MULTILINE|re.DOTALL|re.IGNORECASE
-                    ).findall(comment_data.get('html',''))
-        return {}
+                    return list( scan_comments( comment_data['html'] ) )
+        return []
 
     def set_session_cookie( self ):
 
-        """ Sets the cookie to be used in the session """
+        """ Sets the cookie to be used in the session, persisted when the invocation flushes COOKIES """
 
         if self.session:
-            # get stored cookie string
-            cookies = ADDON.getSetting('cookies')
-
-            # split cookies into dictionary
-            if cookies:
-                cookie_dict = json.loads( cookies )
-            else:
-                cookie_dict = {}
-
-            cookie_dict[ 'u_s' ] = self.session
-
-            # store cookies
-            ADDON.setSetting('cookies', json.dumps(cookie_dict))
+            COOKIES.set( 'u_s', self.session )
         else:
-            ADDON.setSetting('cookies', '')
+            COOKIES.clear()
 
     def subscribe( self, action, action_type, name ):
 
@@ -0,0 +1,134 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 5:06:44 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... scheduler.py
+Description: ....... Runs periodic jobs for the background service, with jitter and a time budget per round.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... none
+Examples: .......... _
+ (1) scheduler = Scheduler([Job('session', 30 * 60, refresh_session)], budget=30)
+     while not monitor.waitForAbort(scheduler.sleep_time()):
+        scheduler.run_due()
+Notes: ............. _
+ (1) Jitter only ever brings a run forward, so a job that warms a cache entry runs before
+     the entry's lifetime ends.
+ (2) Jobs past the round's budget wait for the next round, most overdue first.
+===========================================================================================
+"""
+
+import random
+import time
+
+from typing import Callable, List, Optional
+
+import xbmc
+
+
+class Job:
+
+    """ a function run every interval seconds """
+
+    def __init__( self, name: str, interval: float, func: Callable[[], object], jitter: float = 0.1,
+                  enabled: Optional[Callable[[], bool]] = None ):
+
+        """ Construct with a name, interval in seconds, function, jitter share and optional enabled check """
+
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.jitter = jitter
+        self.enabled = enabled
+        self.next_run = 0.0
+        self.last_duration = 0.0
+
+    def schedule( self, now: float, delay: Optional[float] = None ) -> None:
+
+        """ sets the next run to delay seconds from now, the interval minus jitter by default """
+
+        if delay is None:
+            delay = self.interval * ( 1 - self.jitter * random.random() )
+        self.next_run = now + delay
+
+    def is_due( self, now: float ) -> bool:
+
+        """ if the job should run now """
+
+        return self.next_run <= now
+
+    def run( self ) -> bool:
+
+        """ runs the job, logging failures, returns if it succeeded """
+
+        if self.enabled and not self.enabled():
+            return True
+        started = time.monotonic()
+        try:
+            self.func()
+            return True
+        except Exception as e:
+            xbmc.log( f"[Scheduler] Job {self.name} failed: {e}", xbmc.LOGWARNING )
+            return False
+        finally:
+            self.last_duration = time.monotonic() - started
+
+
+class Scheduler:
+
+    """ runs due jobs in rounds limited by a time budget """
+
+    def __init__( self, jobs: List[Job], budget: float = 30, startup_delay: float = 20, retry_delay: float = 5 * 60 ):
+
+        """ Construct with the jobs, the seconds one round may take and the delay before the first round """
+
+        self.jobs = jobs
+        self.budget = budget
+        self.retry_delay = retry_delay
+        now = time.time()
+        for job in jobs:
+            # spread the first runs so they do not all start with Kodi
+            job.schedule( now, startup_delay * ( 1 + random.random() ) )
+
+    def run_due( self, should_stop: Callable[[], bool] = lambda: False ) -> int:
+
+        """ runs due jobs, most overdue first, until the budget is spent; returns how many ran """
+
+        started = time.monotonic()
+        now = time.time()
+        ran = 0
+        for job in sorted( ( job for job in self.jobs if job.is_due( now ) ), key=lambda job: job.next_run ):
+            if should_stop() or time.monotonic() - started > self.budget:
+                break
+            ok = job.run()
+            ran += 1
+            job.schedule( time.time(), None if ok else min( self.retry_delay, job.interval ) )
+            xbmc.log( f"[Scheduler] Job {job.name} took {job.last_duration:.2f}s", xbmc.LOGDEBUG )
+        return ran
+
+    def sleep_time( self, minimum: float = 1, maximum: float = 60 ) -> float:
+
+        """ seconds until the next job is due, within the given bounds """
+
+        if not self.jobs:
+            return maximum
+        wait = min( job.next_run for job in self.jobs ) - time.time()
+        return min( max( wait, minimum ), maximum )
+
+    def postpone( self, seconds: float ) -> None:
+
+        """ moves every due job forward, e.g. while a video is playing """
+
+        now = time.time()
+        for job in self.jobs:
+            if job.is_due( now ):
+                job.schedule( now, seconds )
@@ -0,0 +1,233 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 6:12:27 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... settings.py
+Description: ....... Snapshot of the add-on settings read once per invocation, and the session cookie jar persisted to the 'cookies' setting only when a cookie changed.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Must be running within a Kodi add-on environment; must not import lib.general.
+Examples: .......... _
+ (1) from lib.settings import SETTINGS
+     if SETTINGS.get('one_line_titles') == 'true':
+        ...
+ (2) cookies = SessionCookies(lambda: session.cookies, SETTINGS)
+     cookies.set('u_s', token)
+     ...
+     cookies.flush()
+Notes: ............. _
+ (1) Every getSetting/setSetting is a call into Kodi and setSetting rewrites the settings
+     XML on disk. SETTINGS reads each setting at most once per invocation and only writes
+     values that differ from what it holds.
+ (2) The background service lives for the whole Kodi session, it calls SETTINGS.reload()
+     to see settings changed by the user or by the plugin.
+ (3) SessionCookies keeps one cookie per name in the requests session jar, sent to every
+     host like the cookies setting always was. flush() writes the jar back only when a
+     value changed since it was loaded or last written.
+ (4) The jar is only asked for, and the cookies setting only read, the first time a cookie
+     is used, so invocations that never go to the network never create the session.
+===========================================================================================
+"""
+
+import threading
+
+from typing import Callable, Dict
+
+import xbmcaddon
+
+from lib.timing import TIMER
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# Setting the session cookies are persisted in
+COOKIE_SETTING = 'cookies'
+
+
+class Settings:
+
+    """ the add-on settings, each read from Kodi at most once until reload() """
+
+    def __init__( self ):
+
+        """ Construct with an empty snapshot, the Addon object is created on first use """
+
+        self._addon = None
+        self._values: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def addon( self ) -> xbmcaddon.Addon:
+
+        """ the Addon object the snapshot reads from """
+
+        with self._lock:
+            if self._addon is None:
+                self._addon = xbmcaddon.Addon()
+            return self._addon
+
+    def get( self, key: str ) -> str:
+
+        """ gets a setting, from the snapshot after the first read """
+
+        with self._lock:
+            if key not in self._values:
+                with TIMER.phase( 'settings' ):
+                    self._values[key] = self.addon().getSetting( key )
+            return self._values[key]
+
+    def get_bool( self, key: str ) -> bool:
+
+        """ gets a boolean setting """
+
+        return self.get( key ) == 'true'
+
+    def set( self, key: str, value: str ) -> None:
+
+        """ sets a setting, writing to Kodi only when the value changed """
+
+        with self._lock:
+            if self.get( key ) == value:
+                return
+            with TIMER.phase( 'settings' ):
+                self.addon().setSetting( key, value )
+            self._values[key] = value
+
+    def reload( self ) -> None:
+
+        """ drops the snapshot so the next reads see the current settings """
+
+        with self._lock:
+            self._addon = None
+            self._values.clear()
+
+
+class SessionCookies:
+
+    """ a requests cookie jar persisted to the cookies setting with write-behind """
+
+    def __init__( self, jar_factory: Callable, settings: Settings ):
+
+        """ Construct with a callable returning the session's cookie jar and the settings to persist to """
+
+        self.jar = None
+        self.jar_factory = jar_factory
+        self.settings = settings
+        self._saved: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._attach_lock = threading.Lock()
+
+    def attach( self, jar ) -> None:
+
+        """ uses jar from now on, loading the stored cookies into it """
+
+        if self.jar is not jar:
+            with self._attach_lock:
+                if self.jar is not jar:
+                    # published only once loaded, concurrent first requests wait for the cookies
+                    self._load( jar )
+                    self.jar = jar
+
+    def load( self ) -> None:
+
+        """ replaces the jar's cookies with the stored ones """
+
+        self._load( self._jar() )
+
+    def _load( self, jar ) -> None:
+
+        """ replaces the cookies of jar with the stored ones """
+
+        stored = self.settings.get( COOKIE_SETTING )
+        try:
+            cookies = json.loads( stored ) if stored else {}
+        except ValueError:
+            cookies = {}
+        with self._lock:
+            jar.clear()
+            for name, value in cookies.items():
+                jar.set( name, value )
+            self._saved = dict( cookies )
+
+    def as_dict( self ) -> Dict[str, str]:
+
+        """ the current cookies by name """
+
+        jar = self._jar()
+        with self._lock:
+            return { cookie.name: cookie.value for cookie in jar }
+
+    def set( self, name: str, value: str ) -> None:
+
+        """ sets a cookie for every host, replacing any copy scoped to one domain """
+
+        jar = self._jar()
+        with self._lock:
+            self._set( jar, name, value )
+
+    def merge( self, cookies: Dict[str, str] ) -> None:
+
+        """ folds cookies received in a response into the jar """
+
+        jar = self._jar()
+        with self._lock:
+            for name, value in cookies.items():
+                self._set( jar, name, value )
+
+    def clear( self ) -> None:
+
+        """ forgets every cookie """
+
+        jar = self._jar()
+        with self._lock:
+            jar.clear()
+
+    def changed( self ) -> bool:
+
+        """ if the jar differs from what was loaded or last flushed """
+
+        return self.jar is not None and self.as_dict() != self._saved
+
+    def flush( self ) -> bool:
+
+        """ writes the jar to the settings if a cookie changed, returns if it wrote """
+
+        # a jar never used this invocation cannot have changed
+        if self.jar is None:
+            return False
+        current = self.as_dict()
+        with self._lock:
+            if current == self._saved:
+                return False
+            self.settings.set( COOKIE_SETTING, json.dumps( current ) if current else '' )
+            self._saved = current
+            return True
+
+    def _jar( self ):
+
+        """ the jar, asking the factory for it on first use """
+
+        if self.jar is None:
+            self.attach( self.jar_factory() )
+        return self.jar
+
+    def _set( self, jar, name: str, value: str ) -> None:
+
+        """ sets a cookie, the lock must be held """
+
+        for cookie in [ cookie for cookie in jar if cookie.name == name ]:
+            jar.clear( cookie.domain, cookie.path, cookie.name )
+        jar.set( name, value )
+
+
+SETTINGS = Settings()
@@ -0,0 +1,107 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 6:58:03 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... singleflight.py
+Description: ....... Coalesces identical calls that overlap in time, so concurrent callers of the same key share one result instead of each doing the work.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... none
+Examples: .......... _
+ (1) flights = SingleFlight()
+     html = flights.do(('GET', url, ''), lambda: download(url))
+     print(flights.stats())
+Notes: ............. _
+ (1) Only calls in flight at the same time are shared; a call that starts after the first
+     one finished runs again. Results are not kept, that is what the caches are for.
+ (2) An exception raised by the first caller is raised in every caller that waited on it.
+ (3) Calls are shared within one process; the plugin and the background service each have
+     their own.
+===========================================================================================
+"""
+
+import threading
+
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Flight:
+
+    """ one call in progress and the callers waiting on it """
+
+    def __init__( self ):
+
+        """ Construct unfinished """
+
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    """ runs one call per key at a time, concurrent callers with the same key share its result """
+
+    def __init__( self ):
+
+        """ Construct with no calls in flight and zeroed counters """
+
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do( self, key: Hashable, func: Callable[[], T] ) -> T:
+
+        """ runs func, or waits for the call with the same key already in flight, and returns its result """
+
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get( key )
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight( self ) -> int:
+
+        """ the number of keys being worked on """
+
+        with self._lock:
+            return len( self._flights )
+
+    def stats( self ) -> Dict[str, int]:
+
+        """ the counters: calls made, calls that shared another call's result, keys in flight """
+
+        with self._lock:
+            return { 'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len( self._flights ) }
@@ -0,0 +1,136 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 9:05:12 AM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... storage.py
+Description: ....... Provides the `Database` base class used by the add-on's SQLite backed stores in the profile directory.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Python's bundled sqlite3 module; must not import lib.general (lib.general builds on these stores).
+Examples: .......... _
+ (1) class MyStore(Database):
+         filename = 'my_store.db'
+         schema = ('CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY, value TEXT)',)
+Notes: ............. _
+ (1) The connection is opened lazily on first use so importing a store costs nothing.
+ (2) One connection is shared between threads and guarded by a lock, so the stores can
+     be used from background fetch threads.
+===========================================================================================
+"""
+
+import os
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+
+import xbmc
+import xbmcaddon
+import xbmcvfs
+
+ADDON = xbmcaddon.Addon()
+
+PROFILE_DIR = xbmcvfs.translatePath(ADDON.getAddonInfo('profile'))
+
+
+def profile_path(*parts: str) -> str:
+    """
+    Build a path inside the add-on profile directory, creating the directory if needed.
+
+    Args:
+        *parts (str): Path components relative to the profile directory.
+
+    Returns:
+        str: The absolute path of the file or folder in the profile directory.
+
+    Example:
+        >>> profile_path('cache.db')
+        '/home/kodi/.kodi/userdata/addon_data/plugin.video.rumbleinthejungle/cache.db'
+    """
+    if not os.path.exists(PROFILE_DIR):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+    return os.path.join(PROFILE_DIR, *parts)
+
+
+class Database:
+
+    """ lazily connected, thread safe sqlite database in the profile directory """
+
+    filename = ''
+    schema = ()
+
+    def __init__( self, path=None ):
+
+        """ Construct with an optional path, defaults to the profile directory """
+
+        self.path = path or profile_path( self.filename )
+        self._conn = None
+        self._lock = threading.RLock()
+
+    def connection( self ):
+
+        """ opens the database and creates the schema on first use """
+
+        if self._conn is None:
+            conn = sqlite3.connect( self.path, timeout=10, check_same_thread=False, isolation_level=None )
+            conn.row_factory = sqlite3.Row
+            try:
+                conn.execute( 'PRAGMA journal_mode=WAL' )
+            except sqlite3.DatabaseError as e:
+                xbmc.log( f"[Storage] WAL not available for {self.path}: {e}", xbmc.LOGDEBUG )
+            for statement in self.schema:
+                conn.execute( statement )
+            self._conn = conn
+            self.setup( conn )
+        return self._conn
+
+    def setup( self, conn ):
+
+        """ called once after the schema is created, e.g. to import legacy data """
+
+    def execute( self, sql, params=() ):
+
+        """ runs a single statement and returns all rows """
+
+        with self._lock:
+            return self.connection().execute( sql, params ).fetchall()
+
+    def executemany( self, sql, seq_of_params ):
+
+        """ runs a statement for each parameter set inside one transaction """
+
+        with self.transaction() as conn:
+            conn.executemany( sql, seq_of_params )
+
+    @contextmanager
+    def transaction( self ):
+
+        """ yields the connection inside an immediate transaction """
+
+        with self._lock:
+            conn = self.connection()
+            conn.execute( 'BEGIN IMMEDIATE' )
+            try:
+                yield conn
+            except Exception:
+                conn.execute( 'ROLLBACK' )
+                raise
+            conn.execute( 'COMMIT' )
+
+    def close( self ):
+
+        """ closes the connection, it will be re-opened on next use """
+
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,169 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 2:48:16 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... throughput.py
+Description: ....... Keeps a rolling per-host download throughput estimate in the profile directory and picks the best rendition that fits it.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage
+Examples: .......... _
+ (1) from lib.throughput import THROUGHPUT, pick_rendition
+     THROUGHPUT.record(url, len(response.content), elapsed)
+     rendition = pick_rendition(manifest.playable(), THROUGHPUT.estimate(url), 0.7)
+Notes: ............. _
+ (1) Estimates are an exponentially weighted moving average of the samples of one host, so
+     one slow or fast transfer only moves it part of the way.
+ (2) Transfers below MIN_SAMPLE_BYTES are ignored, their time is mostly latency. Only media
+     downloads are recorded; HTML and API responses include the server's think time.
+ (3) Renditions without a bitrate in the manifest are rated by their height.
+===========================================================================================
+"""
+
+import time
+
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from lib.storage import Database
+
+# Weight of a new sample in the moving average
+EWMA_WEIGHT = 0.3
+
+# Smallest transfer in bytes worth measuring
+MIN_SAMPLE_BYTES = 64 * 1024
+
+# Seconds after which an estimate is too old to trust
+ESTIMATE_MAX_AGE = 60 * 60
+
+# Typical bitrates in kbps by height, for renditions the API gives no bitrate for
+BITRATE_BY_HEIGHT = (
+    (2160, 16000),
+    (1440, 9000),
+    (1080, 4500),
+    (720, 2500),
+    (480, 1200),
+    (360, 800),
+    (240, 400),
+    (0, 300),
+)
+
+
+def host_of(url: str) -> str:
+    """
+    Get the host name a throughput estimate is kept under.
+
+    Args:
+        url (str): Any URL on the host.
+
+    Returns:
+        str: The lower case host name, '' for URLs without one.
+
+    Example:
+        >>> host_of('https://hugh.cdn.rumble.cloud/video/x.mp4?e=1')
+        'hugh.cdn.rumble.cloud'
+    """
+    return (urlsplit(url).hostname or '').lower()
+
+
+def rendition_bitrate(rendition) -> int:
+    """
+    Get the bitrate of a rendition in kbps, rated by its height when the manifest has none.
+
+    Args:
+        rendition (Rendition): The rendition.
+
+    Returns:
+        int: The bitrate in kbps.
+    """
+    if rendition.bitrate:
+        return rendition.bitrate
+    for height, bitrate in BITRATE_BY_HEIGHT:
+        if rendition.height >= height:
+            return bitrate
+    return BITRATE_BY_HEIGHT[-1][1]
+
+
+def pick_rendition(renditions: List, kbps: Optional[float], margin: float):
+    """
+    Pick the highest quality rendition whose bitrate fits under the estimated throughput.
+
+    Args:
+        renditions (List[Rendition]): The candidates, e.g. StreamManifest.playable().
+        kbps (float, optional): The estimated throughput in kbps, None when unknown.
+        margin (float): The share of the throughput a stream may use, e.g. 0.7.
+
+    Returns:
+        Optional[Rendition]: The chosen rendition. Without an estimate an adaptive HLS stream is
+        preferred, else the lowest quality. None when there are no renditions.
+    """
+    if not renditions:
+        return None
+
+    # an HLS master playlist with no height adapts by itself, rate it only as a fallback
+    rated = [r for r in renditions if not (r.is_hls and not r.height)]
+    adaptive = [r for r in renditions if r.is_hls and not r.height]
+
+    if kbps is None or not rated:
+        if adaptive:
+            return adaptive[0]
+        return min(rated, key=rendition_bitrate)
+
+    budget = kbps * margin
+    fitting = [r for r in rated if rendition_bitrate(r) <= budget]
+    if fitting:
+        return max(fitting, key=lambda r: (r.height, rendition_bitrate(r)))
+    return min(rated, key=rendition_bitrate)
+
+
+class ThroughputStore(Database):
+
+    """ rolling download throughput per host """
+
+    filename = 'metadata.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS throughput ('
+        ' host TEXT PRIMARY KEY, kbps REAL NOT NULL, samples INTEGER NOT NULL, updated REAL NOT NULL)',
+    )
+
+    def record( self, url: str, nbytes: int, seconds: float ) -> None:
+
+        """ adds a transfer of nbytes that took seconds to the estimate of the URL's host """
+
+        host = host_of( url )
+        if not host or nbytes < MIN_SAMPLE_BYTES or seconds <= 0:
+            return
+        sample = nbytes * 8 / 1000.0 / seconds
+        with self.transaction() as conn:
+            row = conn.execute( 'SELECT kbps, samples, updated FROM throughput WHERE host = ?', ( host, ) ).fetchone()
+            if row and time.time() - row['updated'] < ESTIMATE_MAX_AGE:
+                kbps = row['kbps'] + EWMA_WEIGHT * ( sample - row['kbps'] )
+                samples = row['samples'] + 1
+            else:
+                kbps, samples = sample, 1
+            conn.execute(
+                'INSERT OR REPLACE INTO throughput (host, kbps, samples, updated) VALUES (?, ?, ?, ?)',
+                ( host, kbps, samples, time.time() )
+            )
+
+    def estimate( self, url: str ) -> Optional[float]:
+
+        """ the recent throughput of the URL's host in kbps, None when unknown or too old """
+
+        rows = self.execute(
+            'SELECT kbps FROM throughput WHERE host = ? AND updated > ?',
+            ( host_of( url ), time.time() - ESTIMATE_MAX_AGE )
+        )
+        return rows[0]['kbps'] if rows else None
+
+
+THROUGHPUT = ThroughputStore()
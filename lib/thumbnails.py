@@ -0,0 +1,322 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 7:24:40 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... thumbnails.py
+Description: ....... Local thumbnail cache: downloads card thumbnails concurrently, downscales them to list thumbnail and fanart sizes and keeps them content-addressed in the profile directory within a byte budget.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.general, lib.storage and PIL (script.module.pil, required in addon.xml).
+Examples: .......... _
+ (1) from lib.thumbnails import THUMBNAILS
+     THUMBNAILS.prefetch([card.thumb for card in cards if card.thumb])
+     art = THUMBNAILS.local_art([card.thumb for card in cards if card.thumb])
+     images = art.get(card.thumb, {'thumb': card.thumb, 'fanart': card.thumb})
+Notes: ............. _
+ (1) Files are named by the SHA-1 of their contents in the 'thumbnails' folder of the
+     profile directory, so thumbnails that several URLs point to are stored once.
+ (2) The images are downscaled to ART_SIZES with PIL and saved as JPEG. Outside Kodi, where
+     PIL may be missing, the downloaded image is stored as-is for both sizes.
+ (3) Files are evicted least recently shown first once they use more than
+     THUMBNAIL_MAX_BYTES; a file is only removed with every URL that points to it.
+ (4) The plugin does not download thumbnails itself. It queues the missing ones with
+     enqueue() and the background service downloads them with drain().
+===========================================================================================
+"""
+
+import hashlib
+import io
+import os
+import time
+
+from typing import Dict, Iterable, List, Optional
+
+import xbmc
+
+from lib.general import download_many
+from lib.storage import Database, profile_path
+
+# PIL's Image module once imported by pil_image(), False when PIL is not installed
+_IMAGE = None
+
+# Upper bound for stored thumbnail files before least recently shown ones are dropped
+THUMBNAIL_MAX_BYTES = 48 * 1024 * 1024
+
+# Largest width and height of each kind of art
+ART_SIZES = {
+    'thumb': (480, 270),
+    'fanart': (1280, 720),
+}
+
+# JPEG quality of downscaled images
+JPEG_QUALITY = 85
+
+# Thumbnails waiting for the background service, the oldest are dropped past this
+THUMBNAIL_QUEUE_MAX = 2000
+
+# File extension by leading bytes, anything else is not stored
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'GIF8', '.gif'),
+    (b'RIFF', '.webp'),
+)
+
+
+def image_extension(data: bytes) -> str:
+    """
+    Get the file extension of an image from its leading bytes.
+
+    Args:
+        data (bytes): The downloaded file.
+
+    Returns:
+        str: '.jpg', '.png', '.gif' or '.webp', '' when the data is not an image, e.g. an
+        error page.
+    """
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            if extension == '.webp' and data[8:12] != b'WEBP':
+                return ''
+            return extension
+    return ''
+
+
+def pil_image():
+    """
+    Get PIL's Image module, importing it on first use.
+
+    PIL is only imported by invocations that store thumbnails, it is slow to import and the
+    plugin starts a new process for every folder.
+
+    Returns:
+        module: PIL.Image, or None when PIL is not available.
+    """
+    global _IMAGE
+    if _IMAGE is None:
+        try:
+            from PIL import Image
+            _IMAGE = Image
+        except ImportError:
+            _IMAGE = False
+    return _IMAGE or None
+
+
+def downscale(data: bytes, size: tuple) -> bytes:
+    """
+    Shrink an image to fit in size, keeping its aspect ratio.
+
+    Args:
+        data (bytes): The image file.
+        size (tuple): The largest (width, height).
+
+    Returns:
+        bytes: A JPEG of the shrunk image, or data unchanged when it already fits, PIL is not
+        available or the image cannot be decoded.
+    """
+    Image = pil_image()
+    if Image is None:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width <= size[0] and image.height <= size[1]:
+                return data
+            image = image.convert('RGB')
+            image.thumbnail(size, Image.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+            return output.getvalue()
+    except Exception as e:
+        xbmc.log(f"[Thumbnails] Unable to downscale image: {e}", xbmc.LOGDEBUG)
+        return data
+
+
+class ThumbnailCache(Database):
+
+    """ downscaled thumbnails on disk, indexed by source URL and art kind """
+
+    filename = 'cache.db'
+    schema = (
+        'CREATE TABLE IF NOT EXISTS thumbnail_files ('
+        ' file TEXT PRIMARY KEY, size INTEGER NOT NULL, used REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS thumbnail_files_used ON thumbnail_files (used)',
+        'CREATE TABLE IF NOT EXISTS thumbnails ('
+        ' url TEXT NOT NULL, kind TEXT NOT NULL, file TEXT NOT NULL, PRIMARY KEY (url, kind))',
+        'CREATE INDEX IF NOT EXISTS thumbnails_file ON thumbnails (file)',
+        'CREATE TABLE IF NOT EXISTS thumbnail_queue (url TEXT PRIMARY KEY, queued REAL NOT NULL)',
+    )
+
+    def __init__( self, path=None, folder=None, max_bytes=THUMBNAIL_MAX_BYTES ):
+
+        """ Construct with an optional database path, file folder and size budget """
+
+        super().__init__( path )
+        self.folder = folder or profile_path( 'thumbnails' )
+        self.max_bytes = max_bytes
+
+    def file_path( self, name: str ) -> str:
+
+        """ the absolute path of a stored file """
+
+        return os.path.join( self.folder, name )
+
+    def local_art( self, urls: Iterable[str] ) -> Dict[str, Dict[str, str]]:
+
+        """ the local files of the URLs that are stored, by URL and art kind, marking them as recently shown """
+
+        urls = list( dict.fromkeys( urls ) )
+        art: Dict[str, Dict[str, str]] = {}
+        files = set()
+        # stay well below sqlite's bound parameter limit
+        for start in range( 0, len( urls ), 500 ):
+            chunk = urls[start:start + 500]
+            rows = self.execute(
+                'SELECT url, kind, file FROM thumbnails WHERE url IN (%s)' % ','.join( '?' * len( chunk ) ),
+                chunk
+            )
+            for row in rows:
+                path = self.file_path( row['file'] )
+                if os.path.exists( path ):
+                    art.setdefault( row['url'], {} )[row['kind']] = path
+                    files.add( row['file'] )
+        if files:
+            now = time.time()
+            self.executemany( 'UPDATE thumbnail_files SET used = ? WHERE file = ?', [ ( now, name ) for name in files ] )
+        # only URLs with every kind of art count as stored
+        return { url: kinds for url, kinds in art.items() if len( kinds ) == len( ART_SIZES ) }
+
+    def missing( self, urls: Iterable[str] ) -> List[str]:
+
+        """ the URLs without stored art """
+
+        urls = list( dict.fromkeys( url for url in urls if url and url.startswith( 'http' ) ) )
+        stored = self.local_art( urls )
+        return [ url for url in urls if url not in stored ]
+
+    def store( self, url: str, data: bytes ) -> Optional[Dict[str, str]]:
+
+        """ downscales and saves a downloaded image for every art kind, returns the files by kind """
+
+        extension = image_extension( data )
+        if not extension:
+            return None
+        os.makedirs( self.folder, exist_ok=True )
+
+        files = {}
+        for kind, size in ART_SIZES.items():
+            image = downscale( data, size )
+            name = hashlib.sha1( image ).hexdigest() + ( extension if image is data else '.jpg' )
+            path = self.file_path( name )
+            if not os.path.exists( path ):
+                # write under a temporary name so a reader never sees half a file
+                with open( path + '.tmp', 'wb' ) as handle:
+                    handle.write( image )
+                os.replace( path + '.tmp', path )
+            files[kind] = ( name, len( image ) )
+
+        now = time.time()
+        with self.transaction() as conn:
+            for kind, ( name, size ) in files.items():
+                conn.execute(
+                    'INSERT OR REPLACE INTO thumbnail_files (file, size, used) VALUES (?, ?, ?)',
+                    ( name, size, now )
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO thumbnails (url, kind, file) VALUES (?, ?, ?)',
+                    ( url, kind, name )
+                )
+        self.evict()
+        return { kind: self.file_path( name ) for kind, ( name, _ ) in files.items() }
+
+    def prefetch( self, urls: Iterable[str] ) -> int:
+
+        """ downloads and stores the URLs without stored art concurrently, returns how many were stored """
+
+        stored = 0
+        for url, data in download_many( self.missing( urls ) ):
+            try:
+                if data and self.store( url, data ):
+                    stored += 1
+            except Exception as e:
+                xbmc.log( f"[Thumbnails] Unable to store {url}: {e}", xbmc.LOGWARNING )
+        return stored
+
+    def enqueue( self, urls: Iterable[str] ) -> int:
+
+        """ queues URLs for the background service to download, returns how many were given """
+
+        now = time.time()
+        rows = [ ( url, now ) for url in dict.fromkeys( urls ) if url and url.startswith( 'http' ) ]
+        if not rows:
+            return 0
+        with self.transaction() as conn:
+            conn.executemany( 'INSERT OR IGNORE INTO thumbnail_queue (url, queued) VALUES (?, ?)', rows )
+            conn.execute(
+                'DELETE FROM thumbnail_queue WHERE url IN'
+                ' (SELECT url FROM thumbnail_queue ORDER BY queued DESC LIMIT -1 OFFSET ?)',
+                ( THUMBNAIL_QUEUE_MAX, )
+            )
+        return len( rows )
+
+    def drain( self, limit: int = 100 ) -> int:
+
+        """ downloads up to limit queued URLs, newest first, and takes them off the queue, returns how many were stored """
+
+        urls = [ row['url'] for row in self.execute( 'SELECT url FROM thumbnail_queue ORDER BY queued DESC LIMIT ?', ( limit, ) ) ]
+        if not urls:
+            return 0
+        stored = self.prefetch( urls )
+        # failed downloads are not retried, the next render queues them again
+        self.executemany( 'DELETE FROM thumbnail_queue WHERE url = ?', [ ( url, ) for url in urls ] )
+        return stored
+
+    def evict( self ) -> None:
+
+        """ drops least recently shown files until the cache is back under budget """
+
+        removed = []
+        with self.transaction() as conn:
+            total = conn.execute( 'SELECT COALESCE(SUM(size), 0) FROM thumbnail_files' ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            # free a little headroom so every store does not trigger another eviction
+            target = self.max_bytes * 0.9
+            for row in conn.execute( 'SELECT file, size FROM thumbnail_files ORDER BY used' ).fetchall():
+                if total <= target:
+                    break
+                conn.execute( 'DELETE FROM thumbnails WHERE file = ?', ( row['file'], ) )
+                conn.execute( 'DELETE FROM thumbnail_files WHERE file = ?', ( row['file'], ) )
+                removed.append( row['file'] )
+                total -= row['size']
+        for name in removed:
+            try:
+                os.remove( self.file_path( name ) )
+            except OSError:
+                pass
+
+    def clear( self ) -> None:
+
+        """ removes every stored thumbnail """
+
+        with self.transaction() as conn:
+            names = [ row['file'] for row in conn.execute( 'SELECT file FROM thumbnail_files' ).fetchall() ]
+            conn.execute( 'DELETE FROM thumbnails' )
+            conn.execute( 'DELETE FROM thumbnail_files' )
+            conn.execute( 'DELETE FROM thumbnail_queue' )
+        for name in names:
+            try:
+                os.remove( self.file_path( name ) )
+            except OSError:
+                pass
+
+
+THUMBNAILS = ThumbnailCache()
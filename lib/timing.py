@@ -0,0 +1,318 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 9:24:37 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... timing.py
+Description: ....... Per-invocation phase timers: how long an invocation spent importing, on the network (DNS, connect, time to first byte, body), parsing, reading settings and rendering, appended as JSON lines to a rotating log in the profile directory.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/lib
+Compatibility: ..... XBMC, Kodi 16+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Need lib.storage; must not import lib.settings or lib.general.
+Examples: .......... _
+ (1) from lib.timing import TIMER
+     with TIMER.phase('parse'):
+        cards = list(parse_cards(html_data, listing_type))
+ (2) @TIMER.timed('render')
+     def render_cards(cards, category, play_mode=0):
+        ...
+ (3) TIMER.write(mode=3, url=url, cat=cat)
+     for mode, records in slowest_by_mode(read_records()).items():
+        print(mode, [record['total'] for record in records])
+Notes: ............. _
+ (1) Phases are always summed in memory, which costs a clock read per phase; only
+     write() touches the disk and main.py calls it only when 'Record Phase Timings' is on.
+ (2) Phases are summed per name with a count. A phase entered again while it is running
+     on the same thread is not counted twice, e.g. rendering inside rendering. Phases on
+     background threads add up, so 'parse' may exceed the wall time of the invocation.
+ (3) DNS and connect times are only measured after instrument_connections(), which wraps
+     urllib3's create_connection; time to first byte then excludes them. Without it the
+     time to first byte includes connecting. Reused keep-alive connections have neither.
+ (4) The log is timing.log in the profile directory, rotated to timing.log.1 once it
+     grows past TIMING_LOG_MAX_BYTES.
+===========================================================================================
+"""
+
+import os
+import socket
+import threading
+import time
+
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Iterator, List, Optional
+
+import xbmc
+
+from lib.storage import profile_path
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+# Setting that turns writing the timings on
+TIMING_SETTING = 'phase_timing'
+
+# Log file in the profile directory and its rotation
+TIMING_LOG = 'timing.log'
+TIMING_LOG_MAX_BYTES = 512 * 1024
+TIMING_LOG_BACKUPS = 1
+
+# Requests kept with their own breakdown per invocation, the rest only add to the phases
+TIMING_MAX_REQUESTS = 50
+
+
+class PhaseTimer:
+
+    """ phase durations of one plugin invocation """
+
+    def __init__( self, path: Optional[str] = None ):
+
+        """ Construct with an optional log path, the invocation starts now """
+
+        self.path = path
+        self.started = time.perf_counter()
+        self.phases: Dict[str, List[float]] = {}
+        self.requests: List[dict] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._instrumented = False
+
+    def add( self, name: str, seconds: float, count: int = 1 ) -> None:
+
+        """ adds seconds spent in a phase """
+
+        with self._lock:
+            phase = self.phases.setdefault( name, [ 0.0, 0 ] )
+            phase[0] += seconds
+            phase[1] += count
+
+    @contextmanager
+    def phase( self, name: str ) -> Iterator[None]:
+
+        """ times the body of the with statement as a phase """
+
+        active = self._active()
+        if name in active:
+            yield
+            return
+        active.add( name )
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            active.discard( name )
+            self.add( name, time.perf_counter() - started )
+
+    def timed( self, name: str ):
+
+        """ decorator timing every call of a function as a phase """
+
+        def decorator( func ):
+            @wraps( func )
+            def wrapper( *args, **kwargs ):
+                with self.phase( name ):
+                    return func( *args, **kwargs )
+            return wrapper
+        return decorator
+
+    def begin_request( self ) -> None:
+
+        """ starts collecting the connection times of the calling thread's next request """
+
+        self._local.dns = 0.0
+        self._local.connect = 0.0
+
+    def end_request( self, url: str, response, seconds: float ) -> None:
+
+        """ adds the DNS, connect, time to first byte and body phases of a finished request """
+
+        dns = getattr( self._local, 'dns', 0.0 )
+        connect = getattr( self._local, 'connect', 0.0 )
+        self.begin_request()
+
+        # requests' elapsed runs from sending the request until the headers are parsed
+        headers = response.elapsed.total_seconds() if response.elapsed else seconds
+        ttfb = max( headers - dns - connect, 0.0 )
+        body = max( seconds - headers, 0.0 )
+        for name, value in ( ( 'dns', dns ), ( 'connect', connect ), ( 'ttfb', ttfb ), ( 'body', body ) ):
+            if value:
+                self.add( name, value )
+
+        with self._lock:
+            if len( self.requests ) < TIMING_MAX_REQUESTS:
+                self.requests.append( {
+                    'url': url,
+                    'status': response.status_code,
+                    'bytes': len( response.content ),
+                    'dns': round( dns * 1000, 1 ),
+                    'connect': round( connect * 1000, 1 ),
+                    'ttfb': round( ttfb * 1000, 1 ),
+                    'body': round( body * 1000, 1 ),
+                } )
+
+    def instrument_connections( self ) -> None:
+
+        """ wraps urllib3's create_connection to time DNS lookups and connects of new connections """
+
+        with self._lock:
+            if self._instrumented:
+                return
+            self._instrumented = True
+
+        from urllib3.util import connection
+        create_connection = connection.create_connection
+
+        def timed_create_connection( address, *args, **kwargs ):
+            host, port = address
+            started = time.perf_counter()
+            try:
+                addresses = socket.getaddrinfo( host.strip( '[]' ), port, 0, socket.SOCK_STREAM )
+            except OSError:
+                # let urllib3 raise its own error for the lookup
+                return create_connection( address, *args, **kwargs )
+            resolved = time.perf_counter()
+            self._local.dns = getattr( self._local, 'dns', 0.0 ) + resolved - started
+
+            error = None
+            try:
+                # connect to the resolved addresses in order, as urllib3 does
+                for _, _, _, _, sockaddr in addresses:
+                    try:
+                        return create_connection( ( sockaddr[0], port ), *args, **kwargs )
+                    except OSError as e:
+                        error = e
+                raise error or OSError( f"getaddrinfo returned nothing for {host}" )
+            finally:
+                self._local.connect = getattr( self._local, 'connect', 0.0 ) + time.perf_counter() - resolved
+
+        connection.create_connection = timed_create_connection
+
+    def record( self, **fields ) -> dict:
+
+        """ the invocation's timings in ms with the given fields, e.g. mode and URL """
+
+        with self._lock:
+            phases = {
+                name: { 'ms': round( seconds * 1000, 1 ), 'count': count }
+                for name, ( seconds, count ) in self.phases.items()
+            }
+            requests_ = list( self.requests )
+        return dict(
+            fields,
+            time=time.time(),
+            total=round( ( time.perf_counter() - self.started ) * 1000, 1 ),
+            phases=phases,
+            requests=requests_,
+        )
+
+    def write( self, **fields ) -> None:
+
+        """ appends the invocation's record to the log, rotating it when full """
+
+        path = self.path or profile_path( TIMING_LOG )
+        line = json.dumps( self.record( **fields ) ) + '\n'
+        try:
+            if os.path.exists( path ) and os.path.getsize( path ) > TIMING_LOG_MAX_BYTES:
+                for index in range( TIMING_LOG_BACKUPS, 1, -1 ):
+                    if os.path.exists( f"{path}.{index - 1}" ):
+                        os.replace( f"{path}.{index - 1}", f"{path}.{index}" )
+                os.replace( path, path + '.1' )
+            with open( path, 'a', encoding='utf-8' ) as handle:
+                handle.write( line )
+        except OSError as e:
+            xbmc.log( f"[Timing] Unable to write {path}: {e}", xbmc.LOGWARNING )
+
+    def _active( self ) -> set:
+
+        """ the phases running on the calling thread """
+
+        active = getattr( self._local, 'active', None )
+        if active is None:
+            active = self._local.active = set()
+        return active
+
+
+def read_records(path: Optional[str] = None) -> List[dict]:
+    """
+    Read the timing records of the log and its rotated copies, oldest first.
+
+    Args:
+        path (str, optional): The log file. Defaults to timing.log in the profile directory.
+
+    Returns:
+        List[dict]: The records; lines that are not valid JSON are skipped.
+    """
+    path = path or profile_path(TIMING_LOG)
+    files = [f"{path}.{index}" for index in range(TIMING_LOG_BACKUPS, 0, -1)] + [path]
+
+    records = []
+    for name in files:
+        try:
+            with open(name, 'r', encoding='utf-8') as handle:
+                for line in handle:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    return records
+
+
+def slowest_by_mode(records: List[dict], limit: int = 25) -> Dict[int, List[dict]]:
+    """
+    Group timing records by plugin mode, slowest first.
+
+    Args:
+        records (List[dict]): Records from read_records.
+        limit (int, optional): Records kept per mode. Defaults to 25.
+
+    Returns:
+        Dict[int, List[dict]]: The slowest records of each mode, by mode.
+    """
+    by_mode: Dict[int, List[dict]] = {}
+    for record in records:
+        by_mode.setdefault(int(record.get('mode', 0)), []).append(record)
+    return {
+        mode: sorted(group, key=lambda record: record.get('total', 0), reverse=True)[:limit]
+        for mode, group in sorted(by_mode.items())
+    }
+
+
+def describe(record: dict) -> str:
+    """
+    Describe a timing record, its phases longest first, then its slowest requests.
+
+    Args:
+        record (dict): A record from read_records.
+
+    Returns:
+        str: One line per phase and request.
+    """
+    lines = [f"Total: {record.get('total', 0):.0f} ms"]
+    phases = sorted((record.get('phases') or {}).items(), key=lambda item: item[1].get('ms', 0), reverse=True)
+    for name, phase in phases:
+        lines.append(f"{name}: {phase.get('ms', 0):.0f} ms ({phase.get('count', 0)}x)")
+
+    requests_ = sorted(record.get('requests') or [], key=lambda request: request.get('ttfb', 0) + request.get('body', 0), reverse=True)
+    if requests_:
+        lines.append('')
+    for request in requests_[:10]:
+        lines.append(
+            f"{request.get('url')} [{request.get('status')}, {request.get('bytes', 0)} bytes]: "
+            f"dns {request.get('dns', 0):.0f}, connect {request.get('connect', 0):.0f}, "
+            f"ttfb {request.get('ttfb', 0):.0f}, body {request.get('body', 0):.0f} ms"
+        )
+    return '\n'.join(lines)
+
+
+TIMER = PhaseTimer()
@@ -29,10 +29,11 @@ Notes: ............. _
 import sys
 import re
 import os
+import time
 
 
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from typing import Optional, Union, List, Tuple
+from typing import NamedTuple, Optional, Union, List, Tuple
 
 import xbmc
 import xbmcplugin
@@ -41,11 +42,26 @@ import xbmcaddon
 import xbmcvfs
 
 from lib.general import *
+from lib.cache import RESPONSE_CACHE, cache_key
+from lib.cards import Card, ChannelCard, VideoCard
+from lib.favorites import Favorite, FavoritesStore
+from lib.listing import (
+    LISTING_CACHE, build_page_url, card_thumbnails, folder_page_urls, items_per_folder, listing_spec,
+    load_listings_stale, merge_listings, prefetch_listings, queue_thumbnails, revalidate_listings,
+    wait_for_background
+)
+from lib.manifest import MANIFEST_CACHE, Rendition, StreamManifest
+from lib.metadata import SUBSCRIPTIONS, VIDEO_INDEX
+from lib.parser import parse_cards
 from lib.rumble_user import RumbleUser
-from lib.comments import CommentWindow
+from lib.settings import SETTINGS
+from lib.thumbnails import THUMBNAILS
+from lib.timing import TIMER, TIMING_SETTING, describe, read_records, slowest_by_mode
 
 import json
 
+from dataclasses import dataclass
+
 BASE_URL = 'https://rumble.com'
 PLUGIN_URL = sys.argv[0]
 PLUGIN_ID = int(sys.argv[1])
@@ -59,70 +75,58 @@ HOME_DIR = 'special://home/addons/' + PLUGIN_NAME
 RESOURCE_DIR = HOME_DIR + 'resources/'
 MEDIA_DIR = RESOURCE_DIR + 'media/'
 
-DATE_FORMAT = ADDON.getSetting('date_format')
+DATE_FORMAT = SETTINGS.get('date_format')
+
+# Video page URLs, e.g. https://rumble.com/v1abc23-some-title.html
+VIDEO_URL_PATTERN = re.compile(r'/v[0-9a-z]+-[^/?]*\.html')
 
 RUMBLE_USER = RumbleUser()
 
 favorites = xbmcvfs.translatePath(os.path.join(ADDON.getAddonInfo('profile'), 'favorites.dat'))
 
-def build_page_url(base_url: str, page: int) -> str:
-    """
-    Given a base URL, update its query parameters to include the page number.
-    """
-    parsed = urlparse(base_url)
-    # parse_qs returns values as lists, so convert them into single values
-    query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
-    query_params['page'] = str(page)
-    new_query = urlencode(query_params)
-    return urlunparse((parsed.scheme, parsed.netloc, parsed.path,
-                       parsed.params, new_query, parsed.fragment))
-
-def favorites_create():
-    """
-    Creates favorite directory if it doesn't exist.
-
-    The function checks if the directory specified by the addon's profile path exists.
-    If it doesn't exist, the function creates the directory. After the directory creation,
-    the function waits for 1 millisecond to ensure the directory is fully created before proceeding.
-
-    Parameters:
-    None
-
-    Returns:
-    None
-    """
-    addon_data_path = xbmcvfs.translatePath(ADDON.getAddonInfo('profile'))
-
-    if os.path.exists(addon_data_path) is False:
-        os.mkdir(addon_data_path)
+# favorites.dat is only read once, to import it into the favorites database
+FAVORITES = FavoritesStore(legacy_path=favorites)
+FAVORITES_PAGE_SIZE = 100
 
-    xbmc.sleep(1)
 
+class MenuEntry(NamedTuple):
+    """ an entry of a static menu, label is a string id or the label itself """
+    label: Union[int, str]
+    url: str
+    mode: int
+    thumb: str
+    cat: str = ''
+    login: bool = False
 
-def favorites_load(return_string: bool = False):
-    """
-    Load favorites from file into a variable.
 
-    Parameters:
-    return_string (bool): If True, the function returns the favorites as a string.
-                           If False (default), the function returns the favorites as a list.
-
-    Returns:
-    str or list: The favorites as a string or list, depending on the return_string parameter.
-                  If the favorites file does not exist, an empty string or list is returned.
-    """
-    if os.path.exists(favorites):
-        with open(favorites, 'r', encoding='utf-8') as fav_file:
-            fav_str = fav_file.read()
-        if return_string:
-            return fav_str
-        if fav_str:
-            return json.loads(fav_str)
-    else:
-        favorites_create()
-
-    return '' if return_string else []
+HOME_MENU = (
+    # Search
+    MenuEntry( 137, '', 1, 'search.png' ),
+    # Favorites
+    MenuEntry( 1036, '', 7, 'favorite.png' ),
+    MenuEntry( 'Subscriptions', BASE_URL + '/subscriptions', 3, 'favorite.png', 'subscriptions', login=True ),
+    MenuEntry( 'Following', BASE_URL + '/followed-channels', 3, 'favorite.png', 'following', login=True ),
+    # Newest videos of every followed channel
+    MenuEntry( 'All My Channels', '', 15, 'favorite.png', login=True ),
+    MenuEntry( 'Watch Later', BASE_URL + '/playlists/watch-later', 3, 'favorite.png', 'playlist', login=True ),
+    # Battle Leaderboard
+    MenuEntry( 30050, BASE_URL + '/battle-leaderboard/recorded', 3, 'leader.png', 'top' ),
+    # Categories
+    MenuEntry( 30051, BASE_URL + '/browse', 3, 'viral.png', 'cat_list' ),
+    # Live Streams
+    MenuEntry( 30052, BASE_URL + '/browse/live', 3, 'viral.png', 'live_stream' ),
+    # Settings
+    MenuEntry( 5, '', 8, 'settings.png' ),
+)
 
+SEARCH_MENU = (
+    # Search Video
+    MenuEntry( 30100, BASE_URL + '/search/video?q=', 2, 'search.png', 'video' ),
+    # Search Channel
+    MenuEntry( 30101, BASE_URL + '/search/channel?q=', 2, 'search.png', 'channel' ),
+    # Search User
+    MenuEntry( 30102, BASE_URL + '/search/channel?q=', 2, 'search.png', 'user' ),
+)
 
 def prompt_user_for_search(heading: str = '', message: str = '') -> Optional[str]:
     """
@@ -166,6 +170,7 @@ def home_menu():
     This function generates the main menu options for the Rumble plugin.
     It includes options for searching, favorites, subscriptions, following,
     watch later, battle leaderboard, categories, live streams, and settings.
+    The entries come from HOME_MENU and are rendered by show_menu.
 
     Parameters:
     None
@@ -173,32 +178,29 @@ def home_menu():
     Returns:
     None
     """
-    # Search
-    add_dir( get_string(137), '', 1, { 'thumb': 'search.png' } )
-    # Favorites
-    add_dir( get_string(1036), '', 7, { 'thumb': 'favorite.png' } )
+    show_menu( HOME_MENU, cache_to_disc=False )
 
-    if RUMBLE_USER.has_login_details():
-        # Subscriptions
-        add_dir( 'Subscriptions', BASE_URL + '/subscriptions', 3, { 'thumb': 'favorite.png' }, {}, 'subscriptions' )
-        # Following
-        add_dir( 'Following', BASE_URL + '/followed-channels', 3, { 'thumb': 'favorite.png' }, {}, 'following' )
-        # Watch Later
-        add_dir( 'Watch Later', BASE_URL + '/playlists/watch-later', 3, { 'thumb': 'favorite.png' }, {}, 'playlist' )
 
-    # Battle Leaderboard
-    add_dir( get_string(30050), BASE_URL + '/battle-leaderboard/recorded', 3, { 'thumb': 'leader.png' }, {}, 'top' )
+def feed_show() -> None:
+    """
+    Show the newest videos of every followed channel as one listing.
 
-    # Categories
-    add_dir( get_string(30051), BASE_URL + '/browse', 3, { 'thumb': 'viral.png' }, {}, 'cat_list' )
+    The channels are fetched concurrently and merged by upload date by lib.feed.build_feed.
+    The listing holds as many videos as the 'items_per_folder' setting.
 
-    # Live Streams
-    add_dir( get_string(30052), BASE_URL + '/browse/live', 3, { 'thumb': 'viral.png' }, {}, 'live_stream' )
+    Returns:
+        None
+    """
+    from lib.feed import build_feed
 
-    # Settings
-    add_dir( get_string(5), '', 8, { 'thumb': 'settings.png' } )
+    # the followed channel list needs a session
+    RUMBLE_USER.has_session()
 
-    xbmcplugin.endOfDirectory( PLUGIN_ID, cacheToDisc=False )
+    cards = build_feed(items_per_folder())
+    if not cards:
+        notify('No videos found for the channels you follow')
+    show_cards(cards, 'subscriptions', 'subscriptions', False, 2)
+    xbmcplugin.endOfDirectory(PLUGIN_ID)
 
 
 def search_menu():
@@ -208,6 +210,7 @@ def search_menu():
     This function generates a menu with search options for videos, channels, and users.
     It adds three items to the menu: one for searching videos, one for searching channels,
     and one for searching users. Each item is a directory that leads to a search page on Rumble.
+    The entries come from SEARCH_MENU and are rendered by show_menu.
 
     Parameters:
     None
@@ -215,25 +218,79 @@ def search_menu():
     Returns:
     None
     """
-    # Search Video
-    add_dir( get_string(30100), BASE_URL + '/search/video?q=', 2, { 'thumb': 'search.png' }, {}, 'video' )
-    # Search Channel
-    add_dir( get_string(30101), BASE_URL + '/search/channel?q=', 2, { 'thumb': 'search.png' }, {}, 'channel' )
-    # Search User
-    add_dir( get_string(30102), BASE_URL + '/search/channel?q=', 2, { 'thumb': 'search.png' }, {}, 'user' )
+    show_menu( SEARCH_MENU )
 
-    xbmcplugin.endOfDirectory(PLUGIN_ID)
+
+def build_menu_item(entry: MenuEntry) -> Tuple[str, xbmcgui.ListItem, bool]:
+    """
+    Builds the directory item of a static menu entry.
+
+    The item is the one build_dir_item makes for a plain folder, same plugin URL included,
+    without loading the listing context: menu entries have no favorite, subscribe or
+    playback context items.
+
+    Args:
+        entry (MenuEntry): The menu entry.
+
+    Returns:
+        Tuple[str, xbmcgui.ListItem, bool]: The plugin URL, the list item and True (a folder).
+    """
+    name = get_string( entry.label ) if isinstance( entry.label, int ) else entry.label
+    thumb = MEDIA_DIR + entry.thumb
+    fanart = HOME_DIR + 'fanart.png'
+
+    link = build_url( {
+        'url': entry.url,
+        'mode': str( entry.mode ),
+        'name': name,
+        'thumb': thumb,
+        'fanart': fanart,
+        'plot': '',
+        'cat': entry.cat,
+    } )
+
+    list_item = xbmcgui.ListItem( name )
+    list_item.setArt( { 'icon': 'DefaultFolder.png', 'thumb': thumb } )
+    item_set_info( list_item, { 'title': name } )
+    list_item.setProperty( 'fanart_image', fanart )
+
+    return link, list_item, True
+
+
+@TIMER.timed('render')
+def show_menu(entries: Tuple[MenuEntry, ...], cache_to_disc: bool = True) -> None:
+    """
+    Shows a static menu in one addDirectoryItems call.
+
+    Menus need no network and no database, so nothing but the login details is read.
+
+    Args:
+        entries (Tuple[MenuEntry, ...]): The entries, e.g. HOME_MENU.
+        cache_to_disc (bool, optional): Let Kodi cache the directory. Defaults to True.
+
+    Returns:
+        None
+    """
+    logged_in = any( entry.login for entry in entries ) and bool( RUMBLE_USER.has_login_details() )
+    add_dir_items( [ build_menu_item( entry ) for entry in entries if logged_in or not entry.login ] )
+    xbmcplugin.endOfDirectory( PLUGIN_ID, cacheToDisc=cache_to_disc )
 
 def pagination(url: str, page: int, category: str, search: Optional[str] = None) -> None:
     """
     List directory items and show pagination.
 
+    A folder holds as many Rumble pages as the 'items_per_folder' setting asks for (about 25
+    items per page). The pages are fetched in parallel and merged, and the next folder is
+    prefetched in the background once this one is shown. The plugin waits for the prefetch
+    before it exits, up to lib.listing.BACKGROUND_TIMEOUT; pages not stored by then are
+    fetched by the background service.
+
     If no results are loaded, this function prompts the user to either refresh
     the container or go back.
 
     Args:
         url (str): The base URL for the directory.
-        page (int): The current page number.
+        page (int): The current folder number.
         category (str): The category of the directory.
         search (Optional[str]): A search query string, if applicable.
 
@@ -247,27 +304,33 @@ def pagination(url: str, page: int, category: str, search: Optional[str] = None)
         else:
             combined_url = url
 
-        # Update the query parameters to include the current page number
-        page_url = build_page_url(combined_url, page)
-
         # For certain categories, we might not paginate.
         paginated = category not in {'following', 'top', 'cat_list'}
 
+        # Update the query parameters to include the page numbers of this folder
+        page_urls = folder_page_urls(combined_url, page, paginated)
+
         # Retrieve results
-        amount = list_rumble(page_url, category)
+        amount, has_more = list_rumble(page_urls, category)
 
         # Handle empty results
         if amount == 0:
             dialog = xbmcgui.Dialog()
             if dialog.yesno("No results loaded", "Would you like to try again?"):
+                # make sure the retry goes to the network instead of the cached pages
+                for page_url in page_urls:
+                    RESPONSE_CACHE.invalidate(cache_key(page_url, SETTINGS.get('username')))
+                    LISTING_CACHE.invalidate(page_url)
                 xbmc.executebuiltin('Container.Refresh')
             else:
                 xbmc.executebuiltin('Container.GoBack')
             return
 
-        # If pagination is enabled and there are enough items, add a link for the next page.
-        if paginated and amount > 15 and page < 10:
+        # If pagination is enabled and the last page still had new items, add a link for the next folder.
+        next_page_urls = []
+        if paginated and has_more:
             next_page = page + 1
+            next_page_urls = folder_page_urls(combined_url, next_page)
             name = f"{get_string(30150)} {next_page}"
             list_item = xbmcgui.ListItem(name)
 
@@ -283,26 +346,14 @@ def pagination(url: str, page: int, category: str, search: Optional[str] = None)
                 link = f"{link}&search={urllib.parse.quote_plus(search)}"
 
             xbmcplugin.addDirectoryItem(PLUGIN_ID, link, list_item, True)
-    xbmcplugin.endOfDirectory(PLUGIN_ID)
-
-
-def extract_image_url(html_content: str, image_id: int) -> str:
-    """
-    Extract the URL of an image from a CSS background-image rule based on its image ID.
-
-    This function searches the provided HTML content for a CSS rule corresponding to the
-    given image ID and extracts the URL specified in the 'background-image' property.
-
-    Args:
-        html_content (str): The HTML content to search.
-        image_id (int): The image identifier used in the CSS class (e.g., in 'user-image--img--id-{image_id}').
+        xbmcplugin.endOfDirectory(PLUGIN_ID)
 
-    Returns:
-        str: The extracted image URL if found; otherwise, an empty string.
-    """
-    pattern = rf"i\.user-image--img--id-{image_id}.*?\{{\s*background-image:\s*url\((.*?)\);"
-    matches = re.findall(pattern, html_content, flags=re.MULTILINE | re.DOTALL | re.IGNORECASE)
-    return matches[0] if matches else ""
+        # Kodi shows the listing now; load the next folder while the user looks at this one
+        spec = listing_spec(combined_url, category)
+        if next_page_urls and spec:
+            prefetch_listings(next_page_urls, spec.listing_type)
+        return
+    xbmcplugin.endOfDirectory(PLUGIN_ID)
 
 
 def get_video_id(url):
@@ -317,12 +368,20 @@ def get_video_id(url):
     The JSON is then parsed to retrieve the video_id value. If successful, the video_id is returned
     as a string. Otherwise, the function returns False.
 
+    The id is looked up in the video index first, which is filled from listing pages, so the
+    page is only downloaded for videos that have not been seen in a listing before.
+
     Args:
         url (str): The Rumble video URL.
 
     Returns:
         str or False: The extracted video_id if found; otherwise, False.
     """
+    video_id = VIDEO_INDEX.get(url)
+    if video_id:
+        xbmc.log("[DEBUG] get_video_id: Found video_id in index: " + video_id, xbmc.LOGDEBUG)
+        return video_id
+
     data = request_get(url)
 
     # Look for the hx-vals attribute that contains the JSON with "video_id"
@@ -333,6 +392,7 @@ def get_video_id(url):
             hx_data = json.loads(hx_json_str)
             video_id = str(hx_data.get("video_id"))
             xbmc.log("[DEBUG] get_video_id: Extracted video_id from hx-vals: " + video_id, xbmc.LOGDEBUG)
+            VIDEO_INDEX.put(url, video_id)
             return video_id
         except Exception as e:
             xbmc.log("[DEBUG] get_video_id: Error parsing hx-vals JSON: " + str(e), xbmc.LOGDEBUG)
@@ -345,54 +405,67 @@ def get_video_id(url):
 
 
 
-def list_rumble(url, cat):
+def list_rumble(urls: Union[str, List[str]], cat: str) -> Tuple[int, bool]:
     """
     Method to get and display items from Rumble.
 
+    Several page URLs are fetched concurrently and shown as one merged listing, without the
+    cards repeated across page boundaries. Pages in lib.listing.LISTING_CACHE (prefetched,
+    warmed by the service or seen before) are rendered without touching the network; browse
+    pages past their lifetime are revalidated in the background and the container is
+    refreshed only if their cards changed. The revalidation finishes before the plugin exits
+    (see lib.listing.wait_for_background), or is handed to the background service.
+
     Parameters:
-    url (str): The URL from which to retrieve the items.
+    urls (Union[str, List[str]]): The URL, or consecutive page URLs, from which to retrieve the items.
     cat (str): The category of items to retrieve.
 
     Returns:
-    int: The number of items retrieved and displayed.
+    Tuple[int, bool]: The number of items retrieved and displayed, and whether the last page
+    still had new items (so there is probably a next page).
     """
-    amount = 0
-    headers = None
+    if isinstance(urls, str):
+        urls = [urls]
+
+    spec = listing_spec(urls[0], cat)
+    if not spec:
+        return 0, False
 
-    if 'subscriptions' in url or cat == 'following':
+    if 'subscriptions' in urls[0] or cat == 'following':
         # make sure there is a session
         # result is stored in a cookie
         RUMBLE_USER.has_session()
 
-    data = request_get(url, None, headers)
+    # pages seen before render from the cache at once; stale ones are fetched again afterwards
+    pages, stale = load_listings_stale(urls, spec.listing_type)
+    revalidate_listings(stale, spec.listing_type, refresh_current_container)
+    cards = merge_listings(pages)
+    has_more = bool(pages[-1]) and len(merge_listings(pages[:-1])) < len(cards)
+    return show_cards(cards, spec.category, spec.listing_type, spec.is_search, spec.play_mode), has_more
 
-    # Fix for favorites & search
-    if cat in { 'other', 'channel' } and '/c/' in url:
-        cat = 'channel_video'
 
-    if 'search' in url:
-        if cat == 'video':
-            amount = create_directory_listing( data, cat, 'video', True, 1 )
-        else:
-            amount = create_directory_listing( data, cat, 'channel', True )
-    elif cat in { 'subscriptions', 'cat_video', 'live_stream', 'playlist' }:
-        amount = create_directory_listing( data, cat, cat, False, 2 )
-    elif cat in { 'channel', 'top', 'other' }:
-        amount = create_directory_listing( data, cat, 'video', False, 2 )
-    elif cat in { 'channel_video', 'user' }:
-        amount = create_directory_listing( data, cat, 'channel_video', False, 2 )
-    elif cat == 'following':
-        amount = create_directory_listing( data, cat, 'following', False, 2 )
-    elif cat == 'cat_list':
-        amount = create_directory_listing( data, cat, cat, False )
+def refresh_current_container() -> None:
+    """
+    Refresh the Kodi container if it still shows the listing of this invocation.
 
-    return amount
+    Called from background revalidation, by which time the user may have moved to another folder.
+
+    Returns:
+        None
+    """
+    current_path = PLUGIN_URL + (sys.argv[2] if len(sys.argv) > 2 else '')
+    if xbmc.getInfoLabel('Container.FolderPath') == current_path:
+        xbmc.executebuiltin('Container.Refresh')
+    else:
+        xbmc.log(f"[DEBUG] refresh_current_container: {current_path} is no longer shown", xbmc.LOGDEBUG)
 
 
 def create_directory_listing(html_data: str, category: str, listing_type: str = 'video', is_search: bool = False, play_mode: int = 0) -> int:
     """
     Creates and displays a directory listing based on the provided HTML content and listing type.
 
+    The page is parsed into cards by lib.parser.parse_cards and the cards are rendered by show_cards.
+
     Parameters:
         html_data (str): The HTML content containing the directory listing items.
         category (str): The category for the directory listing items.
@@ -406,175 +479,234 @@ def create_directory_listing(html_data: str, category: str, listing_type: str =
     Returns:
         int: The number of directory listing items created.
     """
+    with TIMER.phase('parse'):
+        cards = list(parse_cards(html_data, listing_type))
+    return show_cards(cards, category, listing_type, is_search, play_mode)
+
+
+def show_cards(cards: List[Card], category: str, listing_type: str = 'video', is_search: bool = False, play_mode: int = 0) -> int:
+    """
+    Index and render the parsed cards of a listing page.
+
+    Parameters:
+        cards (List[Card]): The cards parsed from the page.
+        category (str): The category for the directory listing items.
+        listing_type (str, optional): The layout the cards were parsed from. Defaults to 'video'.
+        is_search (bool, optional): Indicates whether the listing is generated as a result of a search.
+            Defaults to False.
+        play_mode (int, optional): The play mode for the directory items. Defaults to 0.
+
+    Returns:
+        int: The number of cards on the page, including search results of other types.
+    """
     xbmc.log(
-        f"[DEBUG] create_directory_listing called with listing_type={listing_type}, category={category}, is_search={is_search}, play_mode={play_mode}",
+        f"[DEBUG] show_cards called with listing_type={listing_type}, category={category}, is_search={is_search}, play_mode={play_mode}",
     )
-    item_count = 0
-    one_line_titles = ADDON.getSetting('one_line_titles') == 'true'
+    index_video_ids(cards)
+    render_cards(filter_search_cards(cards, category) if is_search else cards, category, play_mode)
+    return len(cards)
 
-    if listing_type == 'video':
-        video_pattern = re.compile(
-            r'href=\"([^\"]+)\"><div class=\"(?:[^\"]+)\"><img\s*class=\"video-item--img\"\s*src=\"([^\"]+)\"\s*alt=\"(?:[^\"]+)\"\s*>(?:<span class=\"video-item--watching\">[^\<]+</span>)?(?:<div class=video-item--overlay-rank>(?:[0-9]+)</div>)?</div><(?:[^\>]+)></span></a><div class=\"video-item--info\"><time class=\"video-item--meta video-item--time\" datetime=(.+?)-(.+?)-(.+?)T(?:.+?) title\=\"(?:[^\"]+)\">(?:[^\<]+)</time><h3 class=video-item--title>(.+?)</h3><address(?:[^\>]+)><a rel=author class=\"(?:[^\=]+)=(.+?)><div class=ellipsis-1>(.+?)</div>',
-            re.MULTILINE | re.DOTALL | re.IGNORECASE
-        )
-        videos = video_pattern.findall(html_data)
-        if videos:
-            item_count = len(videos)
-            for link, img, year, month, day, title, channel_link, channel_name in videos:
-                info_labels = {}
-                if '<svg' in channel_name:
-                    channel_name = channel_name.split('<svg')[0] + " (Verified)"
-                info_labels['year'] = year
-                video_title = '[B]' + clean_text(title) + '[/B]'
-                video_title += ' - ' if one_line_titles else '\n'
-                video_title += '[COLOR gold]' + channel_name + '[/COLOR] - [COLOR lime]' + get_date_formatted(DATE_FORMAT, year, month, day) + '[/COLOR]'
-                images = {'thumb': str(img), 'fanart': str(img)}
-                add_dir(video_title, BASE_URL + link, 4, images, info_labels, category, False, True, play_mode, {'name': channel_link, 'subscribe': True})
-    elif listing_type in {'cat_video', 'subscriptions', 'live_stream', 'channel_video', 'playlist'}:
-        if listing_type == 'live_stream':
-            videos_regex = r'<div class=\"thumbnail__grid\"\s*role=\"list\">(.*)<nav class=\"paginator\">'
-        elif listing_type == 'playlist':
-            videos_regex = r'<ol\s*class=\"videostream__list\"(?:[^>]+)>(.*)</ol>'
+
+def index_video_ids(cards: List[Card]) -> None:
+    """
+    Remember the numeric ids exposed by listing cards so playback, comments and Watch Later
+    actions do not need to download the video page.
+
+    Args:
+        cards (List[Card]): Parsed listing cards; only VideoCards with an id are stored.
+
+    Returns:
+        None
+    """
+    try:
+        VIDEO_INDEX.put_many((card.url, card.video_id) for card in cards if isinstance(card, VideoCard) and card.video_id)
+    except Exception as e:
+        xbmc.log(f"[Video Index] Unable to store video ids: {e}", xbmc.LOGWARNING)
+
+
+def filter_search_cards(cards: List[Card], category: str) -> List[Card]:
+    """
+    Keep only the search results matching the searched type.
+
+    Channel searches return both channels and users, so 'channel' keeps '/c/' links and any
+    other category keeps '/user/' links. Video cards are always kept.
+
+    Args:
+        cards (List[Card]): The parsed search results.
+        category (str): The searched category ('video', 'channel' or 'user').
+
+    Returns:
+        List[Card]: The cards to display.
+    """
+    wanted = '/c/' if category == 'channel' else '/user/'
+    return [card for card in cards if not isinstance(card, ChannelCard) or wanted in card.path]
+
+
+@TIMER.timed('render')
+def render_cards(cards: List[Card], category: str, play_mode: int = 0) -> None:
+    """
+    Render parsed cards as directory items and add them to Kodi in one batch.
+
+    Args:
+        cards (List[Card]): VideoCard, ChannelCard and CategoryCard records from lib.parser.
+        category (str): The category of the listing the cards came from.
+        play_mode (int, optional): The play mode for the directory items. Defaults to 0.
+
+    Returns:
+        None
+    """
+    one_line_titles = SETTINGS.get('one_line_titles') == 'true'
+    separator = ' - ' if one_line_titles else '\n'
+    load_local_art(card_thumbnails(cards))
+
+    items = []
+    for card in cards:
+        if isinstance(card, VideoCard):
+            items.append(render_video_card(card, category, play_mode, separator))
+        elif isinstance(card, ChannelCard):
+            items.append(render_channel_card(card, category, play_mode, separator))
         else:
-            videos_regex = r'<ol\s*class=\"thumbnail__grid\">(.*)</ol>'
-        videos_section = re.compile(videos_regex, re.DOTALL | re.IGNORECASE).findall(html_data)
-        if videos_section:
-            if listing_type == 'playlist':
-                video_items = videos_section[0].split('"videostream videostream__list-item')
-            else:
-                video_items = videos_section[0].split('"videostream thumbnail__grid-')
-            video_items.pop(0)
-            item_count = len(video_items)
-            for video in video_items:
-                video_title = ''
-                images = {}
-                info_labels = {}
-                subscribe_context = {}
-
-                title_match = re.compile(r'<h3(?:[^\>]+)?>(.*)</h3>', re.DOTALL | re.IGNORECASE).findall(video)
-                link_match = re.compile(r'<a\sclass="videostream__link link"\sdraggable="false"\shref="([^\"]+)">', re.DOTALL | re.IGNORECASE).findall(video)
-                img_match = re.compile(r'<img\s*class=\"thumbnail__image\"\s*draggable=\"false\"\s*src=\"([^\"]+)\"', re.DOTALL | re.IGNORECASE).findall(video)
-
-                if title_match:
-                    video_title = '[B]' + clean_text(title_match[0]) + '[/B]'
-                if 'videostream__status--live' in video:
-                    video_title += ' [COLOR red](Live)[/COLOR]'
-                if 'videostream__status--upcoming' in video:
-                    video_title += ' [COLOR yellow](Upcoming)[/COLOR]'
-
-                channel_name_match = re.compile(
-                    r'<span\sclass="channel__name(?:[^\"]+)" title="(?:[^\"]+)">([^\<]+)</span>(\s*<svg class=channel__verified)?',
-                    re.DOTALL | re.IGNORECASE
-                ).findall(video)
-                channel_link_match = re.compile(
-                    r'<a\s*rel=\"author\"\s*class=\"channel__link\slink\s(?:[^\"]+)\"\s*href=\"([^\"]+)\"\s*>',
-                    re.DOTALL | re.IGNORECASE
-                ).findall(video)
-                if channel_name_match:
-                    video_title += ' - ' if one_line_titles else '\n'
-                    video_title += '[COLOR gold]' + clean_text(channel_name_match[0][0])
-                    if channel_name_match[0][1]:
-                        video_title += " (Verified)"
-                    video_title += '[/COLOR]'
-                    if channel_link_match:
-                        subscribe_context = {'name': channel_link_match[0], 'subscribe': True}
-                date_time_match = re.compile(
-                    r'<time\s*class=\"(?:[^\"]+)\"\s*datetime=\"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})-(\d{2}):(\d{2})\"',
-                    re.DOTALL | re.IGNORECASE
-                ).findall(video)
-                if date_time_match:
-                    info_labels['year'] = date_time_match[0][0]
-                    video_title += ' - [COLOR lime]' + get_date_formatted(DATE_FORMAT, date_time_match[0][0], date_time_match[0][1], date_time_match[0][2]) + '[/COLOR]'
-                if img_match:
-                    images = {'thumb': str(img_match[0]), 'fanart': str(img_match[0])}
-                duration_match = re.compile(r'videostream__status--duration\"\s*>([^<]+)</div>', re.DOTALL | re.IGNORECASE).findall(video)
-                if duration_match:
-                    info_labels['duration'] = duration_to_secs(duration_match[0].strip())
-                add_dir(video_title, BASE_URL + link_match[0], 4, images, info_labels, category, False, True, play_mode, subscribe_context)
-    elif listing_type == 'cat_list':
-        category_list = re.compile(
-            r'<a\s*class=\"category__link link\"\s*href=\"([^\"]+)\"\s*>\s*<img\s*class=\"category__image\"\s*src=\"([^\"]+)\"\s*alt=(?:[^\>]+)>\s*<strong class=\"category__title\">([^\<]+)</strong>',
-            re.DOTALL | re.IGNORECASE
-        ).findall(html_data)
-        if category_list:
-            item_count = len(category_list)
-            for link, img, title in category_list:
-                new_category = 'channel_video'
-                images = {'thumb': str(img), 'fanart': str(img)}
-                add_dir(clean_text(title), BASE_URL + link.strip() + '/videos', 3, images, {}, new_category)
-    elif listing_type == 'following':
-        followed_regex = r'<ol\s*class=\"followed-channels__list\">(.*)</ol>'
-        followed_section = re.compile(followed_regex, re.DOTALL | re.IGNORECASE).findall(html_data)
-        if followed_section:
-            video_items = followed_section[0].split('"followed-channel flex items-')
-            video_items.pop(0)
-            item_count = len(video_items)
-            for video in video_items:
-                video_title = ''
-                images = {}
-                title_match = re.compile(r'<span\s*class=\"line-clamp-2\">([^<]+)<\/span>', re.DOTALL | re.IGNORECASE).findall(video)
-                followers_match = re.compile(r'<div\s*class=\"followed-channel__followers(?:[^\"]+)\">([^<]+)</div>', re.DOTALL | re.IGNORECASE).findall(video)
-                link_match = re.compile(r'<a\s*class=\"(?:[^\"]+)\"\s*href=\"(\/(?:c|user)\/[^\"]+)\"\s*>', re.DOTALL | re.IGNORECASE).findall(video)
-                img_match = re.compile(r'<(?:img|span)\s*class=\"channel__avatar([^\"]+)\"\s*(?:src=\"([^\"]+)\")?', re.DOTALL | re.IGNORECASE).findall(video)
-                if title_match:
-                    video_title = '[B]' + clean_text(title_match[0]) + '[/B]'
-                if '<use href="#channel_verified" />' in video:
-                    video_title += ' [COLOR gold](Verified)[/COLOR]'
-                channel_link = link_match[0] if link_match else ""
-                if img_match:
-                    if 'channel__letter' in img_match[0][0]:
-                        image_url = MEDIA_DIR + 'letters/' + title_match[0][0].lower() if title_match else ''
-                    else:
-                        image_url = img_match[0][1]
-                    images = {'thumb': str(image_url), 'fanart': str(image_url)}
-                    if 'channel__live' in img_match[0][0]:
-                        video_title += ' [COLOR red](Live)[/COLOR]'
-                if followers_match:
-                    video_title += ' - ' if one_line_titles else '\n'
-                    video_title += '[COLOR green]' + followers_match[0].strip() + '[/COLOR]'
-                new_category = 'user' if '/user/' in channel_link else 'channel_video'
-                add_dir(video_title, BASE_URL + channel_link, 3, images, {}, new_category, True, True, play_mode, {'name': channel_link, 'subscribe': False})
+            items.append(build_dir_item(card.title, card.url, 3, card_images(card.thumb), {}, 'channel_video'))
+
+    add_dir_items(items)
+
+
+def load_local_art(thumb_urls: List[str]) -> None:
+    """
+    Look up the locally stored art of thumbnail URLs for card_images, and queue the ones not
+    stored yet for the background service so the next render of the listing uses local files.
+
+    Args:
+        thumb_urls (List[str]): The remote thumbnail URLs of the items about to be rendered.
+
+    Returns:
+        None
+    """
+    if not thumb_urls:
+        return
+    art = get_listing_context().art
+    try:
+        art.update(THUMBNAILS.local_art(thumb_urls))
+    except Exception as e:
+        xbmc.log(f"[Thumbnails] Unable to read the thumbnail cache: {e}", xbmc.LOGWARNING)
+        return
+    queue_thumbnails([url for url in thumb_urls if url not in art])
+
+
+def card_images(thumb: str) -> dict:
+    """
+    Get the art of an item from its remote thumbnail URL.
+
+    Args:
+        thumb (str): The remote thumbnail URL, may be empty.
+
+    Returns:
+        dict: 'thumb' and 'fanart' pointing at the local downscaled files when they are stored,
+        else at the remote URL, plus 'source' with the remote URL. Empty when there is no thumbnail.
+    """
+    if not thumb:
+        return {}
+    local = get_listing_context().art.get(thumb, {})
+    return {'thumb': local.get('thumb', thumb), 'fanart': local.get('fanart', thumb), 'source': thumb}
+
+
+def render_video_card(card: VideoCard, category: str, play_mode: int, separator: str) -> Tuple[str, xbmcgui.ListItem, bool]:
+    """
+    Render a video card as a playable directory item.
+
+    The label shows the title in bold, live/upcoming state, the channel in gold and the upload date in lime.
+
+    Args:
+        card (VideoCard): The video to render.
+        category (str): The category of the listing the card came from.
+        play_mode (int): The play mode for the item.
+        separator (str): Text placed between the title and the channel line.
+
+    Returns:
+        Tuple[str, xbmcgui.ListItem, bool]: The directory item from build_dir_item.
+    """
+    info_labels = {}
+    subscribe_context = {}
+
+    video_title = '[B]' + card.title + '[/B]'
+    if card.live:
+        video_title += ' [COLOR red](Live)[/COLOR]'
+    if card.upcoming:
+        video_title += ' [COLOR yellow](Upcoming)[/COLOR]'
+    if card.channel:
+        video_title += separator + '[COLOR gold]' + card.channel
+        if card.verified:
+            video_title += " (Verified)"
+        video_title += '[/COLOR]'
+    if card.channel_url:
+        subscribed = get_listing_context().subscriptions.get(card.channel_url, False)
+        subscribe_context = {'name': card.channel_url, 'subscribe': not subscribed}
+    if card.published:
+        published = card.published
+        info_labels['year'] = str(published.year)
+        video_title += ' - [COLOR lime]' + get_date_formatted(DATE_FORMAT, published.year, published.month, published.day) + '[/COLOR]'
+    if card.duration:
+        info_labels['duration'] = str(card.duration)
+
+    item = build_dir_item(video_title, card.url, 4, card_images(card.thumb), info_labels, category, False, True, play_mode, subscribe_context)
+    if card.live:
+        item[1].addContextMenuItems([live_chat_menu_item(card.url)])
+    return item
+
+
+def render_channel_card(card: ChannelCard, category: str, play_mode: int, separator: str) -> Tuple[str, xbmcgui.ListItem, bool]:
+    """
+    Render a channel card as a folder of the channel's videos.
+
+    Followed channels show their follower text and offer to unsubscribe; search results show
+    the subscriber count and offer to subscribe. Channels without an avatar use the letter images.
+
+    Args:
+        card (ChannelCard): The channel to render.
+        category (str): The category of the listing the card came from.
+        play_mode (int): The play mode for the item.
+        separator (str): Text placed between the name and the follower line.
+
+    Returns:
+        Tuple[str, xbmcgui.ListItem, bool]: The directory item from build_dir_item.
+    """
+    video_title = '[B]' + card.title + '[/B]'
+    if card.verified:
+        video_title += ' [COLOR gold](Verified)[/COLOR]'
+    if card.live:
+        video_title += ' [COLOR red](Live)[/COLOR]'
+
+    subscribed = get_listing_context().subscriptions.get(card.path, card.subscribed)
+    if subscribed:
+        if card.followers:
+            video_title += separator + '[COLOR green]' + card.followers + '[/COLOR]'
+        new_category = 'user' if '/user/' in card.path else 'channel_video'
     else:
-        channels_regex = r'<div class="main-and-sidebar">(.*)<nav class="paginator">'
-        channels_section = re.compile(channels_regex, re.DOTALL | re.IGNORECASE).findall(html_data)
-        if channels_section:
-            channels = channels_section[0].split('<article')
-            channels.pop(0)
-            item_count = len(channels)
-            for channel in channels:
-                link_match = re.compile(r'<a\shref=([^\s]+)\sclass=\"(?:[^\"]+)\">', re.DOTALL | re.IGNORECASE).findall(channel)
-                channel_link = link_match[0] if link_match else ""
-                xbmc.log(json.dumps(channel_link), xbmc.LOGWARNING)
-                # Filter based on search context and category type
-                if is_search:
-                    if category == 'channel' and '/c/' not in channel_link:
-                        continue
-                    elif category != 'channel' and '/user/' not in channel_link:
-                        continue
-                images = {}
-                channel_name_match = re.compile(r'<span\sclass=\"block\struncate\">([^<]+)<\/span>', re.DOTALL | re.IGNORECASE).findall(channel)
-                channel_name = channel_name_match[0] if channel_name_match else ""
-                verified = bool(re.compile(r'<title>Verified</title>', re.DOTALL | re.IGNORECASE).findall(channel))
-                followers_match = re.compile(r'<span\sclass=\"(?:[^\"]+)\">\s+([^&]+)&nbsp;Follower(?:s)?\s+</span>', re.DOTALL | re.IGNORECASE).findall(channel)
-                followers = followers_match[0] if followers_match else "0"
-                img_id_match = re.compile(r'user-image--img--id-([^\s]+)\s', re.DOTALL | re.IGNORECASE).findall(channel)
-                img_id_str = img_id_match[0] if img_id_match else ""
-                if img_id_str:
-                    try:
-                        img_id = int(img_id_str)
-                        img_url = str(extract_image_url(html_data, img_id))
-                    except ValueError:
-                        img_url = MEDIA_DIR + 'letters/' + channel_name[0] + '.png'
-                else:
-                    img_url = MEDIA_DIR + 'letters/' + channel_name[0] + '.png'
-                images = {'thumb': str(img_url), 'fanart': str(img_url)}
-                video_title = '[B]' + channel_name + '[/B]'
-                if verified:
-                    video_title += ' [COLOR gold](Verified)[/COLOR]'
-                video_title += ' - ' if one_line_titles else '\n'
-                video_title += '[COLOR palegreen]' + followers + '[/COLOR] [COLOR yellow]' + get_string(30156) + '[/COLOR]'
-                add_dir(video_title, BASE_URL + channel_link, 3, images, {}, category, True, True, play_mode, {'name': channel_link, 'subscribe': True})
-    return item_count
+        video_title += separator + '[COLOR palegreen]' + (card.followers or '0') + '[/COLOR] [COLOR yellow]' + get_string(30156) + '[/COLOR]'
+        new_category = category
+
+    if card.thumb:
+        images = card_images(card.thumb)
+    else:
+        thumb = MEDIA_DIR + 'letters/' + card.title[:1].upper() + '.png'
+        images = {'thumb': thumb, 'fanart': thumb}
+    item = build_dir_item(video_title, card.url, 3, images, {}, new_category, True, True, play_mode, {'name': card.path, 'subscribe': not subscribed})
+    if card.live:
+        item[1].addContextMenuItems([live_chat_menu_item(card.url)])
+    return item
+
+
+def live_chat_menu_item(url: str) -> Tuple[str, str]:
+    """
+    Get the context menu entry opening the live chat of a live video or channel.
+
+    Args:
+        url (str): The video or channel URL.
+
+    Returns:
+        Tuple[str, str]: The label and the RunPlugin action.
+    """
+    return ('Live Chat', 'RunPlugin(%s)' % build_url({'mode': '16', 'url': url}))
 
 def extract_playlist_video_id(url: str) -> Optional[str]:
     """
@@ -590,12 +722,20 @@ def extract_playlist_video_id(url: str) -> Optional[str]:
     back to searching for a data-id attribute. The returned video_id should be the one
     expected by Rumble’s API (e.g. 403302952).
 
+    The video index is consulted first, so the page is only downloaded for videos that have
+    not been seen in a listing before.
+
     Args:
         url (str): The URL of the playlist video page.
 
     Returns:
         Optional[str]: The extracted playlist video ID if found; otherwise, None.
     """
+    video_id = VIDEO_INDEX.get(url)
+    if video_id:
+        xbmc.log(f"Found video ID in index: {video_id}", xbmc.LOGDEBUG)
+        return video_id
+
     html_content = request_get(url)
     xbmc.log(f"HTML content: {html_content}", xbmc.LOGDEBUG)  # Log HTML for debugging
 
@@ -609,6 +749,7 @@ def extract_playlist_video_id(url: str) -> Optional[str]:
             hx_data = json.loads(hx_json_str)
             video_id = str(hx_data.get("video_id"))
             xbmc.log(f"Found video ID from hx-vals: {video_id}", xbmc.LOGDEBUG)
+            VIDEO_INDEX.put(url, video_id)
             return video_id
         except Exception as e:
             xbmc.log(f"Error parsing hx-vals JSON: {e}", xbmc.LOGDEBUG)
@@ -618,22 +759,130 @@ def extract_playlist_video_id(url: str) -> Optional[str]:
     if match:
         video_id = match.group(1)
         xbmc.log(f"Found video ID from data-id: {video_id}", xbmc.LOGDEBUG)
+        VIDEO_INDEX.put(url, video_id)
         return video_id
     else:
         xbmc.log(f"Unable to find the video ID from the URL: {url}", xbmc.LOGWARNING)
     return None
 
 
+def get_stream_manifest(video_id: str) -> Optional[StreamManifest]:
+    """
+    Get the stream manifest of a video, from the manifest cache when possible.
+
+    Manifests are fetched from the embedJS video API and cached by video id for the
+    'stream_cache_ttl' setting (minutes), or until their signed URLs expire if that is sooner.
+    Live streams are always fetched.
+
+    Args:
+        video_id (str): The numeric Rumble video id.
+
+    Returns:
+        Optional[StreamManifest]: The renditions of the video, or None if the response was not a video.
+    """
+    manifest = MANIFEST_CACHE.get(video_id)
+    if manifest:
+        xbmc.log(f"[DEBUG] get_stream_manifest: Using cached manifest for {video_id}", xbmc.LOGDEBUG)
+        return manifest
+
+    api_url = f"{BASE_URL}/embedJS/u3/?request=video&ver=2&v={video_id}"
+    manifest = StreamManifest.from_json(request_get(api_url), video_id)
+    if manifest:
+        MANIFEST_CACHE.put(manifest, stream_cache_ttl())
+    return manifest
+
+
+def stream_cache_ttl() -> int:
+    """
+    Get the lifetime of cached stream manifests in seconds from the 'stream_cache_ttl' setting.
+
+    Returns:
+        int: The lifetime in seconds, 0 when caching is disabled.
+    """
+    try:
+        return int(SETTINGS.get('stream_cache_ttl') or 60) * 60
+    except ValueError:
+        return 3600
+
+
+def hls_renditions(playlist_url: str, max_age: Optional[int] = None) -> List[Rendition]:
+    """
+    Expand an HLS master playlist into one rendition per variant stream, highest first.
+
+    Variants keep the bitrate, resolution and codecs from the playlist, and audio-only
+    variants are listed last. A media playlist (no variants) yields nothing.
+
+    Args:
+        playlist_url (str): The URL of the master playlist.
+        max_age (int, optional): Response cache lifetime for the playlist, see request_get.
+
+    Returns:
+        List[Rendition]: The variant streams.
+    """
+    from lib.m3u8 import parse_playlist
+    playlist = parse_playlist(request_get(playlist_url, max_age=max_age), base_url=playlist_url)
+    return [
+        Rendition(
+            'hls',
+            'audio' if variant.audio_only else str(variant.height or variant.bitrate),
+            variant.uri,
+            height=variant.height,
+            width=variant.width,
+            bitrate=variant.bitrate,
+            codecs=variant.codecs,
+        )
+        for variant in playlist.sorted_variants()
+    ]
+
+
+def adaptive_rendition(renditions: List[Rendition]) -> Optional[Rendition]:
+    """
+    Pick the highest quality rendition that fits the download throughput to its CDN host.
+
+    The throughput comes from the rolling per-host estimate fed by media downloads. When there
+    is no recent estimate for the CDN host, a short Range request against the best rendition
+    measures it. Estimates of other hosts are not used, without one the default rendition
+    (an adaptive HLS stream, else the lowest quality) is played. The share of the throughput
+    a stream may use is the 'adaptive_margin' setting (percent).
+
+    Args:
+        renditions (List[Rendition]): The playable renditions, highest first.
+
+    Returns:
+        Optional[Rendition]: The chosen rendition, or None if there are none.
+    """
+    from lib.throughput import THROUGHPUT, pick_rendition
+    if not renditions:
+        return None
+
+    probe_url = renditions[0].url
+    kbps = THROUGHPUT.estimate(probe_url)
+    if kbps is None and not renditions[0].is_hls:
+        kbps = probe_throughput(probe_url)
+
+    try:
+        margin = min(max(int(SETTINGS.get('adaptive_margin') or 70), 10), 100) / 100.0
+    except ValueError:
+        margin = 0.7
+
+    rendition = pick_rendition(renditions, kbps, margin)
+    xbmc.log(f"[DEBUG] adaptive_rendition: {kbps} kbps -> {rendition.describe() if rendition else None}", xbmc.LOGDEBUG)
+    return rendition
+
+
+@TIMER.timed('resolve')
 def resolve_video_url(video_url: str) -> Optional[str]:
     """
     Resolves a Rumble video URL to a direct media link based on the user's playback settings.
 
-    This function extracts the video ID from the provided Rumble URL, retrieves available quality
-    options via the Rumble API, and selects the appropriate media URL according to the user's
-    playback method preference:
+    This function extracts the video ID from the provided Rumble URL, retrieves the StreamManifest
+    of available renditions via the Rumble API, and selects the appropriate media URL according
+    to the user's playback method preference:
       - Playback method 0 (high auto): Automatically selects the highest quality.
       - Playback method 1 (low auto): Automatically selects the lowest quality.
       - Playback method 2 (quality select): Prompts the user to choose the desired quality.
+      - Playback method 3 (adaptive): Selects the highest quality that fits the measured
+        throughput to the CDN host, see adaptive_rendition.
 
     Args:
         video_url (str): The Rumble video URL to resolve.
@@ -641,53 +890,48 @@ def resolve_video_url(video_url: str) -> Optional[str]:
     Returns:
         Optional[str]: The resolved direct media URL if successful; otherwise, None.
     """
-    playback_method: int = int(ADDON.getSetting('playbackMethod'))  # 0, 1, or 2
-    resolved_url: Optional[str] = None
-    quality_urls: List[Tuple[str, str]] = []  # List of tuples (quality, url)
+    playback_method: int = int(SETTINGS.get('playbackMethod') or 0)  # 0, 1, 2 or 3
 
     video_id = get_video_id(video_url)
     if not video_id:
         return None
 
-    api_url = f"{BASE_URL}/embedJS/u3/?request=video&ver=2&v={video_id}"
-    api_response = request_get(api_url)
-    qualities = ['1080', '720', '480', '360', 'hls']
-
-    for quality in qualities:
-        pattern = rf'"{quality}".+?url.+?:"(.*?)"'
-        matches = re.findall(pattern, api_response, flags=re.MULTILINE | re.DOTALL | re.IGNORECASE)
-        if matches:
-            if playback_method == 0:
-                resolved_url = matches[0]
-                break
-            else:
-                quality_urls.append((quality, matches[0]))
-
-    if playback_method > 0 and quality_urls:
-        # If only one URL is available and it's an HLS stream, process it using M3U8Processor.
-        if len(quality_urls) == 1 and '.m3u8' in quality_urls[0][1]:
-            from lib.m3u8 import M3U8Processor  # Updated import based on available attribute
-            m3u8_handler = M3U8Processor()
-            # Assuming m3u8_handler.process returns a list of (quality, url) tuples.
-            quality_urls = m3u8_handler.process(request_get(quality_urls[0][1]))
-        if playback_method == 1:
-            # For low auto, reverse the list to select the lowest quality.
-            quality_urls.reverse()
-            resolved_url = quality_urls[0][1]
-        elif playback_method == 2:
-            # For quality select, prompt the user.
-            selected_index: int
-            if len(quality_urls) == 1:
-                selected_index = 0
-            else:
-                quality_labels = [quality for quality, _ in quality_urls]
-                selected_index = xbmcgui.Dialog().select('Select Quality', quality_labels)
-            if selected_index != -1:
-                resolved_url = quality_urls[selected_index][1]
+    manifest = get_stream_manifest(video_id)
+    if not manifest:
+        return None
 
-    if resolved_url:
-        resolved_url = resolved_url.replace(r'\/', '/')
-    return resolved_url
+    renditions = manifest.playable()
+    if not renditions:
+        return None
+
+    if playback_method == 0:
+        return renditions[0].url
+
+    # If only an HLS stream is available, offer its variant streams instead.
+    if len(renditions) == 1 and renditions[0].is_hls:
+        # master playlists of finished videos do not change, live ones are always fetched
+        max_age = 0 if manifest.is_live else stream_cache_ttl()
+        renditions = hls_renditions(renditions[0].url, max_age) or renditions
+
+    if playback_method == 3:
+        rendition = adaptive_rendition(renditions)
+        return rendition.url if rendition else None
+
+    if playback_method == 1:
+        # For low auto, take the lowest single file quality, falling back to the last entry.
+        sized = [rendition for rendition in renditions if rendition.height]
+        return min(sized, key=lambda r: r.height).url if sized else renditions[-1].url
+
+    # For quality select, prompt the user.
+    selected_index: int
+    if len(renditions) == 1:
+        selected_index = 0
+    else:
+        quality_labels = [rendition.describe() for rendition in renditions]
+        selected_index = xbmcgui.Dialog().select('Select Quality', quality_labels)
+    if selected_index != -1:
+        return renditions[selected_index].url
+    return None
 
 def play_kodi_video(video_title: str, video_url: str, thumbnail_url: str, play_method: int = 2) -> None:
     """
@@ -713,7 +957,7 @@ def play_kodi_video(video_title: str, video_url: str, thumbnail_url: str, play_m
 
     if resolved_url:
         # Apply HTTP if the user set HTTP as the default protocol.
-        if ADDON.getSetting('useHTTP') == 'true':
+        if SETTINGS.get('useHTTP') == 'true':
             resolved_url = resolved_url.replace('https://', 'http://', 1)
 
         video_list_item = xbmcgui.ListItem(video_title, path=resolved_url)
@@ -758,26 +1002,31 @@ def perform_search_and_display_results(rumble_base_url: str, search_category: st
     encoded_search_query: str = urllib.parse.quote_plus(user_search_input)
     pagination(rumble_base_url, 1, search_category, encoded_search_query)
 
-def favorites_show():
+def favorites_show(page: int = 1):
     """
     Displays the user's favorite items in the Kodi interface.
 
-    This function loads the user's favorites and creates a directory listing
+    This function loads a page of the user's favorites and creates a directory listing
     for each favorite item. If favorites exist, it displays them as selectable
     items in the Kodi interface. If no favorites are found, it shows a dialog
     informing the user.
 
     The function handles the following operations:
-    1. Loads favorite data using favorites_load().
+    1. Loads one page of favorites from the favorites database, in the order set by the
+       'favorites_sort' setting.
     2. Iterates through each favorite item if any exist.
     3. Extracts relevant information for each favorite (name, URL, mode, images, etc.).
-    4. Adds each favorite as a directory item in the Kodi interface using add_dir().
-    5. Finalizes the directory listing or shows a "no favorites" dialog.
+    4. Builds each favorite as a directory item with build_dir_item() and adds them in one batch.
+    5. Adds a link to the next page when there are more favorites.
+    6. Finalizes the directory listing or shows a "no favorites" dialog.
 
     The function uses a try-except block to handle any exceptions that may occur
     during the process, ensuring that the directory listing is properly ended
     even if an error occurs.
 
+    Args:
+        page (int, optional): The page of favorites to show. Defaults to 1.
+
     Returns:
         None
 
@@ -786,26 +1035,37 @@ def favorites_show():
         are caught and handled to ensure proper function termination.
 
     Dependencies:
-        - favorites_load(): Function to load favorite data
-        - add_dir(): Function to add directory items to Kodi interface
+        - FAVORITES: The favorites database
+        - build_dir_item() / add_dir_items(): Functions to add directory items to Kodi interface
         - xbmcplugin.endOfDirectory(): Kodi function to finalize directory listing
         - xbmcgui.Dialog().ok(): Kodi function to display dialog boxes
         - get_string(): Function to retrieve localized strings
     """
 
-    data = favorites_load()
-
     try:
+        # fetch one extra row to know if there is a next page
+        data = FAVORITES.page((page - 1) * FAVORITES_PAGE_SIZE, FAVORITES_PAGE_SIZE + 1, SETTINGS.get('favorites_sort'))
+
         if data:  # Check if the list is non-empty
-            for (name, url, mode, thumb, fanart, plot, cat, folder_str, play_str) in data:
-                images = {
-                    'thumb': str(thumb),
-                    'fanart': str(fanart)
-                }
+            items = []
+            load_local_art([str(row[3]) for row in data[:FAVORITES_PAGE_SIZE] if str(row[3]).startswith('http')])
+            for (name, url, mode, thumb, fanart, plot, cat, folder_str, play_str) in data[:FAVORITES_PAGE_SIZE]:
+                if str(thumb).startswith('http'):
+                    images = card_images(str(thumb))
+                else:
+                    images = {
+                        'thumb': str(thumb),
+                        'fanart': str(fanart)
+                    }
                 info_labels = {'plot': str(plot)}
                 folder = (folder_str == 'True')
-                add_dir(name, url, mode, images, info_labels, cat, folder, True, int(play_str))
+                items.append(build_dir_item(name, url, mode, images, info_labels, cat, folder, True, int(play_str)))
+
+            if len(data) > FAVORITES_PAGE_SIZE:
+                name = f"{get_string(30150)} {page + 1}"
+                items.append((build_url({'mode': '7', 'page': str(page + 1)}), xbmcgui.ListItem(name), True))
 
+            add_dir_items(items)
             xbmcplugin.endOfDirectory(PLUGIN_ID)
         else:
             xbmcgui.Dialog().ok(get_string(14117), get_string(30155))
@@ -821,10 +1081,11 @@ def add_favorite_video(video_title: str, video_url: str, favorite_mode: int,
     """
     Add a video to the favorites list.
 
-    This function appends a new favorite video entry—containing metadata such as
+    This function saves a new favorite video entry—containing metadata such as
     title, URL, mode, thumbnail, fanart, plot summary, category, folder flag, and playback mode—
-    to the favorites file. After updating the file, it displays a notification to inform the user
-    that the video has been added.
+    to the favorites database with a single row insert. After saving, it displays a notification
+    to inform the user that the video has been added and refreshes the listing so its context
+    menu offers removal; the listing re-renders from the local caches.
 
     Args:
         video_title (str): The title of the video.
@@ -840,20 +1101,18 @@ def add_favorite_video(video_title: str, video_url: str, favorite_mode: int,
     Returns:
         None
     """
-    favorites_data = favorites_load()
-    favorites_data.append((video_title, video_url, favorite_mode, thumbnail,
+    FAVORITES.add(Favorite(video_title, video_url, favorite_mode, thumbnail,
                            fanart_image, plot_summary, category, is_folder, playback_mode))
-    with open(favorites, 'w', encoding='utf-8') as fav_file:
-        fav_file.write(json.dumps(favorites_data))
     notify(get_string(30152), video_title, thumbnail)
+    xbmc.executebuiltin('Container.Refresh')
 
 def remove_favorite_video(video_title: str) -> None:
     """
     Remove a favorite video from the favorites list by title.
 
-    This function searches for a favorite video matching the provided title,
-    removes it from the favorites data, updates the favorites file, and notifies
-    the user of the removal.
+    This function deletes the favorites matching the provided title from the
+    favorites database and notifies the user of the removal. The refresh that follows
+    re-renders from the favorites database or the listing cache, not the network.
 
     Args:
         video_title (str): The title of the video to remove from favorites.
@@ -861,13 +1120,7 @@ def remove_favorite_video(video_title: str) -> None:
     Returns:
         None
     """
-    favorites_data = favorites_load()
-    for index, favorite in enumerate(favorites_data):
-        if favorite[0] == video_title:
-            del favorites_data[index]
-            with open(favorites, 'w', encoding='utf-8') as fav_file:
-                fav_file.write(json.dumps(favorites_data))
-            break
+    FAVORITES.remove(name=video_title)
 
     notify(get_string(30154), video_title)
     xbmc.executebuiltin('Container.Refresh')
@@ -939,6 +1192,8 @@ def manage_rumble_subscription(
         notify("Unable to perform action: No active session.")
         return False
 
+    channel_path = target_identifier
+
     # Determine the target type based on the identifier
     subscription_target = None
     if "/user/" in target_identifier:
@@ -962,12 +1217,76 @@ def manage_rumble_subscription(
                     notify(f"Subscribed to {target_identifier}", None, extra_data["thumb"])
                 else:
                     notify(f"Unsubscribed to {target_identifier}", None, extra_data["thumb"])
+                apply_subscription_locally(channel_path, subscription_action == "subscribe")
+                xbmc.executebuiltin('Container.Refresh')
                 return True
 
     # Fallback notification if no successful action took place
     notify("Unable to perform the requested action.")
     return False
 
+def apply_subscription_locally(channel_path: str, subscribed: bool) -> None:
+    """
+    Reflect a subscribe or unsubscribe action in the local state, so listings re-render
+    without fetching them again.
+
+    The action is recorded in lib.metadata.SUBSCRIPTIONS for the context menus, and the
+    cached Following listing gains or loses the channel.
+
+    Args:
+        channel_path (str): The channel path, e.g. '/c/SomeChannel' or '/user/someone'.
+        subscribed (bool): True after subscribing, False after unsubscribing.
+
+    Returns:
+        None
+    """
+    SUBSCRIPTIONS.set(channel_path, subscribed)
+    channel_url = BASE_URL + channel_path
+    following = BASE_URL + '/followed-channels%'
+
+    if not subscribed:
+        LISTING_CACHE.update(following, lambda cards: [card for card in cards if card.url != channel_url])
+        return
+
+    card = LISTING_CACHE.find_card(channel_url)
+    if isinstance(card, ChannelCard):
+        card = card._replace(subscribed=True)
+        LISTING_CACHE.update(
+            following,
+            lambda cards: cards if any(c.url == channel_url for c in cards) else [card] + cards
+        )
+
+
+def apply_watch_later_locally(video_url: str, added: bool) -> None:
+    """
+    Reflect a Watch Later change in the cached Watch Later listing, so it re-renders without
+    fetching it again.
+
+    Removed videos are dropped from every cached page. Added videos are put at the top of the
+    first page when their card is in any cached listing; otherwise the next revalidation of the
+    playlist picks them up.
+
+    Args:
+        video_url (str): The URL of the video.
+        added (bool): True after adding, False after removing.
+
+    Returns:
+        None
+    """
+    watch_later = BASE_URL + '/playlists/watch-later'
+
+    if not added:
+        LISTING_CACHE.update(watch_later + '%', lambda cards: [card for card in cards if card.url != video_url])
+        return
+
+    card = LISTING_CACHE.find_card(video_url)
+    if card:
+        LISTING_CACHE.update(
+            build_page_url(watch_later, 1),
+            lambda cards: cards if any(c.url == video_url for c in cards) else [card] + cards
+        )
+
+
 def test_rumble_login() -> None:
     """
     Reset the current session and test the Rumble user login.
@@ -1005,12 +1324,59 @@ def test_rumble_login() -> None:
     else:
         notify(get_string(30203))      # No details detected
 
+@dataclass
+class ListingContext:
+    """
+    Per-directory state shared by every item of a listing.
+
+    Attributes:
+        favorite_names (set): Names of the saved favorites, used to pick the add/remove context item.
+        logged_in (bool): Whether login details are saved, enables the account context items.
+        current_url (str): The URL of the listing being rendered, e.g. to detect the Watch Later playlist.
+        subscriptions (dict): Channel paths subscribed (True) or unsubscribed (False) from the add-on
+            since their listings were parsed, see lib.metadata.SUBSCRIPTIONS.
+        art (dict): Local thumbnail and fanart files by remote thumbnail URL, see load_local_art.
+    """
+    favorite_names: set
+    logged_in: bool
+    current_url: str
+    subscriptions: dict
+    art: dict
+
+
+_LISTING_CONTEXT: Optional[ListingContext] = None
+
+
+def get_listing_context() -> ListingContext:
+    """
+    Get the listing context for this plugin invocation, loading it on first use.
+
+    Each plugin invocation renders a single directory, so the favorites, the login
+    settings and the request parameters are read once instead of once per item.
+
+    Returns:
+        ListingContext: The shared context.
+    """
+    global _LISTING_CONTEXT
+    if _LISTING_CONTEXT is None:
+        _LISTING_CONTEXT = ListingContext(
+            favorite_names=FAVORITES.names(),
+            logged_in=bool(RUMBLE_USER.has_login_details()),
+            current_url=get_params().get('url') or '',
+            subscriptions=SUBSCRIPTIONS.overrides(),
+            art={},
+        )
+    return _LISTING_CONTEXT
+
+
+@TIMER.timed('render')
 def add_dir(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav_context=False, play=0, subscribe_context=False):
     """
     Adds a directory item to the Kodi interface for the Rumble video addon.
 
-    This function creates and configures a ListItem object with the provided information,
-    sets up context menus, and adds the item to the Kodi interface.
+    This function builds the item with build_dir_item and adds it to the Kodi interface.
+    Listings with many items should collect build_dir_item results and add them with
+    add_dir_items instead.
 
     Parameters:
     name (str): The display name of the item.
@@ -1024,35 +1390,86 @@ def add_dir(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav
     play (int): Playback mode (0: not playable, 1: unknown, 2: playable).
     subscribe_context (dict or bool): If dict, adds subscribe/unsubscribe context menu items.
 
+    Returns:
+    None
+    """
+    link, list_item, is_folder = build_dir_item(name, url, mode, images, info_labels, cat, folder, fav_context, play, subscribe_context)
+    if not is_folder:
+        xbmcplugin.setContent(PLUGIN_ID, 'videos')
+    xbmcplugin.addDirectoryItem(handle=PLUGIN_ID, url=link, listitem=list_item, isFolder=is_folder)
+
+
+def add_dir_items(items: List[Tuple[str, xbmcgui.ListItem, bool]]) -> None:
+    """
+    Hands a whole listing to Kodi in one addDirectoryItems call.
+
+    Args:
+        items (List[Tuple[str, xbmcgui.ListItem, bool]]): (url, list item, is folder) tuples from build_dir_item.
+
+    Returns:
+        None
+    """
+    if not items:
+        return
+    if not all(is_folder for _, _, is_folder in items):
+        xbmcplugin.setContent(PLUGIN_ID, 'videos')
+    xbmcplugin.addDirectoryItems(PLUGIN_ID, items, len(items))
+
+
+def build_dir_item(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav_context=False, play=0, subscribe_context=False):
+    """
+    Builds a directory item for the Rumble video addon.
+
+    This function creates and configures a ListItem object with the provided information
+    and sets up context menus. Favorites and login state come from get_listing_context(),
+    which is loaded once per directory.
+
+    Parameters:
+    name (str): The display name of the item.
+    url (str): The URL associated with the item.
+    mode (int): The mode number for the item's action.
+    images (dict): A dictionary containing 'thumb' and 'fanart' image URLs or local paths, and optionally
+        'source', the remote thumbnail a favorite is saved with.
+    info_labels (dict): A dictionary of metadata labels for the item.
+    cat (str): The category of the item.
+    folder (bool): If True, the item is treated as a folder; otherwise, as a playable item.
+    fav_context (bool): If True, adds favorite-related context menu items.
+    play (int): Playback mode (0: not playable, 1: unknown, 2: playable).
+    subscribe_context (dict or bool): If dict, adds subscribe/unsubscribe context menu items.
+
     The function performs the following main tasks:
     1. Sets up artwork (thumbnail and fanart) for the item.
     2. Builds a URL with the item's parameters.
     3. Creates and configures a ListItem object.
     4. Adds various context menu items based on the item type and user login status.
     5. Handles favorites-related functionality.
-    6. Adds the configured item to the Kodi interface.
 
     Note:
     - This function relies on several global variables and functions (e.g., HOME_DIR, MEDIA_DIR, RUMBLE_USER).
-    - It uses Kodi-specific modules like xbmcgui and xbmcplugin.
+    - It uses Kodi-specific modules like xbmcgui.
 
     Returns:
-    None
+    Tuple[str, xbmcgui.ListItem, bool]: The plugin URL, the list item and whether it is a folder.
     """
+    context = get_listing_context()
 
     art_dict = {
         'thumb': images.get( 'thumb', HOME_DIR + 'icon.png' ),
         'fanart': images.get( 'fanart', HOME_DIR + 'fanart.png' ),
     }
 
-    # set default image location to MEDIA_DIR
+    # set default image location to MEDIA_DIR, local thumbnails are absolute paths
     for art_type, art_loc in art_dict.items():
         if art_loc:
             if not art_loc.startswith( HOME_DIR ) and \
                 not art_loc.startswith( 'http' ) and \
-                not art_loc.startswith( '\\' ):
+                not art_loc.startswith( '\\' ) and \
+                not os.path.isabs( art_loc ):
                 art_dict[ art_type ] = MEDIA_DIR + art_dict[ art_type ]
 
+    # favorites keep the remote thumbnail, the local copy may be evicted
+    source = images.get( 'source' )
+
     link_params = {
         'url': url,
         'mode': str( mode ),
@@ -1075,25 +1492,20 @@ def add_dir(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav
         list_item.setArt({'icon': 'DefaultFolder.png', 'thumb': art_dict[ 'thumb' ]})
     else:
         list_item.setArt({'icon': 'DefaultVideo.png', 'thumb': art_dict[ 'thumb' ]})
-        xbmcplugin.setContent(PLUGIN_ID, 'videos')
 
     if play == 2 and mode == 4:
         list_item.setProperty('IsPlayable', 'true')
         context_menu.append((get_string(30158), 'Action(Queue)'))
 
-        if RUMBLE_USER.has_login_details():
-            # need to get current
-            params=get_params()
-            current_url = params.get( 'url', None )
-
-            if '/playlists/watch-later' in current_url:
+        if context.logged_in:
+            if '/playlists/watch-later' in context.current_url:
                 # delete watch later context
                 context_menu.append(('Delete from Watch Later','RunPlugin(%s)' % build_url( {'mode': '12','url': url, 'cat':'delete'} )))
             else:
                 # add watch later context
                 context_menu.append(('Add to Watch Later','RunPlugin(%s)' % build_url( {'mode': '12','url': url, 'cat':'add'} )))
 
-    info_labels['title'] = name
+    info_labels = dict( info_labels, title=name )
     if play:
         # adds information context menu
         info_labels['mediatype'] = 'tvshow'
@@ -1102,7 +1514,7 @@ def add_dir(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav
 
     list_item.setProperty( 'fanart_image', art_dict[ 'fanart' ] )
 
-    if RUMBLE_USER.has_login_details():
+    if context.logged_in:
 
         if subscribe_context:
             if subscribe_context['subscribe']:
@@ -1115,40 +1527,28 @@ def add_dir(name, url, mode, images={}, info_labels={}, cat='', folder=True, fav
 
     if fav_context:
 
-        favorite_str = favorites_load( True )
-
-        try:
-            name_fav = json.dumps(name)
-        except Exception:
-            name_fav = name
-
-        try:
+        if name in context.favorite_names:
+            context_menu.append((get_string(30153),'RunPlugin(%s)' % build_url( {'mode': '6','name': name} )))
+        else:
+            fav_params = {
+                'url': url,
+                'mode': '5',
+                'name': name,
+                'thumb': source or art_dict[ 'thumb' ],
+                'fanart': source or art_dict[ 'fanart' ],
+                'plot': info_labels.get( 'plot', '' ),
+                'cat': cat,
+                'folder': str(folder),
+                'fav_mode': str(mode),
+                'play': str(play),
+            }
 
-            # checks fav name via string (I do not like how this is done, so will redo in future)
-            if name_fav in favorite_str:
-                context_menu.append((get_string(30153),'RunPlugin(%s)' % build_url( {'mode': '6','name': name} )))
-            else:
-                fav_params = {
-                    'url': url,
-                    'mode': '5',
-                    'name': name,
-                    'thumb': art_dict[ 'thumb' ],
-                    'fanart': art_dict[ 'fanart' ],
-                    'plot': info_labels.get( 'plot', '' ),
-                    'cat': cat,
-                    'folder': str(folder),
-                    'fav_mode': str(mode),
-                    'play': str(play),
-                }
-
-                context_menu.append((get_string(30151),'RunPlugin(%s)' %build_url( fav_params )))
-        except Exception:
-            pass
+            context_menu.append((get_string(30151),'RunPlugin(%s)' %build_url( fav_params )))
 
     if context_menu:
         list_item.addContextMenuItems(context_menu)
 
-    xbmcplugin.addDirectoryItem(handle=PLUGIN_ID, url=link, listitem=list_item, isFolder=folder)
+    return link, list_item, folder
 
 
 def update_watch_later_video(video_url: str, action: str = "add") -> None:
@@ -1168,6 +1568,7 @@ def update_watch_later_video(video_url: str, action: str = "add") -> None:
         - Sends a request to Rumble's API to update the playlist.
         - Logs the full response for debugging.
         - Displays a notification to the user based on the outcome.
+        - Updates the cached Watch Later listing in place, see apply_watch_later_locally.
     """
     video_id = extract_playlist_video_id(video_url)
     if not video_id:
@@ -1190,11 +1591,15 @@ def update_watch_later_video(video_url: str, action: str = "add") -> None:
                 video_info = response_data["data"].get("video")
                 if video_info and video_info.get("fid") == int(video_id):
                     message = "Added to Watch Later"
+                    apply_watch_later_locally(video_url, True)
                 else:
                     message = "Error: Video data missing or ID mismatch in response"
             else:
                 # For delete, we simply check that the "data" key exists.
                 message = "Removed from Watch Later"
+                apply_watch_later_locally(video_url, False)
+                # the playlist re-renders from the updated listing cache
+                xbmc.executebuiltin('Container.Refresh')
         else:
             message = "Error: 'data' key not found in API response"
     except Exception as e:
@@ -1244,6 +1649,8 @@ def comments_show(url):
     comments_show('https://rumble.com/v1234-example-video')
     """
 
+    from lib.comments import CommentWindow
+
     video_id = get_video_id( url )
 
     if video_id:
@@ -1258,6 +1665,142 @@ def comments_show(url):
     else:
         notify( "Cannot find comments", "Comments" )
 
+
+def live_chat_url(url: str) -> Optional[str]:
+    """
+    Get the video whose live chat to show for a live entry.
+
+    Args:
+        url (str): A live video URL, or the URL of a channel that is live (from the Following listing).
+
+    Returns:
+        Optional[str]: The video URL, the channel's first live video for channel URLs, None when
+        the channel has no live video.
+    """
+    from lib.feed import channel_videos_url
+
+    if VIDEO_URL_PATTERN.search(url):
+        return url
+    path = url[len(BASE_URL):] if url.startswith(BASE_URL) else url
+    for card in parse_cards(request_get(channel_videos_url(path), max_age=0), 'channel_video'):
+        if card.live:
+            return card.url
+    return None
+
+
+def live_chat_show(url: str) -> None:
+    """
+    Show the live chat of a live stream in the comments window, appending messages as they arrive.
+
+    Args:
+        url (str): The live video URL, or a live channel's URL.
+
+    Returns:
+        None
+    """
+    from lib.comments import CommentWindow
+    from lib.livechat import LiveChat
+
+    video_url = live_chat_url(url)
+    video_id = get_video_id(video_url) if video_url else None
+
+    if video_id:
+        win = CommentWindow(
+            'addon-rumble-comments.xml',
+            ADDON.getAddonInfo('path'),
+            'default',
+            video_id=video_id,
+            live_chat=LiveChat(video_id)
+        )
+        win.doModal()
+        del win
+    else:
+        notify( "Cannot find the live chat", "Live Chat" )
+
+# Recorded invocations listed per mode by timings_show
+TIMINGS_PER_MODE = 25
+
+MODE_NAMES = {
+    0: 'Home menu', 1: 'Search menu', 2: 'Search', 3: 'Listing', 4: 'Play', 5: 'Add favorite',
+    6: 'Remove favorite', 7: 'Favorites', 8: 'Settings', 9: 'Import favorites', 10: 'Reset session',
+    11: 'Subscribe', 12: 'Watch Later', 13: 'Comments', 14: 'Test login', 15: 'All My Channels',
+    16: 'Live chat',
+}
+
+
+def record_timings() -> None:
+    """
+    Append the phase timings of this invocation to the timing log (lib.timing) when the
+    'Record Phase Timings' setting is on. The diagnostics listing itself is not recorded.
+
+    Returns:
+        None
+    """
+    if not SETTINGS.get_bool(TIMING_SETTING):
+        return
+    params = get_params()
+    mode = int(params.get('mode', 0))
+    if mode == 17:
+        return
+    TIMER.write(
+        mode=mode,
+        cat=urllib.parse.unquote_plus(params.get('cat') or ''),
+        url=urllib.parse.unquote_plus(params.get('url') or ''),
+    )
+
+
+def timings_show(mode: Optional[str] = None, record_id: Optional[str] = None) -> None:
+    """
+    Show the slowest recorded invocations by mode, a hidden diagnostics directory opened from
+    the settings.
+
+    Without a mode it lists the recorded modes. With a mode it lists that mode's slowest
+    invocations, each with its phases in the plot; with a record id as well it shows that
+    invocation's phases and requests in a text viewer.
+
+    Args:
+        mode (str, optional): The plugin mode whose invocations to list.
+        record_id (str, optional): The time of the invocation to show, as '%.6f'.
+
+    Returns:
+        None
+    """
+    records = read_records()
+    slowest = slowest_by_mode(records, TIMINGS_PER_MODE)
+
+    if mode and record_id:
+        for record in slowest.get(int(mode), []):
+            if '%.6f' % record.get('time', 0) == record_id:
+                xbmcgui.Dialog().textviewer(MODE_NAMES.get(int(mode), 'Mode ' + mode), describe(record))
+        return
+
+    items = []
+    if not mode:
+        if not records:
+            notify('Nothing recorded yet, turn on Record Phase Timings in the settings', 'Timings')
+        counts = {}
+        for record in records:
+            recorded_mode = int(record.get('mode', 0))
+            counts[recorded_mode] = counts.get(recorded_mode, 0) + 1
+        for recorded_mode, group in slowest.items():
+            label = '%s: %d recorded, slowest %.0f ms' % (
+                MODE_NAMES.get(recorded_mode, 'Mode %d' % recorded_mode), counts[recorded_mode], group[0].get('total', 0)
+            )
+            items.append(build_dir_item(label, '', 17, {'thumb': 'settings.png'}, {'plot': describe(group[0])}, str(recorded_mode)))
+    else:
+        for record in slowest.get(int(mode), []):
+            label = '%.0f ms  %s  %s' % (
+                record.get('total', 0),
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.get('time', 0))),
+                record.get('cat') or record.get('url') or '',
+            )
+            items.append(build_dir_item(
+                label, '%.6f' % record.get('time', 0), 17, {'thumb': 'settings.png'}, {'plot': describe(record)}, mode, folder=False
+            ))
+
+    add_dir_items(items)
+    xbmcplugin.endOfDirectory(PLUGIN_ID, cacheToDisc=False)
+
 # 📌  main_notes.md 📝 🗑️
 def main():
     """
@@ -1296,6 +1839,9 @@ def main():
     12: Manage playlist
     13: Show video comments
     14: Test login
+    15: Show the merged feed of followed channels
+    16: Show the live chat of a live stream
+    17: Show the slowest recorded invocations (diagnostics, not in the menus)
 
     Note:
     This function assumes the existence of various other functions and global variables
@@ -1368,7 +1914,7 @@ def main():
         else:
             remove_favorite_video(name)
     elif mode == 7:
-        favorites_show()
+        favorites_show(page)
     elif mode == 8:
         ADDON.openSettings()
     elif mode == 9:
@@ -1383,7 +1929,35 @@ def main():
         comments_show(url)
     elif mode == 14:
         login_test()
+    elif mode == 15:
+        feed_show()
+    elif mode == 16:
+        live_chat_show(url)
+    elif mode == 17:
+        timings_show(cat, url)
+
+
+def run():
+    """
+    Runs one plugin invocation: dispatches it with main() and finishes the work it left behind.
+
+    Returns:
+    None
+    """
+    # from the first lib module import until now
+    TIMER.add('import', time.perf_counter() - TIMER.started)
+    try:
+        with TIMER.phase('dispatch'):
+            main()
+    finally:
+        # let background prefetches finish, bounded; unfinished pages go to the service's queue
+        with TIMER.phase('background'):
+            wait_for_background()
+        # write the session cookies back to the settings, only if one changed
+        COOKIES.flush()
+        xbmc.log(f"[Fetch] Requests of this invocation: {request_stats()}", xbmc.LOGDEBUG)
+        record_timings()
 
 
 if __name__ == "__main__":
-    main()
+    run()
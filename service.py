@@ -0,0 +1,150 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 5:21:10 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Module: ............ service.py/run
+Description: ....... Background service of the Rumble Video Kodi Plugin, warming the listings the plugin opens most so they render from local caches instead of waiting on the network.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... plugin.video.rumbleinthejungle/
+Compatibility: ..... XBMC, Kodi 16+, Kodi 21 Omega
+Contact Author: .... lundeen-bryan
+Copyright:  ........ company © 2026. All rights reserved.
+Preconditions: ..... Declared as the xbmc.service extension in addon.xml; must not import main.py (it expects plugin arguments).
+Calls To: .......... lib.scheduler.Scheduler, lib.listing.warm_listing, lib.listing.warm_queued, lib.feed.sync_feed, lib.rumble_user.RumbleUser
+Called By: ......... Kodi at login
+Examples: .......... _
+ (1) Kodi starts the service when the profile is loaded; it runs until Kodi exits.
+Notes: ............. _
+ (1) Jobs refresh the first folder of Subscriptions, Watch Later, Following and the category
+     list into lib.listing.LISTING_CACHE, sync the followed channel feed into lib.feed.FEED_STORE,
+     download the thumbnails and fetch the pages the plugin queued, and keep the
+     login session alive. Intervals sit just under the cache lifetimes the plugin reads them with.
+ (2) Settings and session cookies are read again before each round and the cookies are
+     written back after it only if one changed.
+ (3) Nothing runs while a video is playing, after long idle periods, or when the
+     'background_refresh' setting is off.
+==========================================================================================
+"""
+
+import xbmc
+
+from lib.feed import FEED_CHANNEL_TTL, sync_feed
+from lib.general import COOKIES
+from lib.listing import warm_listing, warm_queued
+from lib.parser import BASE_URL
+from lib.rumble_user import RumbleUser
+from lib.scheduler import Job, Scheduler
+from lib.settings import SETTINGS
+from lib.thumbnails import THUMBNAILS
+
+# Seconds one round of jobs may take before the rest wait for the next round
+SERVICE_BUDGET = 30
+
+# Seconds due jobs are put off while a video is playing
+PLAYING_DELAY = 5 * 60
+
+# Seconds without user input after which the service stops refreshing
+IDLE_PAUSE = 2 * 60 * 60
+
+# Queued thumbnails downloaded per round
+THUMBNAIL_BATCH = 100
+
+
+def logged_in() -> bool:
+    """ if login details are set, re-read on every call so a new login is picked up """
+    return RumbleUser().has_login_details()
+
+
+def refresh_session() -> None:
+    """ logs in again when the session cookie has expired """
+    RumbleUser().has_session()
+
+
+def warm_subscriptions() -> None:
+    """ refreshes the Subscriptions listing """
+    RumbleUser().has_session()
+    warm_listing(BASE_URL + '/subscriptions', 'subscriptions')
+
+
+def warm_watch_later() -> None:
+    """ refreshes the Watch Later listing """
+    RumbleUser().has_session()
+    warm_listing(BASE_URL + '/playlists/watch-later', 'playlist')
+
+
+def warm_followed_channels() -> None:
+    """ refreshes the Following listing and syncs the All My Channels feed """
+    RumbleUser().has_session()
+    warm_listing(BASE_URL + '/followed-channels', 'following', paginated=False)
+    sync_feed(FEED_CHANNEL_TTL // 2)
+
+
+def warm_categories() -> None:
+    """ refreshes the category list """
+    warm_listing(BASE_URL + '/browse', 'cat_list', paginated=False)
+
+
+def download_thumbnails() -> None:
+    """ downloads the thumbnails the plugin queued after rendering listings """
+    THUMBNAILS.drain(THUMBNAIL_BATCH)
+
+
+def warm_unfinished_pages() -> None:
+    """ fetches the next-page prefetches and revalidations the plugin could not finish before it exited """
+    warm_queued()
+
+
+def build_jobs() -> list:
+    """
+    Create the service's jobs.
+
+    Returns:
+        list: The Job objects, login dependent jobs only run while login details are set.
+    """
+    return [
+        Job('session', 30 * 60, refresh_session, enabled=logged_in),
+        Job('subscriptions', 4 * 60, warm_subscriptions, enabled=logged_in),
+        Job('watch_later', 4 * 60, warm_watch_later, enabled=logged_in),
+        Job('followed_channels', 9 * 60, warm_followed_channels, enabled=logged_in),
+        Job('categories', 5 * 60 * 60, warm_categories),
+        Job('thumbnails', 30, download_thumbnails),
+        Job('queued_listings', 20, warm_unfinished_pages),
+    ]
+
+
+def run() -> None:
+    """
+    Run the scheduler until Kodi asks the service to stop.
+
+    Returns:
+        None
+    """
+    monitor = xbmc.Monitor()
+    player = xbmc.Player()
+    scheduler = Scheduler(build_jobs(), budget=SERVICE_BUDGET)
+    xbmc.log('[Service] Started', xbmc.LOGINFO)
+
+    while not monitor.waitForAbort(scheduler.sleep_time()):
+        # pick up settings and cookies changed by the user or the plugin since the last round
+        SETTINGS.reload()
+        if SETTINGS.get('background_refresh') == 'false':
+            scheduler.postpone(PLAYING_DELAY)
+            continue
+        if player.isPlaying() or xbmc.getGlobalIdleTime() > IDLE_PAUSE:
+            scheduler.postpone(PLAYING_DELAY)
+            continue
+        COOKIES.load()
+        scheduler.run_due(monitor.abortRequested)
+        COOKIES.flush()
+
+    xbmc.log('[Service] Stopped', xbmc.LOGINFO)
+
+
+if __name__ == "__main__":
+    run()
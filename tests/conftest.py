@@ -0,0 +1,86 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:02:14 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... conftest.py
+Description: ....... Shared pytest setup: puts the add-on on sys.path and, outside Kodi, installs stand-ins for the xbmc modules with a temporary profile directory.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... requests and six must be installed.
+Examples: .......... _
+ (1) python -m pytest -q tests
+Notes: ............. _
+ (1) The stand-ins accept every call and do nothing, like the ones tools/startup_benchmark.py
+     uses, so only the add-on's own logic is tested.
+ (2) Stores under test are built with a tmp_path database so tests never share state
+     through the profile directory.
+===========================================================================================
+"""
+
+import os
+import sys
+import tempfile
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE = tempfile.mkdtemp(prefix='rumble-tests-')
+
+
+def install_stand_ins(profile: str) -> None:
+    """
+    Install stand-ins for the Kodi modules when they cannot be imported.
+
+    Args:
+        profile (str): The profile directory the stand-in addon reports.
+
+    Returns:
+        None
+    """
+    try:
+        import xbmc  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    class Anything:
+        """ accepts every call and attribute, returns itself """
+        def __init__(self, *args, **kwargs): pass
+        def __call__(self, *args, **kwargs): return Anything()
+        def __getattr__(self, name): return Anything()
+        def __bool__(self): return False
+        def __iter__(self): return iter(())
+        def __str__(self): return ''
+
+    class Addon(Anything):
+        def getAddonInfo(self, key):
+            return {'profile': profile, 'version': '21.0', 'path': ROOT}.get(key, '')
+        def getSetting(self, key): return ''
+        def getLocalizedString(self, string_id): return str(string_id)
+
+    overrides = {
+        'xbmc': {
+            'log': lambda *args, **kwargs: None,
+            'getLocalizedString': lambda string_id: str(string_id),
+            'getInfoLabel': lambda label: '',
+        },
+        'xbmcaddon': {'Addon': Addon},
+        'xbmcvfs': {'translatePath': lambda path: path},
+    }
+    for name in ('xbmc', 'xbmcaddon', 'xbmcgui', 'xbmcplugin', 'xbmcvfs'):
+        module = types.ModuleType(name)
+        module.__getattr__ = lambda attribute: Anything
+        module.__dict__.update(overrides.get(name, {}))
+        sys.modules[name] = module
+
+
+install_stand_ins(PROFILE)
+sys.path.insert(0, ROOT)
@@ -0,0 +1,112 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:33:15 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_cache.py
+Description: ....... Tests of the URL lifetimes, cache keys and least recently used eviction of the response cache in lib/cache.py.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_cache.py
+Notes: ............. _
+ (1) A stepping clock replaces time.time in lib/cache.py so the order entries were used in
+     never depends on the resolution of the system clock.
+===========================================================================================
+"""
+
+import types
+
+import pytest
+
+import lib.cache
+from lib.cache import CachedResponse, ResponseCache, cache_key, cache_ttl
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """ a clock that moves one second per reading """
+    now = [1_000_000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(lib.cache, 'time', types.SimpleNamespace(time=tick))
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path / 'cache.db'), max_bytes=100)
+
+
+def test_cache_ttl():
+    assert cache_ttl('https://rumble.com/browse') == 6 * 60 * 60
+    assert cache_ttl('https://rumble.com/browse/live?page=2') == 2 * 60
+    assert cache_ttl('https://rumble.com/browse/gaming') == 30 * 60
+    assert cache_ttl('https://rumble.com/subscriptions?page=2') == 5 * 60
+    assert cache_ttl('https://rumble.com/v6abc-title.html') == 24 * 60 * 60
+    assert cache_ttl('https://rumble.com/embedJS/u3/?request=video') == 0
+    assert cache_ttl('https://rumble.com/unknown') == 0
+
+
+def test_cache_key_separates_accounts_on_private_pages():
+    assert cache_key('https://rumble.com/browse', 'bob') == 'https://rumble.com/browse'
+    assert cache_key('https://rumble.com/subscriptions', 'bob') == 'https://rumble.com/subscriptions#user=bob'
+    assert cache_key('https://rumble.com/subscriptions', '') != cache_key('https://rumble.com/subscriptions', 'bob')
+
+
+def test_cached_response(clock):
+    response = CachedResponse('u', 'body', '"abc"', 'Mon, 03 Mar 2025 10:00:00 GMT', clock[0])
+    assert response.validators() == {'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon, 03 Mar 2025 10:00:00 GMT'}
+    assert CachedResponse('u', 'body', '', '', 0).validators() == {}
+    assert response.is_fresh(60)
+    assert not response.is_fresh(0)
+
+
+def test_store_and_lookup(cache):
+    assert cache.lookup('a') is None
+    cache.store('a', 'body', etag='"e"')
+    response = cache.lookup('a')
+    assert (response.url, response.body, response.etag, response.last_modified) == ('a', 'body', '"e"', '')
+
+    fetched = response.fetched
+    cache.touch('a')
+    assert cache.lookup('a').fetched > fetched
+
+    cache.invalidate('a')
+    assert cache.lookup('a') is None
+
+
+def test_size_counts_utf8_bytes(cache):
+    cache.store('a', 'é' * 10)
+    assert cache.execute('SELECT size FROM responses WHERE url = ?', ('a',))[0]['size'] == 20
+
+
+def test_evicts_least_recently_used(cache):
+    for url in 'abc':
+        cache.store(url, 'x' * 30)
+    cache.lookup('a')
+
+    # 120 bytes is over the budget of 100, entries go until 90 or less are left
+    cache.store('d', 'x' * 30)
+    assert [url for url in 'abcd' if cache.lookup(url)] == ['a', 'c', 'd']
+
+    cache.store('e', 'x' * 100)
+    assert [url for url in 'acde' if cache.lookup(url)] == []
+
+
+def test_clear(cache):
+    cache.store('a', 'body')
+    cache.clear()
+    assert cache.lookup('a') is None
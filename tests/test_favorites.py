@@ -0,0 +1,105 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:37:52 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_favorites.py
+Description: ....... Tests of the favorites store in lib/favorites.py, including the one time import of favorites.dat.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_favorites.py
+===========================================================================================
+"""
+
+import json
+import types
+
+import pytest
+
+import lib.favorites
+from lib.favorites import Favorite, FavoritesStore
+
+
+def favorite(name: str, url: str = '') -> Favorite:
+    """ a channel favorite """
+    return Favorite(name, url or f"https://rumble.com/c/{name}", 3, 'thumb.jpg', 'fanart.jpg', 'plot', 'channel', 'True', 'False')
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """ a clock that moves one second per reading, so every favorite has its own added time """
+    now = [1_000_000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(lib.favorites, 'time', types.SimpleNamespace(time=tick))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FavoritesStore(str(tmp_path / 'favorites.db'))
+
+
+def test_add_contains_remove(store):
+    store.add(favorite('Alpha'))
+    store.add(favorite('Beta'))
+    assert store.contains('Alpha')
+    assert store.names() == {'Alpha', 'Beta'}
+
+    store.remove(name='Alpha')
+    store.remove(url='https://rumble.com/c/Beta')
+    store.remove()
+    assert store.count() == 0
+
+
+def test_same_url_replaces(store):
+    store.add(favorite('Old name', 'https://rumble.com/c/x'))
+    store.add(favorite('New name', 'https://rumble.com/c/x'))
+    assert store.names() == {'New name'}
+
+
+def test_page_sort_orders(store):
+    for name in ('charlie', 'Alpha', 'bravo'):
+        store.add(favorite(name))
+
+    assert [f.name for f in store.page(sort='0')] == ['charlie', 'Alpha', 'bravo']
+    assert [f.name for f in store.page(sort='1')] == ['Alpha', 'bravo', 'charlie']
+    assert [f.name for f in store.page(offset=1, limit=1, sort='1')] == ['bravo']
+    assert [f.name for f in store.page(sort='unknown')] == ['charlie', 'Alpha', 'bravo']
+    assert store.page()[0] == favorite('charlie')
+
+
+def test_legacy_file_is_imported_once(tmp_path):
+    legacy = tmp_path / 'favorites.dat'
+    rows = [list(favorite(name)) for name in ('Zulu', 'Alpha')]
+    legacy.write_text(json.dumps(rows), encoding='utf-8')
+
+    store = FavoritesStore(str(tmp_path / 'favorites.db'), str(legacy))
+    assert [f.name for f in store.page()] == ['Zulu', 'Alpha']
+    assert not legacy.exists()
+    assert (tmp_path / 'favorites.dat.migrated').exists()
+
+    store.remove(name='Zulu')
+    reopened = FavoritesStore(str(tmp_path / 'favorites.db'), str(legacy))
+    assert reopened.names() == {'Alpha'}
+
+
+def test_unreadable_legacy_file_is_kept(tmp_path):
+    legacy = tmp_path / 'favorites.dat'
+    legacy.write_text('[["only a name"]]', encoding='utf-8')
+
+    store = FavoritesStore(str(tmp_path / 'favorites.db'), str(legacy))
+    assert store.count() == 0
+    assert legacy.exists()
@@ -0,0 +1,101 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:42:30 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_feed.py
+Description: ....... Tests of the channel watermarks and pruning of the subscriptions feed in lib/feed.py.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_feed.py
+Notes: ............. _
+ (1) new_channel_videos is given its cards through a stand-in for parse_cards, the channel
+     page layout itself is covered by tests/test_parser.py.
+===========================================================================================
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+import lib.feed
+from lib.cards import VideoCard
+from lib.feed import FeedStore, Watermark, new_channel_videos
+
+
+def video(channel: str, hour: int) -> VideoCard:
+    """ a video of a channel uploaded at the given hour of 2025-03-10 """
+    return VideoCard(
+        f"https://rumble.com/v{channel}{hour}.html", hour, f"{channel} {hour}", channel, f"/c/{channel}",
+        datetime(2025, 3, 10, hour, tzinfo=timezone.utc), 60, '', False, False, False,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeedStore(str(tmp_path / 'feed.db'))
+
+
+@pytest.fixture
+def page(monkeypatch):
+    """ sets the cards the channel page parses to """
+    cards = []
+    monkeypatch.setattr(lib.feed, 'parse_cards', lambda html_data, listing_type: iter(cards))
+    return cards
+
+
+def test_first_sync_takes_the_whole_page(page):
+    page.extend([video('a', 3), video('a', 2)])
+    assert new_channel_videos('html', None, set()) == page
+
+
+def test_scan_stops_at_the_watermark(page):
+    page.extend([video('a', 5), video('a', 4), video('a', 3), video('a', 2)])
+    mark = Watermark('/c/a', video('a', 3).url, video('a', 3).published.timestamp(), 0)
+    assert new_channel_videos('html', mark, set()) == page[:2]
+    assert new_channel_videos('html', None, {video('a', 4).url}) == page[:1]
+
+
+def test_older_first_video_is_taken_as_pinned(page):
+    page.extend([video('a', 1), video('a', 5), video('a', 2)])
+    mark = Watermark('/c/a', video('a', 3).url, video('a', 3).published.timestamp(), 0)
+    assert new_channel_videos('html', mark, set()) == [video('a', 5)]
+
+
+def test_add_moves_the_watermark_forward_only(store):
+    assert store.watermark('/c/a') is None
+    store.add('/c/a', [video('a', 2), video('a', 4)])
+    assert store.watermark('/c/a').video_url == video('a', 4).url
+
+    store.add('/c/a', [video('a', 1)])
+    assert store.watermark('/c/a').video_url == video('a', 4).url
+    assert store.known_urls('/c/a') == {video('a', hour).url for hour in (1, 2, 4)}
+    assert store.stale(['/c/a', '/c/b'], 60) == ['/c/b']
+
+
+def test_newest_merges_channels(store):
+    store.add('/c/a', [video('a', 1), video('a', 3)])
+    store.add('/c/b', [video('b', 2)])
+    assert [card.title for card in store.newest(['/c/a', '/c/b'], 10)] == ['a 3', 'b 2', 'a 1']
+    assert [card.title for card in store.newest(['/c/b'], 10)] == ['b 2']
+
+
+def test_prune_keeps_each_channels_newest(store, monkeypatch):
+    monkeypatch.setattr(lib.feed, 'FEED_MAX_ROWS', 3)
+    monkeypatch.setattr(lib.feed, 'FEED_CHANNEL_MIN_ROWS', 1)
+    store.add('/c/quiet', [video('quiet', 1)])
+    store.add('/c/busy', [video('busy', hour) for hour in range(5, 10)])
+
+    # the three newest overall stay, and the quiet channel's only video past the cap
+    assert store.known_urls('/c/busy') == {video('busy', hour).url for hour in (7, 8, 9)}
+    assert store.known_urls('/c/quiet') == {video('quiet', 1).url}
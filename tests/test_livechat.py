@@ -0,0 +1,82 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:28:39 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_livechat.py
+Description: ....... Tests of the event stream parser and message buffer in lib/livechat.py.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_livechat.py
+Notes: ............. _
+ (1) The client's connection and reconnects are checked by tools/livechat_check.py.
+===========================================================================================
+"""
+
+import json
+
+from lib.livechat import ChatEvent, ChatMessage, LiveChat, chat_messages, parse_events
+
+
+def chat_data(numbers) -> str:
+    """ the JSON data of a 'messages' event """
+    return json.dumps({
+        'type': 'messages',
+        'data': {
+            'messages': [{'id': str(number), 'user_id': 7, 'text': f"message {number}", 'time': 't'} for number in numbers],
+            'users': [{'id': 7, 'username': 'viewer'}],
+        },
+    })
+
+
+def test_parse_events():
+    lines = [
+        ': keep-alive', '',
+        'id: e1', 'event: init', 'data: {"a":', 'data: 1}', '',
+        'data:no space', '',
+        'retry: 250', '',
+        'event: empty', '',
+        'retry: soon', 'data: x', '',
+    ]
+    assert list(parse_events(lines)) == [
+        ChatEvent('init', '{"a":\n1}', 'e1', None),
+        ChatEvent('message', 'no space', 'e1', None),
+        ChatEvent('message', '', 'e1', 0.25),
+        ChatEvent('message', 'x', 'e1', None),
+    ]
+
+
+def test_unfinished_event_is_not_yielded():
+    assert list(parse_events(['data: partial'])) == []
+
+
+def test_chat_messages():
+    assert chat_messages(chat_data([1, 2])) == [
+        ChatMessage('1', 'viewer', 'message 1', 't'),
+        ChatMessage('2', 'viewer', 'message 2', 't'),
+    ]
+    assert chat_messages('not json') == []
+    assert chat_messages('[]') == []
+    assert chat_messages('{"type": "delete_messages"}') == []
+
+
+def test_buffer_drops_repeats_and_oldest():
+    chat = LiveChat('1', maxlen=3)
+    assert chat.add(chat_messages(chat_data([1, 2]))) == 2
+    assert chat.add(chat_messages(chat_data([2, 3, 4]))) == 2
+
+    seq, messages = chat.since(0)
+    assert seq == 4
+    assert [message.id for message in messages] == ['2', '3', '4']
+    assert [message.id for message in chat.since(3)[1]] == ['4']
+    assert chat.wait_since(seq, 0.01) == (4, [])
@@ -0,0 +1,117 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:12:26 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_m3u8.py
+Description: ....... Tests of the HLS playlist parser in lib/m3u8.py with master and media playlists.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_m3u8.py
+===========================================================================================
+"""
+
+from lib.m3u8 import M3U8Processor, parse_attributes, parse_playlist
+
+MASTER = '''#EXTM3U
+#EXT-X-VERSION:4
+#EXT-X-INDEPENDENT-SEGMENTS
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aac",NAME="English",LANGUAGE="en",DEFAULT=YES,AUTOSELECT=YES,URI="audio/en.m3u8"
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aac",NAME="Deutsch",LANGUAGE="de",URI="audio/de.m3u8"
+#EXT-X-STREAM-INF:BANDWIDTH=96000,CODECS="mp4a.40.2"
+audio.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=1200000,AVERAGE-BANDWIDTH=1000000,RESOLUTION=854x480,CODECS="avc1.4d401f,mp4a.40.2",AUDIO="aac"
+480/index.m3u8
+# a comment between tags
+#EXT-X-STREAM-INF:BANDWIDTH=4500000,RESOLUTION=1920x1080,FRAME-RATE=29.970,CODECS="avc1.640028,mp4a.40.2",AUDIO="aac"
+https://cdn.example/1080/index.m3u8
+#EXT-X-I-FRAME-STREAM-INF:BANDWIDTH=200000,RESOLUTION=854x480,URI="480/iframes.m3u8"
+'''
+
+MEDIA = '''#EXTM3U
+#EXT-X-TARGETDURATION:6
+#EXT-X-MEDIA-SEQUENCE:40
+#EXTINF:6.000,first
+seg40.ts
+#EXT-X-UNKNOWN-TAG:1
+#EXTINF:5.5,
+seg41.ts
+#EXT-X-DISCONTINUITY
+#EXTINF:2.5,
+seg42.ts
+'''
+
+
+def test_parse_attributes():
+    assert parse_attributes('BANDWIDTH=1000,CODECS="avc1.4d401f,mp4a.40.2",NAME="a=b"') == {
+        'BANDWIDTH': '1000', 'CODECS': 'avc1.4d401f,mp4a.40.2', 'NAME': 'a=b',
+    }
+
+
+def test_master_playlist():
+    playlist = parse_playlist(MASTER, 'https://rumble.example/live/master.m3u8')
+
+    assert playlist.is_master and not playlist.is_live
+    assert playlist.version == 4 and playlist.independent_segments
+    assert [v.uri for v in playlist.variants] == [
+        'https://rumble.example/live/audio.m3u8',
+        'https://rumble.example/live/480/index.m3u8',
+        'https://cdn.example/1080/index.m3u8',
+    ]
+    audio, sd, hd = playlist.variants
+    assert audio.audio_only and not sd.audio_only
+    assert (sd.width, sd.height, sd.bitrate, sd.audio) == (854, 480, 1000, 'aac')
+    assert (hd.bitrate, hd.frame_rate) == (4500, 29.97)
+    assert playlist.iframe_variants[0].uri == 'https://rumble.example/live/480/iframes.m3u8'
+    assert playlist.iframe_variants[0].iframe
+
+
+def test_sorted_variants_put_audio_only_last():
+    playlist = parse_playlist(MASTER)
+    assert [v.height for v in playlist.sorted_variants()] == [1080, 480, 0]
+
+
+def test_media_group():
+    english, german = parse_playlist(MASTER).media_group('aac')
+    assert (english.language, english.default, english.autoselect, english.uri) == ('en', True, True, 'audio/en.m3u8')
+    assert (german.language, german.default) == ('de', False)
+    assert parse_playlist(MASTER).media_group('aac', 'SUBTITLES') == []
+
+
+def test_media_playlist():
+    playlist = parse_playlist(MEDIA)
+
+    assert not playlist.is_master and playlist.is_live
+    assert (playlist.target_duration, playlist.media_sequence) == (6, 40)
+    assert [(s.uri, s.sequence) for s in playlist.segments] == [('seg40.ts', 40), ('seg41.ts', 41), ('seg42.ts', 42)]
+    assert playlist.segments[0].title == 'first'
+    assert [s.discontinuity for s in playlist.segments] == [False, False, True]
+    assert playlist.duration == 14.0
+
+
+def test_finished_media_playlist_is_not_live():
+    assert not parse_playlist(MEDIA + '#EXT-X-ENDLIST\n').is_live
+    assert not parse_playlist('#EXT-X-PLAYLIST-TYPE:VOD\n' + MEDIA).is_live
+
+
+def test_empty_playlist():
+    playlist = parse_playlist('')
+    assert playlist.variants == [] and playlist.segments == []
+    assert parse_playlist(None).segments == []
+
+
+def test_processor_pairs():
+    assert M3U8Processor().process(MASTER) == [
+        ('1080', 'https://cdn.example/1080/index.m3u8'),
+        ('480', '480/index.m3u8'),
+    ]
@@ -0,0 +1,144 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:18:03 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_manifest.py
+Description: ....... Tests of the stream manifest model and its cache in lib/manifest.py.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_manifest.py
+===========================================================================================
+"""
+
+import json
+import time
+
+import pytest
+
+from lib.manifest import ManifestCache, Rendition, StreamManifest, url_expiry
+
+
+def api_response(expires=None, live=0) -> dict:
+    """ an embedJS response with two heights in mp4 and webm and an HLS playlist """
+    query = f"?expires={int(expires)}" if expires else ''
+    return {
+        'ua': {
+            'mp4': {
+                '360': {'url': f"https://cdn.example/v-360.mp4{query}", 'meta': {'h': 360, 'w': 640, 'bitrate': 800}},
+                '720': {'url': f"https://cdn.example/v-720.mp4{query}", 'meta': {'h': 720, 'w': 1280, 'bitrate': 2500}},
+            },
+            'webm': {
+                '720': {'url': f"https://cdn.example/v-720.webm{query}", 'meta': {'h': 720, 'bitrate': 2000}},
+                '1080': {'url': f"https://cdn.example/v-1080.webm{query}", 'meta': {}},
+            },
+            'hls': {
+                'auto': {'url': f"https://cdn.example/v.m3u8{query}"},
+                'broken': 'not a dict',
+            },
+        },
+        'u': {'mp4': {'url': f"https://cdn.example/v-360.mp4{query}"}},
+        'live': live,
+        'duration': '125.7',
+        'title': 'A video',
+        'i': 'https://i.rmbl.ws/v.jpg',
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ManifestCache(str(tmp_path / 'cache.db'))
+
+
+def test_url_expiry():
+    assert url_expiry('https://cdn.example/x.mp4?expires=1760000000&sig=abc') == 1760000000.0
+    assert url_expiry('https://cdn.example/x.mp4?e=42') == 42.0
+    assert url_expiry('https://cdn.example/x.mp4?expires=soon') is None
+    assert url_expiry('https://cdn.example/x.mp4') is None
+
+
+def test_from_dict():
+    manifest = StreamManifest.from_dict(api_response(), 'v1')
+
+    assert (manifest.video_id, manifest.title, manifest.thumb, manifest.duration) == ('v1', 'A video', 'https://i.rmbl.ws/v.jpg', 125)
+    assert len(manifest.renditions) == 5
+    assert manifest.renditions[0] == Rendition('mp4', '360', 'https://cdn.example/v-360.mp4', 360, 640, 800)
+    assert [r for r in manifest.renditions if r.container == 'webm'][1].height == 1080
+
+
+def test_from_json_rejects_non_objects():
+    assert StreamManifest.from_json('', 'v1') is None
+    assert StreamManifest.from_json('not json', 'v1') is None
+    assert StreamManifest.from_json('[1, 2]', 'v1') is None
+    assert StreamManifest.from_json(json.dumps(api_response()), 'v1').renditions
+
+
+def test_progressive_prefers_mp4_at_the_same_height():
+    manifest = StreamManifest.from_dict(api_response(), 'v1')
+    assert [(r.height, r.container) for r in manifest.progressive()] == [(1080, 'webm'), (720, 'mp4'), (360, 'mp4')]
+    assert manifest.hls().url == 'https://cdn.example/v.m3u8'
+    assert manifest.playable()[-1].is_hls
+
+
+def test_describe():
+    assert Rendition('mp4', '720', 'u', 720, bitrate=2500).describe() == '720p - 2500 kbps (MP4)'
+    assert Rendition('hls', 'auto', 'u.m3u8').describe() == 'Auto (HLS)'
+
+
+def test_any_live_value_is_live():
+    assert StreamManifest.from_dict(api_response(live=2), 'v1').is_live
+    assert not StreamManifest.from_dict(api_response(), 'v1').is_live
+
+
+def test_expiry():
+    soon = time.time() + 30
+    manifest = StreamManifest.from_dict(api_response(expires=soon), 'v1')
+    assert manifest.expires == int(soon)
+    assert manifest.is_expired(margin=60)
+    assert not manifest.is_expired(margin=0)
+    assert not StreamManifest.from_dict(api_response(), 'v1').is_expired()
+
+
+def test_cache_round_trip(cache):
+    manifest = StreamManifest.from_dict(api_response(), 'v1')
+    cache.put(manifest, 600)
+    assert cache.get('v1') == manifest
+    cache.invalidate('v1')
+    assert cache.get('v1') is None
+
+
+def test_cache_skips_live_and_empty_manifests(cache):
+    cache.put(StreamManifest.from_dict(api_response(live=1), 'live'), 600)
+    cache.put(StreamManifest('empty'), 600)
+    cache.put(StreamManifest.from_dict(api_response(), 'no-ttl'), 0)
+    assert cache.get('live') is None
+    assert cache.get('empty') is None
+    assert cache.get('no-ttl') is None
+
+
+def test_cache_ends_before_the_urls_expire(cache):
+    cache.put(StreamManifest.from_dict(api_response(expires=time.time() + 3600), 'signed'), 86400)
+    expires = cache.execute('SELECT expires FROM manifests WHERE video_id = ?', ('signed',))[0]['expires']
+    assert expires <= time.time() + 3600 - 60
+
+    cache.put(StreamManifest.from_dict(api_response(expires=time.time() + 30), 'expiring'), 86400)
+    assert cache.get('expiring') is None
+
+
+def test_cache_drops_unreadable_entries(cache):
+    cache.execute(
+        'INSERT INTO manifests (video_id, manifest, expires) VALUES (?, ?, ?)',
+        ('bad', '{"video_id": "bad"}', time.time() + 600)
+    )
+    assert cache.get('bad') is None
+    assert cache.execute('SELECT * FROM manifests') == []
@@ -0,0 +1,160 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:05:40 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_parser.py
+Description: ....... Tests of the single-pass listing and comment scanners in lib/parser.py against small hand-written pages.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_parser.py
+===========================================================================================
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from lib.cards import CategoryCard, ChannelCard, VideoCard
+from lib.parser import CardScanner, parse_cards, scan_comments
+
+
+def grid_card(number: int, live: bool = False) -> str:
+    """ one card of the thumbnail grid layout """
+    return (
+        f'<div class="videostream thumbnail__grid--item" data-video-id="{1000 + number}">'
+        f'<a class="videostream__link link" draggable="false" href="/v{number}abc-title-{number}.html">'
+        f'<div class="videostream__thumbnail"><img class="thumbnail__image" draggable="false" src="https://i.rmbl.ws/t{number}.jpg" alt="x"></div>'
+        f'<div class="videostream__status videostream__status--duration" >1:02:03</div>'
+        + ('<div class="videostream__status--live">LIVE</div>' if live else '') +
+        f'</a><div class="videostream__footer"><h3 class="thumbnail__title" title="T">Title &amp; {number}</h3>'
+        f'<h3 class="thumbnail__title">Second title</h3>'
+        f'<a rel="author" class="channel__link link channel__link--x" href="/c/Chan{number}" >'
+        f'<span class="channel__name align-middle" title="Chan">Chan{number}</span>'
+        f' <svg class=channel__verified></svg></a>'
+        f'<time class="videostream__data--subitem videostream__time" datetime="2025-03-10T12:30:00-04:00">x</time></div></div>\n'
+    )
+
+
+def grid_page(count: int, live=()) -> str:
+    """ a grid listing page with count cards, a card outside the grid and a paginator """
+    return (
+        '<html><body>' + grid_card(99) +
+        '<ol class="thumbnail__grid">' + ''.join(grid_card(number, number in live) for number in range(count)) +
+        '</ol><nav class="paginator"></nav></body></html>'
+    )
+
+
+def comment(number: int, replies: str = '') -> str:
+    """ one comment of a comment.list response, with optional nested replies """
+    return (
+        f'<li class="comment-item"><div class="comments-meta">'
+        f'<a class="comments-meta-author" href="/user/u{number}">User {number}</a>'
+        f"<a class='comments-meta-post-time' href='#comment-{number}' title='Monday, March 3, 2025 10:05 AM -0500'>{number} hours ago</a>"
+        f'</div><p class="comment-text">Hello &amp; <a href="x">link</a><br>line {number}</p>{replies}</li>'
+    )
+
+
+def test_grid_cards():
+    cards = list(parse_cards(grid_page(3, live=(1,)), 'cat_video'))
+
+    assert [card.video_id for card in cards] == [1000, 1001, 1002]
+    first = cards[0]
+    assert isinstance(first, VideoCard)
+    assert first.url == 'https://rumble.com/v0abc-title-0.html'
+    assert first.title == 'Title & 0'
+    assert first.channel == 'Chan0'
+    assert first.channel_url == '/c/Chan0'
+    assert first.thumb == 'https://i.rmbl.ws/t0.jpg'
+    assert first.duration == 3723
+    assert first.verified
+    assert first.published == datetime(2025, 3, 10, 12, 30, tzinfo=timezone(timedelta(hours=-4)))
+    assert [card.live for card in cards] == [False, True, False]
+
+
+def test_first_field_occurrence_wins():
+    cards = list(parse_cards(grid_page(1), 'cat_video'))
+    assert cards[0].title == 'Title & 0'
+
+
+def test_cards_outside_the_section_are_ignored():
+    cards = list(parse_cards(grid_page(2), 'cat_video'))
+    assert 99 + 1000 not in [card.video_id for card in cards]
+
+
+def test_empty_page():
+    assert list(parse_cards('', 'cat_video')) == []
+    assert list(parse_cards('<html></html>', 'cat_video')) == []
+
+
+def test_category_list():
+    html_data = ''.join(
+        f'<a class="category__link link" href="/category/c{number}" >'
+        f'<img class="category__image" src="https://i/c{number}.png" alt="c"> '
+        f'<strong class="category__title">Cat {number}</strong>'
+        for number in range(2)
+    )
+    assert list(parse_cards(html_data, 'cat_list')) == [
+        CategoryCard('https://rumble.com/category/c0/videos', 'Cat 0', 'https://i/c0.png'),
+        CategoryCard('https://rumble.com/category/c1/videos', 'Cat 1', 'https://i/c1.png'),
+    ]
+
+
+def test_followed_channels():
+    html_data = (
+        '<ol class="followed-channels__list">'
+        '<li class="followed-channel flex items-center"><a class="followed-channel__link" href="/c/Alpha" >'
+        '<img class="channel__avatar channel__live" src="https://i.rmbl.ws/a.jpg">'
+        '<span class="line-clamp-2">Alpha</span><use href="#channel_verified" />'
+        '<div class="followed-channel__followers text-x">1.2K followers</div></a></li>'
+        '<li class="followed-channel flex items-center"><a class="followed-channel__link" href="/user/beta" >'
+        '<span class="channel__avatar channel__letter">B</span>'
+        '<span class="line-clamp-2">Beta</span>'
+        '<div class="followed-channel__followers text-x">10 followers</div></a></li>'
+        '</ol>'
+    )
+    alpha, beta = parse_cards(html_data, 'following')
+    assert isinstance(alpha, ChannelCard)
+    assert (alpha.path, alpha.title, alpha.thumb, alpha.followers) == ('/c/Alpha', 'Alpha', 'https://i.rmbl.ws/a.jpg', '1.2K followers')
+    assert alpha.verified and alpha.live and alpha.subscribed
+    assert (beta.path, beta.thumb, beta.verified, beta.live) == ('/user/beta', '', False, False)
+
+
+def test_card_scanner_bounds():
+    scanner = CardScanner('<li', (r'<b>(?P<name>[^<]*)</b>',), (r'<ul>', '</ul>'))
+    html_data = '<li><b>outside</b><ul><li><b>one</b><b>ignored</b><li><i>none</i><li><b>three</b></ul><li><b>after</b>'
+    assert list(scanner.scan(html_data)) == [{'name': 'one'}, {}, {'name': 'three'}]
+    assert list(scanner.scan('<li><b>no section</b>')) == []
+
+
+def test_comment_threads():
+    html_data = (
+        '<ul class="comments-1">'
+        + comment(1, '<ul class="comments-2">' + comment(2, '<ul>' + comment(3) + '</ul>') + comment(4) + '</ul>')
+        + comment(5) +
+        '</ul>'
+    )
+    comments = list(scan_comments(html_data))
+
+    assert [(c['comment_id'], c['depth'], c['parent_id']) for c in comments] == [
+        ('1', 0, ''), ('2', 1, '1'), ('3', 2, '2'), ('4', 1, '1'), ('5', 0, ''),
+    ]
+    first = comments[0]
+    assert first['author_url'] == '/user/u1'
+    assert first['author_name'] == 'User 1'
+    assert first['comment_text'] == 'Hello & link\nline 1'
+    assert (first['post_month'], first['post_date'], first['post_year']) == ('March', '3', '2025')
+    assert (first['post_hour'], first['post_minute'], first['post_meridiem']) == ('10', '05', 'AM')
+    assert first['post_time_ago'] == '1 hours ago'
+
+
+def test_comment_threads_empty():
+    assert list(scan_comments('')) == []
@@ -0,0 +1,108 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:25:12 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_singleflight.py
+Description: ....... Tests of the request coalescing in lib/singleflight.py with concurrent callers.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_singleflight.py
+===========================================================================================
+"""
+
+import threading
+import time
+
+import pytest
+
+from lib.singleflight import SingleFlight
+
+# Callers started while the first call is held open
+CALLERS = 5
+
+
+def run_concurrently(flight: SingleFlight, key, func):
+    """ starts CALLERS threads on one key while func is held open, returns their results or errors """
+    results = []
+    lock = threading.Lock()
+
+    def call():
+        try:
+            outcome = flight.do(key, func)
+        except Exception as e:
+            outcome = e
+        with lock:
+            results.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_until_coalesced(flight: SingleFlight, timeout: float = 5) -> None:
+    """ waits until every caller has joined the call in flight """
+    deadline = time.monotonic() + timeout
+    while flight.stats()['calls'] < CALLERS and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def fetch():
+        runs.append(1)
+        release.wait(5)
+        return 'page'
+
+    threads, results = run_concurrently(flight, 'url', fetch)
+    wait_until_coalesced(flight)
+    assert flight.in_flight() == 1
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert runs == [1]
+    assert results == ['page'] * CALLERS
+    assert flight.stats() == {'calls': CALLERS, 'coalesced': CALLERS - 1, 'in_flight': 0}
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError('offline')
+
+    threads, results = run_concurrently(flight, 'url', fail)
+    wait_until_coalesced(flight)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == CALLERS
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_calls_after_the_first_finished_run_again():
+    flight = SingleFlight()
+    assert flight.do('url', lambda: 1) == 1
+    assert flight.do('url', lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do('other', lambda: {}['missing'])
+    assert flight.stats() == {'calls': 3, 'coalesced': 0, 'in_flight': 0}
@@ -0,0 +1,88 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 11:21:47 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... test_throughput.py
+Description: ....... Tests of the throughput estimate and rendition choice in lib/throughput.py.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, tests
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... tests/conftest.py
+Examples: .......... _
+ (1) python -m pytest -q tests/test_throughput.py
+===========================================================================================
+"""
+
+import pytest
+
+from lib.manifest import Rendition
+from lib.throughput import (
+    EWMA_WEIGHT, MIN_SAMPLE_BYTES, ThroughputStore, host_of, pick_rendition, rendition_bitrate,
+)
+
+LOW = Rendition('mp4', '360', 'https://cdn.example/360.mp4', 360, bitrate=800)
+MID = Rendition('mp4', '720', 'https://cdn.example/720.mp4', 720)
+HIGH = Rendition('mp4', '1080', 'https://cdn.example/1080.mp4', 1080, bitrate=5000)
+AUTO = Rendition('hls', 'auto', 'https://cdn.example/master.m3u8')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ThroughputStore(str(tmp_path / 'metadata.db'))
+
+
+def test_host_of():
+    assert host_of('https://Hugh.CDN.rumble.cloud/video/x.mp4?e=1') == 'hugh.cdn.rumble.cloud'
+    assert host_of('not a url') == ''
+
+
+def test_rendition_bitrate_falls_back_to_height():
+    assert rendition_bitrate(LOW) == 800
+    assert rendition_bitrate(MID) == 2500
+    assert rendition_bitrate(AUTO) == 300
+
+
+def test_pick_without_estimate():
+    assert pick_rendition([HIGH, MID, LOW, AUTO], None, 0.7) == AUTO
+    assert pick_rendition([HIGH, MID, LOW], None, 0.7) == LOW
+    assert pick_rendition([], 10000, 0.7) is None
+
+
+def test_pick_highest_that_fits():
+    renditions = [HIGH, MID, LOW, AUTO]
+    assert pick_rendition(renditions, 10000, 0.7) == HIGH
+    assert pick_rendition(renditions, 4000, 0.7) == MID
+    assert pick_rendition(renditions, 1200, 0.7) == LOW
+    assert pick_rendition(renditions, 100, 0.7) == LOW
+
+
+def test_pick_only_adaptive():
+    assert pick_rendition([AUTO], 100, 0.7) == AUTO
+
+
+def test_estimate_moving_average(store):
+    url = 'https://cdn.example/v.mp4'
+    assert store.estimate(url) is None
+
+    store.record(url, 1_000_000, 1.0)
+    assert store.estimate(url) == pytest.approx(8000)
+
+    store.record(url, 1_000_000, 2.0)
+    assert store.estimate(url) == pytest.approx(8000 + EWMA_WEIGHT * (4000 - 8000))
+    assert store.estimate('https://other.example/v.mp4') is None
+
+
+def test_small_or_instant_transfers_are_ignored(store):
+    url = 'https://cdn.example/v.mp4'
+    store.record(url, MIN_SAMPLE_BYTES - 1, 0.01)
+    store.record(url, 1_000_000, 0)
+    store.record('/relative/path', 1_000_000, 1.0)
+    assert store.estimate(url) is None
@@ -0,0 +1,228 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 10:12:48 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... livechat_check.py
+Description: ....... Runs the live chat client (lib/livechat.py) against a local stand-in for the chat's event stream and checks history, new messages, the reconnect with Last-Event-ID, a retry sent on its own and stopping.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, development tool
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Run from a checkout of the add-on; requests and six must be installed.
+Examples: .......... _
+ (1) python tools/livechat_check.py
+Notes: ............. _
+ (1) Outside Kodi the xbmc modules do not exist. When they cannot be imported stand-ins that
+     accept every call and do nothing are installed, with a temporary profile directory.
+ (2) The stand-in server sends the history and two messages, then an event with only a
+     'retry' field and closes the connection. The second connection must carry the last
+     event id, come after the short retry delay instead of CHAT_RETRY, and its repeated
+     message must not be shown twice.
+ (3) Prints one line per check and exits with 1 when any failed.
+===========================================================================================
+"""
+
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Reconnect delay the stand-in server sends, in ms
+RETRY_MS = 300
+
+# Seconds to wait for the client before a check fails
+CHECK_TIMEOUT = 5
+
+
+def install_stand_ins(profile: str) -> None:
+    """
+    Install stand-ins for the Kodi modules when they cannot be imported.
+
+    Args:
+        profile (str): The profile directory the stand-in addon reports.
+
+    Returns:
+        None
+    """
+    try:
+        import xbmc  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    class Anything:
+        """ accepts every call and attribute, returns itself """
+        def __init__(self, *args, **kwargs): pass
+        def __call__(self, *args, **kwargs): return Anything()
+        def __getattr__(self, name): return Anything()
+        def __bool__(self): return False
+        def __iter__(self): return iter(())
+        def __str__(self): return ''
+
+    class Addon(Anything):
+        def getAddonInfo(self, key):
+            return {'profile': profile, 'version': '21.0', 'path': ROOT}.get(key, '')
+        def getSetting(self, key): return ''
+
+    overrides = {
+        'xbmcaddon': {'Addon': Addon},
+        'xbmcvfs': {'translatePath': lambda path: path},
+    }
+    for name in ('xbmc', 'xbmcaddon', 'xbmcgui', 'xbmcplugin', 'xbmcvfs'):
+        module = types.ModuleType(name)
+        module.__getattr__ = lambda attribute: Anything
+        module.__dict__.update(overrides.get(name, {}))
+        sys.modules[name] = module
+
+
+def chat_event(name: str, numbers, event_id: str) -> str:
+    """
+    Build one server-sent event carrying chat messages, as the chat endpoint sends them.
+
+    Args:
+        name (str): The event name, 'init' or 'messages'.
+        numbers (Iterable[int]): The message numbers, used for the ids and texts.
+        event_id (str): The event id.
+
+    Returns:
+        str: The event, ending with its blank line.
+    """
+    payload = {
+        'type': name,
+        'data': {
+            'messages': [{'id': str(number), 'user_id': 7, 'text': f"message {number}"} for number in numbers],
+            'users': [{'id': 7, 'username': 'viewer'}],
+        },
+    }
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(payload)}\n\n"
+
+
+class StandInChat(http.server.BaseHTTPRequestHandler):
+
+    """ the chat's event stream: two connections, the first ends with a retry-only event """
+
+    protocol_version = 'HTTP/1.1'
+    connections = []
+    stopping = threading.Event()
+
+    def do_GET( self ):
+
+        """ streams the events of the first or second connection """
+
+        self.connections.append( ( time.monotonic(), self.headers.get( 'Last-Event-ID' ) ) )
+        self.send_response( 200 )
+        self.send_header( 'Content-Type', 'text/event-stream' )
+        self.send_header( 'Transfer-Encoding', 'chunked' )
+        self.end_headers()
+
+        if len( self.connections ) == 1:
+            self.send( ': keep-alive\n\n' )
+            self.send( chat_event( 'init', [ 1, 2, 3 ], 'e3' ) )
+            self.send( chat_event( 'messages', [ 4 ], 'e4' ) )
+            self.send( chat_event( 'messages', [ 5 ], 'e5' ) )
+            self.send( f"retry: {RETRY_MS}\n\n" )
+            self.send( '' )
+            self.close_connection = True
+            return
+
+        # message 5 again, as servers do after a reconnect, then hold the stream open
+        self.send( chat_event( 'messages', [ 5, 6 ], 'e6' ) )
+        while not self.stopping.wait( 0.1 ):
+            pass
+
+    def send( self, text: str ) -> None:
+
+        """ writes one chunk, an empty text ends the body """
+
+        body = text.encode( 'utf-8' )
+        try:
+            self.wfile.write( b'%x\r\n%s\r\n' % ( len( body ), body ) )
+            self.wfile.flush()
+        except OSError:
+            self.close_connection = True
+
+    def log_message( self, *args ):
+
+        """ keeps the output to the checks """
+
+
+def wait_for(condition, timeout: float = CHECK_TIMEOUT) -> bool:
+    """
+    Wait until a condition holds.
+
+    Args:
+        condition (callable): Returns True once the awaited state is reached.
+        timeout (float, optional): The longest time to wait. Defaults to CHECK_TIMEOUT.
+
+    Returns:
+        bool: If the condition held in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def main() -> int:
+    """
+    Run the checks and print their results.
+
+    Returns:
+        int: The exit code, 1 when any check failed.
+    """
+    profile = tempfile.mkdtemp()
+    install_stand_ins(profile)
+    sys.path.insert(0, ROOT)
+    from lib.livechat import CHAT_RETRY, LiveChat
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandInChat)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    template = f"http://127.0.0.1:{server.server_port}/chat/{{chat_id}}/stream"
+
+    chat = LiveChat('1', url_template=template)
+    chat.start()
+    texts = lambda: [message.text for message in chat.since(0)[1]]
+
+    results = []
+    results.append(('history and new messages', wait_for(lambda: len(texts()) >= 5)))
+    results.append(('reconnected', wait_for(lambda: len(StandInChat.connections) >= 2)))
+    results.append(('message after reconnect', wait_for(lambda: 'message 6' in texts())))
+
+    connections = StandInChat.connections
+    results.append(('Last-Event-ID sent', len(connections) >= 2 and connections[1][1] == 'e5'))
+    delay = connections[1][0] - connections[0][0] if len(connections) >= 2 else None
+    results.append((
+        f"retry-only event applied ({delay:.2f} s, default {CHAT_RETRY} s)" if delay is not None else 'retry-only event applied',
+        delay is not None and RETRY_MS / 1000.0 <= delay < CHAT_RETRY
+    ))
+    results.append(('no duplicates, in order', texts() == [f"message {number}" for number in range(1, 7)]))
+
+    started = time.monotonic()
+    chat.stop()
+    results.append(('stopped while the stream is open', time.monotonic() - started < 2))
+    StandInChat.stopping.set()
+    server.shutdown()
+
+    for name, ok in results:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+    return 0 if all(ok for _, ok in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
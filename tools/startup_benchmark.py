@@ -0,0 +1,172 @@
+# Auto updated?
+#   Yes
+# Modified:
+#   Sunday, October 18, 2026 8:52:10 PM PDT
+#
+"""
+The snippet above is from an Ext from TheRepoClub called File Header Generator
+==========================================================================================
+Procedure: ......... startup_benchmark.py
+Description: ....... Measures the startup cost of the plugin per mode: the time to import main.py, the time to dispatch one invocation and the modules it loads, each in a fresh interpreter like Kodi starts one per click.
+Version: ........... 1.0.0 - major.minor.patch
+Created: ........... 2026-10-18
+Updated: ........... 2026-10-18
+Installs to: ....... not installed, development tool
+Compatibility: ..... Python 3.11+
+Contact Author: .... lundeen-bryan
+Copyright:  ........ n/a © 2026. All rights reserved.
+Preconditions: ..... Run from a checkout of the add-on; requests and six must be installed.
+Examples: .......... _
+ (1) python tools/startup_benchmark.py
+ (2) python tools/startup_benchmark.py --runs 20 --modes 0 1 3
+Notes: ............. _
+ (1) Outside Kodi the xbmc modules do not exist. When they cannot be imported the child
+     process installs stand-ins that accept every call and do nothing, with a temporary
+     profile directory, so the numbers are Python's cost without Kodi's.
+ (2) No request leaves the machine: request_get returns an empty page, after creating the
+     requests session so modes that go to the network still pay for importing requests.
+ (3) Each mode runs in a new interpreter RUNS times and the median is shown; 'process' is
+     the wall time of the whole child including interpreter start-up.
+===========================================================================================
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLUGIN_URL = 'plugin://plugin.video.rumbleinthejungle/'
+
+# Modes to time, with the parameters of a typical click
+MODES = {
+    0: ('home menu', {}),
+    1: ('search menu', {}),
+    3: ('listing', {'url': 'https://rumble.com/browse', 'cat': 'cat_list'}),
+    4: ('play', {'url': 'https://rumble.com/v1abc23-video.html', 'name': 'video', 'play': '2'}),
+    7: ('favorites', {}),
+    13: ('comments', {'url': 'https://rumble.com/v1abc23-video.html'}),
+}
+
+# Runs in the child interpreter: argv[1] is the mode's query string, prints one JSON line
+CHILD = r'''
+import json, os, sys, time, types
+
+started = time.perf_counter()
+
+try:
+    import xbmc
+except ImportError:
+    class Anything:
+        """ accepts every call and attribute, returns itself """
+        def __init__(self, *args, **kwargs): pass
+        def __call__(self, *args, **kwargs): return Anything()
+        def __getattr__(self, name): return Anything()
+        def __bool__(self): return False
+        def __iter__(self): return iter(())
+        def __str__(self): return ''
+
+    class Addon(Anything):
+        def getAddonInfo(self, key):
+            return {'profile': os.environ['BENCH_PROFILE'], 'version': '21.0', 'path': '.'}.get(key, '')
+        def getSetting(self, key): return ''
+        def getLocalizedString(self, string_id): return str(string_id)
+
+    overrides = {
+        'xbmcaddon': {'Addon': Addon},
+        'xbmcvfs': {'translatePath': lambda path: path},
+        'xbmc': {'getLocalizedString': lambda string_id: str(string_id), 'getInfoLabel': lambda label: ''},
+    }
+    for name in ('xbmc', 'xbmcaddon', 'xbmcgui', 'xbmcplugin', 'xbmcvfs'):
+        module = types.ModuleType(name)
+        module.__getattr__ = lambda attribute: Anything
+        module.__dict__.update(overrides.get(name, {}))
+        sys.modules[name] = module
+
+sys.argv = [os.environ['BENCH_PLUGIN_URL'], '1', sys.argv[1]]
+sys.path.insert(0, os.environ['BENCH_ROOT'])
+
+before = set(sys.modules)
+import main
+imported = time.perf_counter()
+
+import lib.general
+
+def offline_request(url, *args, **kwargs):
+    lib.general.session()
+    return ''
+
+lib.general._request_get = offline_request
+main.run()
+finished = time.perf_counter()
+
+loaded = set(sys.modules) - before
+print(json.dumps({
+    'import': (imported - started) * 1000,
+    'dispatch': (finished - imported) * 1000,
+    'modules': len(loaded),
+    'requests': 'requests' in loaded,
+}))
+'''
+
+
+def run_mode(mode: int, params: dict, profile: str) -> dict:
+    """
+    Run one invocation of a mode in a fresh interpreter.
+
+    Args:
+        mode (int): The plugin mode.
+        params (dict): The other query parameters.
+        profile (str): The profile directory for the Kodi stand-ins.
+
+    Returns:
+        dict: 'import' and 'dispatch' in ms, 'modules' loaded, if 'requests' was loaded and
+        the child's 'process' wall time in ms.
+    """
+    query = '?' + urlencode(dict(params, mode=mode))
+    env = dict(os.environ, BENCH_ROOT=ROOT, BENCH_PROFILE=profile, BENCH_PLUGIN_URL=PLUGIN_URL)
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, query], env=env, cwd=ROOT, capture_output=True, text=True
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    if output.returncode != 0:
+        raise RuntimeError(f"mode {mode} failed:\n{output.stderr}")
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    result['process'] = elapsed
+    return result
+
+
+def main() -> None:
+    """
+    Time each mode and print a table of medians.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description='Startup cost of the plugin per mode.')
+    parser.add_argument('--runs', type=int, default=7, help='invocations per mode (default 7)')
+    parser.add_argument('--modes', type=int, nargs='*', default=list(MODES), help='modes to time')
+    args = parser.parse_args()
+
+    print(f"{'mode':>4}  {'':<12} {'import ms':>9} {'dispatch ms':>11} {'process ms':>10} {'modules':>7}  requests")
+    with tempfile.TemporaryDirectory() as profile:
+        for mode in args.modes:
+            name, params = MODES.get(mode, ('', {}))
+            runs = [run_mode(mode, params, profile) for _ in range(args.runs)]
+            median = {key: statistics.median(run[key] for run in runs) for key in ('import', 'dispatch', 'process', 'modules')}
+            print(
+                f"{mode:>4}  {name:<12} {median['import']:>9.1f} {median['dispatch']:>11.1f}"
+                f" {median['process']:>10.1f} {median['modules']:>7.0f}  {'yes' if runs[-1]['requests'] else 'no'}"
+            )
+
+
+if __name__ == '__main__':
+    main()